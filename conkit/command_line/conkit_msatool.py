@@ -55,6 +55,12 @@ def main():
     parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument("msafile", help="Multiple Sequence Alignment file")
     parser.add_argument("msaformat", help="Multiple Sequence Alignment format")
+    parser.add_argument(
+        "--fast", dest="fast", default=False, action="store_true", help="Estimate the number of effective sequences"
+    )
+    parser.add_argument(
+        "-e", dest="error", default=0.05, type=float, help="Maximum relative error of the estimate [default: 0.05]"
+    )
     args = parser.parse_args()
 
     global logger
@@ -71,7 +77,11 @@ def main():
     logger.info("Input MSA Format:                          %s", args.msaformat)
     logger.info("Length of the Target Sequence:             %d", msa.top_sequence.seq_len)
     logger.info("Total Number of Sequences:                 %d", msa.nseq)
-    logger.info("Number of Effective Sequences:             %d", msa.meff)
+    if args.fast:
+        meff, lower, upper = msa.estimate_meff(error=args.error)
+        logger.info("Number of Effective Sequences (estimate):  %d (95%% CI: %d-%d)", meff, lower, upper)
+    else:
+        logger.info("Number of Effective Sequences:             %d", msa.meff)
     logger.info("Sequence Coverage Plot:                    %s", plot)
 
 
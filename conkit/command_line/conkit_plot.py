@@ -283,16 +283,14 @@ def main():
         con.set_sequence_register()
         con.remove_neighbors(min_distance=args.dtn, inplace=True)
         ncontacts = int(seq.seq_len * args.dfactor)
-        con.sort("raw_score", reverse=True, inplace=True)
-        con_sliced = con[:ncontacts]
+        con_sliced = con.top_k(ncontacts, "raw_score")
 
         if args.otherfile:
             other = conkit.io.read(args.otherfile, args.otherformat)[0]
             other.sequence = seq
             other.set_sequence_register()
             other.remove_neighbors(min_distance=args.dtn, inplace=True)
-            other.sort("raw_score", reverse=True, inplace=True)
-            other_sliced = other[:ncontacts]
+            other_sliced = other.top_k(ncontacts, "raw_score")
         else:
             other_sliced = None
 
@@ -350,9 +348,8 @@ def main():
         con.sequence = seq
         con.set_sequence_register()
         con.remove_neighbors(min_distance=args.dtn, inplace=True)
-        con.sort("raw_score", reverse=True, inplace=True)
         ncontacts = int(seq.seq_len * args.dfactor)
-        con_sliced = con[:ncontacts]
+        con_sliced = con.top_k(ncontacts, "raw_score")
 
         figure = conkit.plot.ContactMapChordFigure(con_sliced, use_conf=args.confidence, legend=True)
         figure_aspect_ratio = 1.0
@@ -386,9 +383,8 @@ def main():
         con.sequence = seq
         con.set_sequence_register()
         con.remove_neighbors(min_distance=args.dtn, inplace=True)
-        con.sort("raw_score", reverse=True, inplace=True)
         ncontacts = int(seq.seq_len * args.dfactor)
-        con_sliced = con[:ncontacts]
+        con_sliced = con.top_k(ncontacts, "raw_score")
 
         figure = conkit.plot.ContactDensityFigure(con_sliced, bw_method=args.bw_method, legend=True)
         figure_aspect_ratio = 0.3
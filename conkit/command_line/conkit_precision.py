@@ -90,8 +90,7 @@ def main():
 
     con.remove_neighbors(min_distance=args.dtn, inplace=True)
     ncontacts = int(seq.seq_len * args.dfactor)
-    con.sort("raw_score", reverse=True, inplace=True)
-    con_sliced = con[:ncontacts]
+    con_sliced = con.top_k(ncontacts, "raw_score")
 
     con_matched = con_sliced.match(pdb)
     precision = con_matched.precision
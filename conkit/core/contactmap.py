@@ -38,8 +38,9 @@ __date__ = "03 Aug 2016"
 __version__ = "1.0"
 
 import collections
+import copy
 import numpy as np
-import operator
+import os
 import sys
 
 from conkit.core.entity import Entity
@@ -84,18 +85,122 @@ class ContactMap(Entity):
     top_contact : :obj:`~conkit.core.contact.Contact`
        The first :obj:`~conkit.core.contact.Contact` entry
 
+    Note
+    ----
+    A :obj:`~conkit.core.contactmap.ContactMap` created with :meth:`~conkit.core.contactmap.ContactMap.from_arrays`
+    stores its contacts in a columnar :obj:`~conkit.core.contactstore.ContactStore`. Its
+    :obj:`~conkit.core.contact.Contact` instances are lightweight views created on access. Any
+    operation without a columnar implementation, e.g. adding a new contact, converts the map
+    back to individual :obj:`~conkit.core.contact.Contact` instances first.
+
     """
 
-    __slots__ = ["_sequence"]
+    __slots__ = ["_sequence", "_store", "_row_order", "_nremoved"]
 
     def __init__(self, id):
         """Initialise a new contact map"""
         self._sequence = None
+        self._store = None
+        self._rows = None
         super(ContactMap, self).__init__(id)
 
+    def __contains__(self, id):
+        """True if there is a contact with the given id"""
+        if self._store is None:
+            return super(ContactMap, self).__contains__(id)
+        return self._store.find(id) is not None
+
+    def __delitem__(self, id):
+        """Remove a contact with given id"""
+        if self._store is None:
+            return super(ContactMap, self).__delitem__(id)
+        row = self._store.find(id)
+        if row is None:
+            raise KeyError(id)
+        self._store.alive[row] = False
+        self._nremoved += 1
+        view = self._store._views.get(row)
+        if view is not None:
+            view.parent = None
+
+    def __getitem__(self, id):
+        """Return the contact with the given id"""
+        if self._store is None:
+            return super(ContactMap, self).__getitem__(id)
+        elif isinstance(id, slice):
+            return self._columnar_copy(self._rows[np.asarray(Entity._slice_indexes(id, len(self)), dtype=np.int64)], deep=False)
+        elif isinstance(id, int):
+            return self._view(self._rows[id])
+        row = self._store.find(id)
+        if row is None:
+            raise KeyError(id)
+        return self._view(row)
+
+    def __iter__(self):
+        """Iterate over contacts"""
+        if self._store is None:
+            for contact in super(ContactMap, self).__iter__():
+                yield contact
+        else:
+            for row in self._rows.tolist():
+                yield self._view(row)
+
+    def __len__(self):
+        """Return the number of contacts"""
+        if self._store is None:
+            return super(ContactMap, self).__len__()
+        return self._row_order.shape[0] - self._nremoved
+
     def __repr__(self):
         return '{}(id="{}", ncontacts={})'.format(self.__class__.__name__, self.id, self.ncontacts)
 
+    def __reversed__(self):
+        """Reversed list of the contacts"""
+        if self._store is None:
+            for contact in super(ContactMap, self).__reversed__():
+                yield contact
+        else:
+            for row in self._rows[::-1].tolist():
+                yield self._view(row)
+
+    def _get_child_list(self):
+        if self._store is not None:
+            self._materialize()
+        return Entity.child_list.__get__(self, Entity)
+
+    def _set_child_list(self, child_list):
+        Entity.child_list.__set__(self, child_list)
+
+    def _get_child_dict(self):
+        if self._store is not None:
+            self._materialize()
+        return Entity.child_dict.__get__(self, Entity)
+
+    def _set_child_dict(self, child_dict):
+        Entity.child_dict.__set__(self, child_dict)
+
+    # Any direct access to the children converts a columnar map to individual contacts
+    child_list = property(_get_child_list, _set_child_list)
+    child_dict = property(_get_child_dict, _set_child_dict)
+
+    @property
+    def _rows(self):
+        """The store rows of all contacts in order, without any removed ones"""
+        if self._nremoved:
+            self._row_order = self._row_order[self._store.alive[self._row_order]]
+            self._nremoved = 0
+        return self._row_order
+
+    @_rows.setter
+    def _rows(self, rows):
+        self._row_order = rows
+        self._nremoved = 0
+
+    @property
+    def columnar(self):
+        """A boolean status for the columnar storage of contacts"""
+        return self._store is not None
+
     @property
     def coverage(self):
         """The sequence coverage score
@@ -241,7 +346,7 @@ class ContactMap(Entity):
 
         import warnings
 
-        statuses = np.array([c.status for c in self])
+        statuses = self._column("status")
         tp = (statuses == ContactMatchState.true_positive.value).sum()
         fp = (statuses == ContactMatchState.false_positive.value).sum()
         unk = (statuses == ContactMatchState.unknown.value).sum()
@@ -295,7 +400,7 @@ class ContactMap(Entity):
 
         import warnings
 
-        statuses = np.array([c.status for c in self])
+        statuses = self._column("status")
         tp = (statuses == ContactMatchState.true_positive.value).sum()
         fn = (statuses == ContactMatchState.false_negative.value).sum()
         unk = (statuses == ContactMatchState.unknown.value).sum()
@@ -380,17 +485,12 @@ class ContactMap(Entity):
         -------
         :obj:`~conkit.core.contactmap.ContactMap`
 
-        """
-        from conkit.core.ext.c_contactmap import c_singletons
+        See Also
+        --------
+        get_singletons
 
-        X = np.array(self.as_list(), dtype=np.int64)
-        throwables = np.full(X.shape[0], False, dtype=np.bool)
-        c_singletons(X, 2, throwables)
-        singletons = self.deepcopy()
-        for i, contact in enumerate(self):
-            if throwables[i]:
-                singletons.remove(contact.id)
-        return singletons
+        """
+        return self.get_singletons()
 
     @property
     def highest_residue_number(self):
@@ -404,6 +504,8 @@ class ContactMap(Entity):
         """
         if len(self) == 0:
             return None
+        elif self._store is not None:
+            return int(self._store.id[self._rows].max())
         else:
             return max([max(contact.id) for contact in self])
 
@@ -454,6 +556,284 @@ class ContactMap(Entity):
         """
         return self.top
 
+    @property
+    def top(self):
+        """The first :obj:`~conkit.core.contact.Contact` in the :obj:`~conkit.core.contactmap.ContactMap`"""
+        if len(self) > 0:
+            return self[0]
+        else:
+            return None
+
+    @classmethod
+    def from_arrays(cls, id, res1_seq, res2_seq, raw_score, **kwargs):
+        """Create a columnar :obj:`~conkit.core.contactmap.ContactMap` from per-contact arrays
+
+        Parameters
+        ----------
+        id : str
+           A unique identifier
+        res1_seq : list, tuple, :obj:`~numpy.ndarray`
+           The residue sequence numbers of residue 1
+        res2_seq : list, tuple, :obj:`~numpy.ndarray`
+           The residue sequence numbers of residue 2
+        raw_score : list, tuple, :obj:`~numpy.ndarray`
+           The prediction scores
+        **kwargs
+           Any other :obj:`~conkit.core.contact.Contact` attribute, e.g. ``res1_chain`` or ``distance_bound``,
+           given as a single value or one value per contact
+
+        Returns
+        -------
+        :obj:`~conkit.core.contactmap.ContactMap`
+
+        Raises
+        ------
+        :exc:`ValueError`
+           Contact defined twice
+
+        Examples
+        --------
+        >>> from conkit.core.contactmap import ContactMap
+        >>> contact_map = ContactMap.from_arrays("example", [1, 5], [10, 30], [0.333, 0.667])
+        >>> print(contact_map)
+        ContactMap(id="example", ncontacts=2)
+
+        """
+        from conkit.core.contactstore import ContactStore
+
+        contact_map = cls(id)
+        contact_map._attach(ContactStore.from_arrays(res1_seq, res2_seq, raw_score, **kwargs))
+        return contact_map
+
+    def _attach(self, store, rows=None):
+        """Replace all contacts with the rows of a :obj:`~conkit.core.contactstore.ContactStore`"""
+        Entity.child_list.__set__(self, [])
+        Entity.child_dict.__set__(self, {})
+        self._store = store
+        self._rows = np.arange(store.size, dtype=np.int64) if rows is None else rows
+
+    def _columnar_copy(self, rows, deep, share=False):
+        """Create a new columnar :obj:`~conkit.core.contactmap.ContactMap` from selected rows
+
+        With ``share``, the copy uses the same columns as this :obj:`~conkit.core.contactmap.ContactMap`
+        until either one modifies a contact, otherwise the selected rows are copied right away.
+
+        """
+        contact_map = self.__class__(self.id)
+        contact_map._sequence = copy.deepcopy(self._sequence) if deep else self._sequence
+        if share:
+            contact_map._attach(self._store.share(), rows=np.array(rows, dtype=np.int64))
+        else:
+            contact_map._attach(self._store.take(rows))
+        return contact_map
+
+    def _keep(self, mask, inplace=False):
+        """Keep only the contacts selected by a boolean mask in a single pass
+
+        Parameters
+        ----------
+        mask : :obj:`~numpy.ndarray`
+           A boolean value per contact in the current order
+        inplace : bool, optional
+           Replace the saved order of contacts [default: False]
+
+        Returns
+        -------
+        :obj:`~conkit.core.contactmap.ContactMap`
+           The reference to the :obj:`~conkit.core.contactmap.ContactMap`, regardless of inplace
+
+        """
+        return self._take(np.flatnonzero(np.asarray(mask, dtype=np.bool_)), inplace=inplace)
+
+    def _take(self, indexes, inplace=False):
+        """Keep only the contacts at the given positions, in the given order, in a single pass
+
+        Parameters
+        ----------
+        indexes : :obj:`~numpy.ndarray`
+           The positions of the contacts to keep
+        inplace : bool, optional
+           Replace the saved order of contacts [default: False]
+
+        Returns
+        -------
+        :obj:`~conkit.core.contactmap.ContactMap`
+           The reference to the :obj:`~conkit.core.contactmap.ContactMap`, regardless of inplace
+
+        """
+        indexes = np.asarray(indexes, dtype=np.int64)
+        if not inplace and self._store is not None:
+            return self._columnar_copy(self._rows[indexes], deep=True)
+        elif not inplace:
+            contact_map = self.__class__(self.id)
+            contact_map._sequence = copy.deepcopy(self._sequence)
+            child_list = self.child_list
+            for i in indexes.tolist():
+                contact_map.add(child_list[i].copy())
+            return contact_map
+
+        mask = np.zeros(len(self), dtype=np.bool_)
+        mask[indexes] = True
+        if self._store is not None:
+            rows = self._rows[indexes]
+            self.keep(mask)
+            self._rows = rows
+        else:
+            child_list = [self.child_list[i] for i in indexes.tolist()]
+            self.keep(mask)
+            self.child_list[:] = child_list
+        return self
+
+    def _materialize(self):
+        """Convert a columnar :obj:`~conkit.core.contactmap.ContactMap` to individual contacts"""
+        store, rows = self._store, self._rows
+        self._store = self._rows = None
+        contacts = store.to_contacts(rows)
+        for contact in contacts:
+            contact.parent = self
+        Entity.child_list.__set__(self, contacts)
+        Entity.child_dict.__set__(self, {contact.id: contact for contact in contacts})
+
+    def _view(self, row):
+        """Return the :obj:`~conkit.core.contactstore.ContactView` of a row"""
+        view = self._store.view(row)
+        view.parent = self
+        return view
+
+    def _sort(self, kword, reverse):
+        """Sort the :obj:`~conkit.core.contactmap.ContactMap`"""
+        if self._store is None:
+            return super(ContactMap, self)._sort(kword, reverse)
+
+        from conkit.core.contactstore import COLUMN_NAMES
+
+        if kword in COLUMN_NAMES:
+            keys = getattr(self._store, kword)[self._rows]
+        else:
+            contacts = list(self)
+            if any(not hasattr(c, kword) for c in contacts):
+                raise ValueError("Attribute not defined")
+            keys = [getattr(c, kword) for c in contacts]
+
+        def argsort(keys):
+            if isinstance(keys, list):
+                return np.array(sorted(range(len(keys)), key=keys.__getitem__), dtype=np.int64)
+            elif keys.ndim > 1:
+                return np.lexsort(keys.T[::-1])
+            return np.argsort(keys, kind="stable")
+
+        if reverse:
+            # Sorting the reversed keys keeps ties in their original order, like list.sort
+            order = len(keys) - 1 - argsort(keys[::-1])[::-1]
+        else:
+            order = argsort(keys)
+        self._rows = self._rows[order]
+
+    def add(self, entity):
+        """Add a :obj:`~conkit.core.contact.Contact` to the :obj:`~conkit.core.contactmap.ContactMap`
+
+        Parameters
+        ----------
+        entity : :obj:`~conkit.core.contact.Contact`
+
+        """
+        if self._store is not None:
+            self._materialize()
+        super(ContactMap, self).add(entity)
+
+    def keep(self, selection):
+        """Keep only the selected contacts and remove all others at once
+
+        Parameters
+        ----------
+        selection : list, tuple, :obj:`~numpy.ndarray`
+           Either a boolean mask with one value per contact in the current order, or
+           the identifiers of the contacts to keep
+
+        Raises
+        ------
+        :exc:`ValueError`
+           Boolean mask does not match the number of contacts
+
+        """
+        if self._store is None:
+            return super(ContactMap, self).keep(selection)
+        mask = np.asarray(selection)
+        if mask.dtype.kind != "b" or mask.ndim != 1:
+            rows = [self._store.find(id) for id in selection]
+            mask = np.isin(self._rows, [row for row in rows if row is not None])
+        elif mask.shape[0] != len(self):
+            raise ValueError("Boolean mask does not match the number of contacts")
+        for row in self._rows[~mask].tolist():
+            self._store.alive[row] = False
+            view = self._store._views.get(row)
+            if view is not None:
+                view.parent = None
+        self._rows = self._rows[mask]
+
+    def remove_many(self, ids):
+        """Remove multiple contacts at once
+
+        Parameters
+        ----------
+        ids : list, tuple
+           The identifiers of the contacts to remove
+
+        Raises
+        ------
+        :exc:`KeyError`
+           Contact not found
+
+        """
+        if self._store is None:
+            return super(ContactMap, self).remove_many(ids)
+        rows = []
+        for id in ids:
+            row = self._store.find(id)
+            if row is None:
+                raise KeyError(id)
+            rows.append(row)
+        self.keep(~np.isin(self._rows, rows))
+
+    def copy(self):
+        """Create a shallow copy of :obj:`~conkit.core.contactmap.ContactMap`"""
+        if self._store is None:
+            return super(ContactMap, self).copy()
+        return self._columnar_copy(self._rows, deep=False, share=True)
+
+    def deepcopy(self):
+        """Create a deep copy of :obj:`~conkit.core.contactmap.ContactMap`"""
+        if self._store is None:
+            return super(ContactMap, self).deepcopy()
+        return self._columnar_copy(self._rows, deep=True, share=True)
+
+    def _id_keys(self):
+        """The sorted contact ids packed into one :obj:`numpy.int64` key each"""
+        from conkit.core.contactstore import pack_ids
+
+        if self._store is not None:
+            ids = self._store.id[self._rows]
+        else:
+            ids = np.array([c.id for c in self], dtype=np.int64).reshape(-1, 2)
+        return np.sort(pack_ids(ids[:, 0], ids[:, 1]))
+
+    def _column(self, kword):
+        """The values of a :obj:`~conkit.core.contact.Contact` attribute for all contacts as :obj:`~numpy.ndarray`"""
+        if self._store is not None:
+            from conkit.core.contactstore import COLUMN_NAMES
+
+            if kword in COLUMN_NAMES and kword not in ("res1", "res2"):
+                return getattr(self._store, kword)[self._rows]
+        return np.array([getattr(c, kword) for c in self])
+
+    def _set_column(self, kword, values):
+        """Set a :obj:`~conkit.core.contact.Contact` attribute for all contacts"""
+        if self._store is not None:
+            self._store.set_column(kword, values, rows=self._rows)
+        else:
+            for contact, value in zip(self, values):
+                setattr(contact, kword, value)
+
     def _construct_repr_sequence(self, res_seqs):
         """Construct the representative sequence"""
         representative_sequence = ""
@@ -473,7 +853,10 @@ class ContactMap(Entity):
            Use the :attr:`~conkit.core.contact.Contact.res_altloc` positions [default: False]
 
         """
-        if altloc:
+        if self._store is not None:
+            columns = ("res1_altseq", "res2_altseq") if altloc else ("res1_seq", "res2_seq")
+            return np.column_stack([getattr(self._store, c)[self._rows] for c in columns]).tolist()
+        elif altloc:
             return [[c.res1_altseq, c.res2_altseq] for c in self]
         else:
             return [[c.res1_seq, c.res2_seq] for c in self]
@@ -555,17 +938,91 @@ class ContactMap(Entity):
            [doi: 10.1093/bib/bbw106].
 
         """
-        union = len(self) + np.sum([1 for contact in other if contact.id not in self])
+        keys1, keys2 = self._id_keys(), other._id_keys()
+        intersection = np.intersect1d(keys1, keys2, assume_unique=True).shape[0]
+        union = keys1.shape[0] + keys2.shape[0] - intersection
         if union == 0:
             return 1.0
-        intersection = np.sum([1 for contact in self if contact.id in other])
         return float(intersection) / union
 
+    @staticmethod
+    def get_jaccard_matrix(contact_maps, nthreads=None):
+        """Calculate the Jaccard index between all pairs of :obj:`~conkit.core.contactmap.ContactMap` instances
+
+        Parameters
+        ----------
+        contact_maps : list, tuple, :obj:`~conkit.core.contactfile.ContactFile`
+           The :obj:`~conkit.core.contactmap.ContactMap` instances to compare
+        nthreads : int, optional
+           The number of threads [default: all available for more than 16 maps, otherwise 1]
+
+        Returns
+        -------
+        :obj:`~numpy.ndarray`
+           A symmetric N x N matrix with the Jaccard index of every pair
+
+        See Also
+        --------
+        get_jaccard_index
+
+        """
+        from conkit.core.ext.c_contactmap import c_jaccard_matrix
+
+        keys = [contact_map._id_keys() for contact_map in contact_maps]
+        offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([k.shape[0] for k in keys])
+        if nthreads is None:
+            nthreads = (os.cpu_count() or 1) if len(keys) > 16 else 1
+        jaccard = np.zeros((len(keys), len(keys)), dtype=np.float64)
+        c_jaccard_matrix(np.concatenate(keys + [np.zeros(0, dtype=np.int64)]), offsets, jaccard, nthreads)
+        return jaccard
+
     @deprecate("0.11", msg="Use get_contact_density instead.")
     def calculate_kernel_density(self, *args, **kwargs):
         """Calculate the contact density in the contact map using Gaussian kernels"""
         return self.get_contact_density(*args, **kwargs)
 
+    def get_singletons(self, threshold=2):
+        """Find the singleton contact pairs in the current :obj:`~conkit.core.contactmap.ContactMap`
+
+        A :obj:`~conkit.core.contact.Contact` is classified as singleton if no other contact is found
+        within ``threshold`` residues of both its residues.
+
+        Contacts are indexed by sorted keys of their residue pairs, so that only contacts in the
+        neighbouring rows of each contact are counted instead of comparing all pairs of contacts.
+
+        Parameters
+        ----------
+        threshold : int, optional
+           The maximum residue distance in either dimension of a neighbouring contact [default: 2]
+
+        Returns
+        -------
+        :obj:`~conkit.core.contactmap.ContactMap`
+
+        Raises
+        ------
+        :exc:`ValueError`
+           Threshold must not be negative
+
+        """
+        threshold = int(threshold)
+        if threshold < 0:
+            raise ValueError("Threshold must not be negative")
+        res1 = self._column("res1_seq").astype(np.int64)
+        res2 = self._column("res2_seq").astype(np.int64)
+        if res2.shape[0] > 0:
+            # Shift res2 so that every window in this dimension stays within the low 32 bits of a key
+            res2 = res2 - res2.min() + threshold
+        keys = np.sort((res1 << 32) + res2)
+        neighbours = np.zeros(res1.shape[0], dtype=np.int64)
+        for offset in range(-threshold, threshold + 1):
+            row = (res1 + offset) << 32
+            lower = np.searchsorted(keys, row + res2 - threshold, side="left")
+            upper = np.searchsorted(keys, row + res2 + threshold, side="right")
+            neighbours += upper - lower
+        return self._keep(neighbours == 1)
+
     def get_contact_density(self, bw_method="amise"):
         """Calculate the contact density in the contact map using Gaussian kernels
 
@@ -575,6 +1032,11 @@ class ContactMap(Entity):
         value of :math:`\\sigma` is the smaller of the standard deviation of ``X`` or
         the normalized interquartile range.
 
+        Every contact covers all residues from :attr:`~conkit.core.contact.Contact.res1_seq` to
+        :attr:`~conkit.core.contact.Contact.res2_seq`. The per-residue coverage is counted with a
+        difference array and convolved with the Gaussian kernel using a Fast Fourier Transform,
+        which gives the same estimates as a kernel density fit to every covered residue.
+
         Parameters
         ----------
         bw_method : str, optional
@@ -587,29 +1049,37 @@ class ContactMap(Entity):
 
         Raises
         ------
-        :exc:`ImportError`
-           Cannot find scikit-learn package
         :exc:`ValueError`
            Undefined bandwidth method
         :exc:`ValueError`
            :obj:`~conkit.core.contactmap.ContactMap` is empty
 
         """
-        try:
-            import sklearn.neighbors
-        except ImportError as e:
-            raise ImportError(e)
-
         if self.empty:
             raise ValueError("ContactMap is empty")
 
-        x = np.array([i for c in self for i in np.arange(c.res1_seq, c.res2_seq + 1)], dtype=np.int64)[:, np.newaxis]
-        x_fit = np.arange(x.min(), x.max() + 1)[:, np.newaxis]
         from conkit.misc.bandwidth import bandwidth_factory
 
-        bandwidth = bandwidth_factory(bw_method)(x).bw
-        kde = sklearn.neighbors.KernelDensity(bandwidth=bandwidth).fit(x)
-        return np.exp(kde.score_samples(x_fit)).tolist()
+        res1 = self._column("res1_seq").astype(np.int64)
+        res2 = self._column("res2_seq").astype(np.int64)
+        covering = res1 <= res2
+        if not covering.any():
+            raise ValueError("ContactMap does not cover any residues")
+        res1, res2 = res1[covering], res2[covering]
+
+        start = res1.min()
+        nresidues = res2.max() - start + 1
+        coverage = np.cumsum(
+            np.bincount(res1 - start, minlength=nresidues + 1) - np.bincount(res2 - start + 1, minlength=nresidues + 1)
+        )[:nresidues]
+        covered = np.flatnonzero(coverage)
+        bandwidth = bandwidth_factory(bw_method)((covered + start)[:, np.newaxis], weights=coverage[covered]).bw
+
+        offsets = np.arange(-(nresidues - 1), nresidues)
+        kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (bandwidth * np.sqrt(2.0 * np.pi) * coverage.sum())
+        size = 1 << int(3 * nresidues - 3).bit_length()
+        density = np.fft.irfft(np.fft.rfft(coverage, size) * np.fft.rfft(kernel, size), size)
+        return np.maximum(density[nresidues - 1 : 2 * nresidues - 1], 0.0).tolist()
 
     @deprecate("0.11", msg="Use set_scalar_score instead.")
     def calculate_scalar_score(self):
@@ -639,10 +1109,8 @@ class ContactMap(Entity):
            *Elife* **4**, e09248.
 
         """
-        raw_scores = np.array([c.raw_score for c in self])
-        sca_scores = raw_scores / np.mean(raw_scores)
-        for contact, sca_score in zip(self, sca_scores):
-            contact.scalar_score = sca_score
+        raw_scores = self._column("raw_score")
+        self._set_column("scalar_score", raw_scores / np.mean(raw_scores))
 
     def find(self, register, altloc=False, strict=False, inverse=False):
         """Find all contacts with one or both residues in ``register``
@@ -667,18 +1135,14 @@ class ContactMap(Entity):
         """
         if isinstance(register, int):
             register = [register]
-        register = set(register)
-
-        def discard(*args, **kwargs):
-            output = (operator.and_ if strict else operator.or_)(*args, **kwargs)
-            return output if inverse else not output
+        register = np.asarray(list(set(register)), dtype=np.int64)
 
-        contact_map = self.deepcopy()
-        for contactid in self.as_list(altloc=altloc):
-            if discard(contactid[0] in register, contactid[1] in register):
-                contact_map.remove(tuple(contactid))
-
-        return contact_map
+        if altloc:
+            res1_seqs, res2_seqs = self._column("res1_altseq"), self._column("res2_altseq")
+        else:
+            res1_seqs, res2_seqs = self._column("res1_seq"), self._column("res2_seq")
+        found = (np.logical_and if strict else np.logical_or)(np.isin(res1_seqs, register), np.isin(res2_seqs, register))
+        return self._keep(~found if inverse else found)
 
     def match(
         self, other, add_false_negatives=False, match_other=False, remove_unmatched=False, renumber=False, inplace=False
@@ -775,11 +1239,13 @@ class ContactMap(Entity):
 
         contact_map2 = ContactMap._adjust(contact_map2, contact_map2_keymap)
 
-        residues_map2 = np.flatnonzero(np.asarray(contact_map2_full_sequence.seq_ascii) != ord("-")) + 1
+        residues_map2 = set((np.flatnonzero(np.asarray(contact_map2_full_sequence.seq_ascii) != ord("-")) + 1).tolist())
+        # Each res_altseq is unique after reindexing, so alternative ids follow the order of res_altseq
+        altseq_to_seq = {r.res_altseq: r.res_seq for r in contact_map2_keymap}
 
         for contact in contact_map1:
             _id = (contact.res1_seq, contact.res2_seq)
-            _id_alt = tuple(r.res_seq for r in contact_map2_keymap for i in _id if i == r.res_altseq)
+            _id_alt = tuple(altseq_to_seq[i] for i in sorted(_id) if i in altseq_to_seq)
 
             if any(i == Gap.IDENTIFIER for i in _id_alt) and any(j not in residues_map2 for j in _id):
                 contact_map1[_id].status = ContactMatchState.unknown
@@ -878,11 +1344,7 @@ class ContactMap(Entity):
            The reference to the :obj:`~conkit.core.contactmap.ContactMap`, regardless of inplace
 
         """
-        contact_map = self._inplace(inplace)
-        for contactid in contact_map.as_list():
-            if contact_map[tuple(contactid)].false_negative:
-                contact_map.remove(tuple(contactid))
-        return contact_map
+        return self._keep(self._column("status") != ContactMatchState.false_negative.value, inplace=inplace)
 
     def remove_neighbors(self, min_distance=5, max_distance=sys.maxsize, inplace=False):
         """Remove contacts between neighboring residues
@@ -906,13 +1368,8 @@ class ContactMap(Entity):
            The reference to the :obj:`~conkit.core.contactmap.ContactMap`, regardless of inplace
 
         """
-        contact_map = self._inplace(inplace)
-        for contactid in contact_map.as_list():
-            if min_distance <= abs(contactid[1] - contactid[0]) <= max_distance:
-                continue
-            else:
-                contact_map.remove(tuple(contactid))
-        return contact_map
+        distances = np.abs(self._column("res2_seq") - self._column("res1_seq"))
+        return self._keep((distances >= min_distance) & (distances <= max_distance), inplace=inplace)
 
     def filter(self, threshold, filter_by='raw_score', inplace=False):
         """Filter out contacts below selected threshold
@@ -940,12 +1397,8 @@ class ContactMap(Entity):
         if not isinstance(threshold, (int, float)):
             raise TypeError("Score threshold must be an int or float!")
 
-        contact_map = self._inplace(inplace)
-        for contactid in contact_map.as_list():
-            contactid = tuple(contactid)
-            if float(getattr(contact_map[contactid], filter_by)) < threshold:
-                contact_map.remove(contactid)
-        return contact_map
+        values = self._column(filter_by).astype(np.float64)
+        return self._keep(~(values < threshold), inplace=inplace)
 
     def rescale(self, inplace=False):
         """Rescale the raw scores in :obj:`~conkit.core.contactmap.ContactMap`
@@ -963,14 +1416,13 @@ class ContactMap(Entity):
         """
         contact_map = self._inplace(inplace)
 
-        raw_scores = np.array([c.raw_score for c in contact_map])
+        raw_scores = contact_map._column("raw_score")
         norm_raw_scores = normalize(raw_scores)
 
         if np.isnan(norm_raw_scores).all():
             norm_raw_scores = np.where(norm_raw_scores == np.isnan, 0, 1)
 
-        for contact, norm_raw_score in zip(contact_map, norm_raw_scores):
-            contact.raw_score = norm_raw_score
+        contact_map._set_column("raw_score", norm_raw_scores)
 
         return contact_map
 
@@ -1001,6 +1453,49 @@ class ContactMap(Entity):
         contact_map._sort(kword, reverse)
         return contact_map
 
+    def top_k(self, n, by="raw_score", inplace=False):
+        """Select the ``n`` contacts with the highest value of a :obj:`~conkit.core.contact.Contact` attribute
+
+        This is equivalent to sorting the :obj:`~conkit.core.contactmap.ContactMap` in descending order and
+        slicing the first ``n`` contacts, but uses a partial selection instead of sorting all contacts.
+
+        Parameters
+        ----------
+        n : int
+           The number of contacts to select
+        by : str, optional
+           The numeric :obj:`~conkit.core.contact.Contact` attribute to select by [default: raw_score]
+        inplace : bool, optional
+           Replace the saved order of contacts [default: False]
+
+        Returns
+        -------
+        :obj:`~conkit.core.contactmap.ContactMap`
+           The reference to the :obj:`~conkit.core.contactmap.ContactMap`, regardless of inplace
+
+        Raises
+        ------
+        :exc:`ValueError`
+           ``n`` must not be negative
+
+        """
+        if n < 0:
+            raise ValueError("Number of contacts must not be negative")
+        values = self._column(by).astype(np.float64)
+        n = min(int(n), values.shape[0])
+        if n == 0:
+            indexes = np.zeros(0, dtype=np.int64)
+        elif n < values.shape[0]:
+            # Ties at the cut-off are resolved by position to match a stable sort
+            threshold = np.partition(values, values.shape[0] - n)[values.shape[0] - n]
+            above = np.flatnonzero(values > threshold)
+            at = np.flatnonzero(values == threshold)[: n - above.shape[0]]
+            indexes = np.sort(np.concatenate((above, at)))
+            indexes = indexes[np.argsort(-values[indexes], kind="stable")]
+        else:
+            indexes = np.argsort(-values, kind="stable")
+        return self._take(indexes, inplace=inplace)
+
     def to_string(self):
         """Return the :obj:`ContactMap <conkit.core.contactmap.ContactMap>` as :obj:`str`"""
         content = ["%d\t%d\t%.5f" % (c.res1_seq, c.res2_seq, c.raw_score) for c in self]
@@ -1052,6 +1547,16 @@ class ContactMap(Entity):
             if c.id[0] == index or c.id[1] == index:
                 yield c
 
+    @staticmethod
+    def _index_by_id(contact_map):
+        """Index all contacts by both residues of their id property"""
+        index = collections.defaultdict(list)
+        for c in contact_map:
+            index[c.id[0]].append(c)
+            if c.id[1] != c.id[0]:
+                index[c.id[1]].append(c)
+        return index
+
     @staticmethod
     def _insert_states(sequence, keymap):
         """Create a sequence matching keymap including deletions and insertions"""
@@ -1072,10 +1577,11 @@ class ContactMap(Entity):
     @staticmethod
     def _renumber(contact_map, self_keymap, other_keymap):
         """Renumber the contact map based on the mapping of self and other keymaps"""
+        index = ContactMap._index_by_id(contact_map)
         for self_residue, other_residue in zip(self_keymap, other_keymap):
             if isinstance(self_residue, Gap):
                 continue
-            for contact in ContactMap._find_single(contact_map, self_residue.res_seq):
+            for contact in index.get(self_residue.res_seq, ()):
                 # Make sure we check with the ID, which doesn't change
                 if contact.id[0] == self_residue.res_altseq:
                     contact.res1_seq = other_residue.res_seq
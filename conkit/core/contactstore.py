@@ -0,0 +1,506 @@
+# coding=utf-8
+#
+# BSD 3-Clause License
+#
+# Copyright (c) 2016-19, University of Liverpool
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Columnar storage backend for :obj:`~conkit.core.contactmap.ContactMap` instances"""
+
+from __future__ import division
+from __future__ import print_function
+
+__author__ = "Felix Simkovic"
+__date__ = "16 Oct 2026"
+__version__ = "1.0"
+
+import numbers
+import numpy as np
+import weakref
+
+from conkit.core.contact import Contact
+from conkit.core.mappings import ContactMatchState
+
+# Column name, dtype, per-row shape and default value
+COLUMNS = (
+    ("id", np.int64, (2,), 0),
+    ("res1_seq", np.int64, (), 0),
+    ("res2_seq", np.int64, (), 0),
+    ("res1_altseq", np.int64, (), 0),
+    ("res2_altseq", np.int64, (), 0),
+    ("raw_score", np.float64, (), 0.0),
+    ("scalar_score", np.float64, (), 0.0),
+    ("weight", np.float64, (), 1.0),
+    ("status", np.int8, (), ContactMatchState.unknown.value),
+    ("distance_bound", np.float64, (2,), (0.0, 8.0)),
+    ("res1", np.uint8, (), ord("X")),
+    ("res2", np.uint8, (), ord("X")),
+    ("res1_chain", np.str_, (), ""),
+    ("res2_chain", np.str_, (), ""),
+)
+COLUMN_NAMES = tuple(c[0] for c in COLUMNS)
+
+
+def pack_ids(res1, res2):
+    """Pack two residue index arrays into a single :obj:`numpy.int64` key per pair"""
+    res1 = np.asarray(res1, dtype=np.int64)
+    res2 = np.asarray(res2, dtype=np.int64)
+    return (res1 << 32) | (res2 & 0xFFFFFFFF)
+
+
+class ContactStore(object):
+    """Struct-of-arrays storage for contact pairs
+
+    Each attribute of a :obj:`~conkit.core.contact.Contact` is held in a single contiguous
+    :mod:`numpy` array. Rows are never re-ordered or deleted once the store is created, which
+    allows :obj:`~conkit.core.contactstore.ContactView` instances to keep a stable reference to
+    their row. The owning :obj:`~conkit.core.contactmap.ContactMap` keeps track of the order
+    and membership of the rows.
+
+    Stores created with :meth:`~conkit.core.contactstore.ContactStore.share` hold the same column
+    arrays until either side writes to a column, at which point that column is copied.
+
+    Attributes
+    ----------
+    alive : :obj:`~numpy.ndarray`
+       A boolean mask of rows still present in the owning :obj:`~conkit.core.contactmap.ContactMap`
+    size : int
+       The number of rows in the store
+
+    """
+
+    __slots__ = list(COLUMN_NAMES) + ["alive", "size", "_keys", "_keyrows", "_shared", "_views"]
+
+    def __init__(self, size):
+        """Initialise a new store with default values
+
+        Parameters
+        ----------
+        size : int
+           The number of rows to allocate
+
+        """
+        self.size = int(size)
+        for name, dtype, shape, default in COLUMNS:
+            setattr(self, name, np.full((self.size,) + shape, default, dtype=dtype))
+        self.alive = np.ones(self.size, dtype=np.bool_)
+        self._keys = None
+        self._keyrows = None
+        self._shared = set()
+        self._views = weakref.WeakValueDictionary()
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in COLUMN_NAMES + ("alive", "size")}
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return "{}(size={})".format(self.__class__.__name__, self.size)
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._keys = None
+        self._keyrows = None
+        self._shared = set()
+        self._views = weakref.WeakValueDictionary()
+
+    @classmethod
+    def from_arrays(cls, res1_seq, res2_seq, raw_score, **kwargs):
+        """Create a new store from per-contact arrays
+
+        Parameters
+        ----------
+        res1_seq : list, tuple, :obj:`~numpy.ndarray`
+           The residue sequence numbers of residue 1
+        res2_seq : list, tuple, :obj:`~numpy.ndarray`
+           The residue sequence numbers of residue 2
+        raw_score : list, tuple, :obj:`~numpy.ndarray`
+           The prediction scores
+        **kwargs
+           Any other column listed in :data:`~conkit.core.contactstore.COLUMNS`
+
+        Returns
+        -------
+        :obj:`~conkit.core.contactstore.ContactStore`
+
+        Raises
+        ------
+        :exc:`TypeError`
+           Data type int required for res_seq
+        :exc:`ValueError`
+           Unknown column or incorrect column length
+        :exc:`ValueError`
+           Contact defined twice
+
+        """
+        res1_seq = np.asarray(res1_seq)
+        res2_seq = np.asarray(res2_seq)
+        for array in (res1_seq, res2_seq):
+            if array.size > 0 and not np.issubdtype(array.dtype, np.integer):
+                raise TypeError("Data type int required for res_seq")
+
+        store = cls(res1_seq.shape[0])
+        kwargs.update({"res1_seq": res1_seq, "res2_seq": res2_seq, "raw_score": raw_score})
+        kwargs.setdefault("id", np.column_stack((res1_seq, res2_seq)) if store.size > 0 else None)
+        for name, value in kwargs.items():
+            if value is not None:
+                store.set_column(name, value)
+        if store.size > 1:
+            # Sort the keys once, which both finds duplicates and builds the index used by find
+            keys = pack_ids(store.id[:, 0], store.id[:, 1])
+            store._keyrows = np.argsort(keys, kind="stable")
+            store._keys = keys[store._keyrows]
+            duplicates = np.flatnonzero(store._keys[1:] == store._keys[:-1])
+            if duplicates.shape[0] > 0:
+                row = store._keyrows[duplicates[0]]
+                raise ValueError("%s defined twice" % str((int(store.id[row, 0]), int(store.id[row, 1]))))
+        return store
+
+    @classmethod
+    def from_contacts(cls, contacts):
+        """Create a new store from :obj:`~conkit.core.contact.Contact` instances
+
+        Parameters
+        ----------
+        contacts : list, tuple, :obj:`~conkit.core.contactmap.ContactMap`
+
+        Returns
+        -------
+        :obj:`~conkit.core.contactstore.ContactStore`
+
+        """
+        contacts = list(contacts)
+        store = cls(len(contacts))
+        if store.size > 0:
+            for name in COLUMN_NAMES:
+                store.set_column(name, [getattr(c, name) for c in contacts])
+        return store
+
+    def set_column(self, name, values, rows=None):
+        """Set the values of a column
+
+        Parameters
+        ----------
+        name : str
+           The column name
+        values
+           The new values, scalar or one per (selected) row
+        rows : :obj:`~numpy.ndarray`, optional
+           Update only the selected rows [default: all]
+
+        Raises
+        ------
+        :exc:`ValueError`
+           Unknown column
+
+        """
+        if name not in COLUMN_NAMES:
+            raise ValueError("Unknown contact attribute: {}".format(name))
+        column = self._writable(name)
+        if rows is None:
+            rows = slice(None)
+        if name in ("res1", "res2"):
+            values = np.asarray(values, dtype=np.str_)
+            uniques, inverse = np.unique(values, return_inverse=True)
+            encoded = np.array([ord(Contact._set_residue(u)) for u in uniques], dtype=np.uint8)
+            values = encoded[inverse].reshape(values.shape)
+        elif name == "status":
+            values = np.asarray([ContactMatchState(s).value for s in np.atleast_1d(values).tolist()], dtype=np.int8)
+        elif name in ("res1_chain", "res2_chain"):
+            values = np.asarray(values, dtype=np.str_)
+            if values.dtype.itemsize > column.dtype.itemsize:
+                column = column.astype(values.dtype)
+                setattr(self, name, column)
+        elif name == "distance_bound":
+            values = np.asarray(values, dtype=np.float64)
+        column[rows] = values
+        if name == "id":
+            self._keys = self._keyrows = None
+
+    def find(self, id):
+        """Find the row of an alive contact with the given id
+
+        Parameters
+        ----------
+        id : tuple
+           The contact identifier
+
+        Returns
+        -------
+        int, None
+           The row index or :obj:`None` if not found
+
+        """
+        try:
+            res1, res2 = id
+        except (TypeError, ValueError):
+            return None
+        if not (isinstance(res1, numbers.Integral) and isinstance(res2, numbers.Integral)):
+            return None
+        if self._keys is None:
+            keys = pack_ids(self.id[:, 0], self.id[:, 1])
+            self._keyrows = np.argsort(keys, kind="stable")
+            self._keys = keys[self._keyrows]
+        key = pack_ids(res1, res2)
+        lo = np.searchsorted(self._keys, key, side="left")
+        hi = np.searchsorted(self._keys, key, side="right")
+        for row in self._keyrows[lo:hi]:
+            if self.alive[row]:
+                return int(row)
+        return None
+
+    def take(self, rows):
+        """Create a new compact store from selected rows
+
+        Parameters
+        ----------
+        rows : :obj:`~numpy.ndarray`
+           The row indices to copy in order
+
+        Returns
+        -------
+        :obj:`~conkit.core.contactstore.ContactStore`
+
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        store = ContactStore.__new__(ContactStore)
+        store.__setstate__({name: getattr(self, name)[rows] for name in COLUMN_NAMES})
+        store.size = rows.shape[0]
+        store.alive = np.ones(store.size, dtype=np.bool_)
+        return store
+
+    def copy(self):
+        """Create a copy of the store"""
+        return self.take(np.arange(self.size))
+
+    def share(self):
+        """Create a copy of the store that shares all columns until either store writes to one
+
+        Returns
+        -------
+        :obj:`~conkit.core.contactstore.ContactStore`
+
+        """
+        store = ContactStore.__new__(ContactStore)
+        store.__setstate__({name: getattr(self, name) for name in COLUMN_NAMES})
+        store.size = self.size
+        store.alive = self.alive.copy()
+        store._keys = self._keys
+        store._keyrows = self._keyrows
+        store._shared = set(COLUMN_NAMES)
+        self._shared = set(COLUMN_NAMES)
+        return store
+
+    def _writable(self, name):
+        """Return a column that is safe to modify, copying it first if it is shared"""
+        if name in self._shared:
+            setattr(self, name, getattr(self, name).copy())
+            self._shared.discard(name)
+        return getattr(self, name)
+
+    def view(self, row):
+        """Return the :obj:`~conkit.core.contactstore.ContactView` for a row
+
+        Views are cached for as long as they are referenced elsewhere, which
+        guarantees that the same row always returns the same object.
+
+        """
+        view = self._views.get(row)
+        if view is None:
+            view = ContactView(self, row)
+            self._views[row] = view
+        return view
+
+    def to_contacts(self, rows, detach=True):
+        """Convert rows to standalone :obj:`~conkit.core.contact.Contact` instances
+
+        Parameters
+        ----------
+        rows : :obj:`~numpy.ndarray`
+           The row indices to convert in order
+        detach : bool, optional
+           Detach any view on one of the rows that is still referenced elsewhere
+           and return it instead of a new instance [default: True]
+
+        Returns
+        -------
+        list
+           A list of :obj:`~conkit.core.contact.Contact` instances
+
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = {name: getattr(self, name)[rows].tolist() for name in COLUMN_NAMES}
+        statuses = {s.value: s for s in ContactMatchState}
+        contacts = []
+        for i, row in enumerate(rows.tolist()):
+            view = self._views.get(row) if detach else None
+            if view is not None:
+                view.detach()
+                contacts.append(view)
+                continue
+            contact = Contact.__new__(Contact)
+            contact.parent = None
+            contact.child_list = []
+            contact.child_dict = {}
+            contact._id = tuple(columns["id"][i])
+            contact._res1_seq = columns["res1_seq"][i]
+            contact._res2_seq = columns["res2_seq"][i]
+            contact._res1_altseq = columns["res1_altseq"][i]
+            contact._res2_altseq = columns["res2_altseq"][i]
+            contact.raw_score = columns["raw_score"][i]
+            contact.scalar_score = columns["scalar_score"][i]
+            contact.weight = columns["weight"][i]
+            contact._status = statuses[columns["status"][i]]
+            contact._distance_bound = columns["distance_bound"][i]
+            contact._res1 = chr(columns["res1"][i])
+            contact._res2 = chr(columns["res2"][i])
+            contact.res1_chain = columns["res1_chain"][i]
+            contact.res2_chain = columns["res2_chain"][i]
+            contacts.append(contact)
+        return contacts
+
+
+class _BoundProxy(object):
+    """Mutable two-element proxy onto the distance bounds of a row"""
+
+    __slots__ = ["_store", "_row"]
+
+    def __init__(self, store, row):
+        self._store = store
+        self._row = row
+
+    def __getitem__(self, i):
+        return self._store.distance_bound[self._row, i].item()
+
+    def __iter__(self):
+        return iter(self._store.distance_bound[self._row].tolist())
+
+    def __len__(self):
+        return 2
+
+    def __setitem__(self, i, value):
+        self._store._writable("distance_bound")[self._row, i] = value
+
+
+def _column_property(name, getter, setter):
+    def fget(self):
+        return getter(getattr(self._store, name)[self._row])
+
+    def fset(self, value):
+        self._store._writable(name)[self._row] = setter(value)
+
+    return property(fget, fset)
+
+
+class ContactView(Contact):
+    """A :obj:`~conkit.core.contact.Contact` backed by a row in a :obj:`~conkit.core.contactstore.ContactStore`
+
+    All reads and writes go straight to the underlying arrays, so any public attribute
+    or method of :obj:`~conkit.core.contact.Contact` behaves identically. Copies of a
+    view are standalone :obj:`~conkit.core.contact.Contact` instances.
+
+    """
+
+    # No __slots__ here: the inherited ones must stay visible through ``self.__slots__``
+
+    def __init__(self, store, row):
+        self._store = store
+        self._row = row
+        self.parent = None
+        self.child_list = []
+        self.child_dict = {}
+
+    _res1_seq = _column_property("res1_seq", int, int)
+    _res2_seq = _column_property("res2_seq", int, int)
+    _res1_altseq = _column_property("res1_altseq", int, int)
+    _res2_altseq = _column_property("res2_altseq", int, int)
+    raw_score = _column_property("raw_score", float, float)
+    scalar_score = _column_property("scalar_score", float, float)
+    weight = _column_property("weight", float, float)
+    _res1 = _column_property("res1", chr, ord)
+    _res2 = _column_property("res2", chr, ord)
+
+    @property
+    def _id(self):
+        return tuple(self._store.id[self._row].tolist())
+
+    @_id.setter
+    def _id(self, id):
+        try:
+            res1, res2 = id
+            assert isinstance(res1, numbers.Integral) and isinstance(res2, numbers.Integral)
+        except (AssertionError, TypeError, ValueError):
+            raise TypeError("Columnar contacts require a tuple of two residue numbers as id")
+        self._store.set_column("id", (res1, res2), rows=self._row)
+
+    @property
+    def _distance_bound(self):
+        return _BoundProxy(self._store, self._row)
+
+    @_distance_bound.setter
+    def _distance_bound(self, distance_bound):
+        self._store._writable("distance_bound")[self._row] = distance_bound
+
+    @property
+    def _status(self):
+        return ContactMatchState(self._store.status[self._row])
+
+    @_status.setter
+    def _status(self, status):
+        self._store._writable("status")[self._row] = ContactMatchState(status).value
+
+    @property
+    def res1_chain(self):
+        return str(self._store.res1_chain[self._row])
+
+    @res1_chain.setter
+    def res1_chain(self, chain):
+        self._store.set_column("res1_chain", chain, rows=self._row)
+
+    @property
+    def res2_chain(self):
+        return str(self._store.res2_chain[self._row])
+
+    @res2_chain.setter
+    def res2_chain(self, chain):
+        self._store.set_column("res2_chain", chain, rows=self._row)
+
+    def copy(self):
+        """Create a standalone :obj:`~conkit.core.contact.Contact` copy"""
+        return self._store.to_contacts([self._row], detach=False)[0]
+
+    def deepcopy(self):
+        """Create a standalone :obj:`~conkit.core.contact.Contact` copy"""
+        return self.copy()
+
+    def detach(self):
+        """Move the view onto a private single-row store"""
+        self._store._views.pop(self._row, None)
+        self._store = self._store.take([self._row])
+        self._row = 0
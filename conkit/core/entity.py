@@ -39,6 +39,7 @@ __date__ = "03 Aug 2016"
 __version__ = "1.0"
 
 import copy
+import numpy as np
 import operator
 
 
@@ -68,9 +69,18 @@ class Entity(object):
     child_dict : dict
        A dictionary storing the child entities
 
+    Note
+    ----
+    Removing a child only drops it from the :attr:`~conkit.core.entity.Entity.child_dict` and
+    marks it as removed. The :attr:`~conkit.core.entity.Entity.child_list` is compacted once the
+    next time it is accessed, which makes repeated single removals :math:`O(1)` amortised.
+    Any access by position, including removal by position, compacts the list first, so loops
+    alternating removals with such accesses remain :math:`O(n^2)`. Use
+    :meth:`~conkit.core.entity.Entity.remove_many` or :meth:`~conkit.core.entity.Entity.keep` instead.
+
     """
 
-    __slots__ = ["parent", "_id", "child_list", "child_dict"]
+    __slots__ = ["parent", "_id", "_child_list", "child_dict", "_removed"]
 
     def __init__(self, id):
         """Initialise a generic :obj:`~conkit.core.entity.Entity`
@@ -96,17 +106,13 @@ class Entity(object):
         child = self[id]
         child.parent = None
         self.child_dict.pop(id)
-        self.child_list.remove(child)
+        self._removed.add(child)
+        self._touch()
 
     def __getitem__(self, id):
         """Return the child with the given id"""
         if isinstance(id, slice):
-            indexes_to_keep = set(range(*id.indices(len(self))))
-            copy_to_return = self.copy()
-            for i, child in enumerate(self):
-                if i not in indexes_to_keep:
-                    copy_to_return.remove(child.id)
-            return copy_to_return
+            return self._copy_with([self.child_list[i] for i in Entity._slice_indexes(id, len(self))])
         elif isinstance(id, int):
             return self.child_list[id]
         else:
@@ -119,13 +125,25 @@ class Entity(object):
 
     def __len__(self):
         """Return the number of children"""
-        return len(self.child_list)
+        return len(self._child_list) - len(self._removed)
 
     def __reversed__(self):
         """Reversed list of the children"""
         for child in reversed(self.child_list):
             yield child
 
+    @property
+    def child_list(self):
+        """A list storing the child entities"""
+        self._compact()
+        return self._child_list
+
+    @child_list.setter
+    def child_list(self, child_list):
+        """Replace the list storing the child entities"""
+        self._child_list = child_list
+        self._removed = set()
+
     @property
     def full_id(self):
         """A traceback id including all parent classes
@@ -187,6 +205,17 @@ class Entity(object):
         else:
             return None
 
+    def _compact(self):
+        """Drop all children marked as removed from the internal child list"""
+        if self._removed:
+            removed = self._removed
+            self._child_list[:] = [child for child in self._child_list if child not in removed]
+            self._removed = set()
+
+    def _touch(self):
+        """Record a modification of the :obj:`~conkit.core.entity.Entity` or one of its children"""
+        pass
+
     def _inplace(self, inplace):
         """Modify the current version using a copy
 
@@ -205,6 +234,7 @@ class Entity(object):
         if any(not hasattr(e, kword) for e in self.child_list):
             raise ValueError("Attribute not defined")
         self.child_list.sort(key=operator.attrgetter(kword), reverse=reverse)
+        self._touch()
 
     def add(self, entity):
         """Add a child to the :obj:`~conkit.core.entity.Entity`
@@ -216,25 +246,38 @@ class Entity(object):
         """
         if entity.id in self:
             raise ValueError("%s defined twice" % str(entity.id))
+        if entity in self._removed:
+            self._compact()
         entity.parent = self
-        self.child_list.append(entity)
+        self._child_list.append(entity)
         self.child_dict[entity.id] = entity
+        self._touch()
 
-    def copy(self):
-        """Create a shallow copy of :obj:`~conkit.core.entity.Entity`"""
+    def _copy_with(self, children):
+        """Create a shallow copy of :obj:`~conkit.core.entity.Entity` holding copies of selected children only"""
         shallow = copy.copy(self)
 
         shallow.child_list = []
         shallow.child_dict = {}
         shallow.parent = None
 
-        for child in self:
+        for child in children:
             shallow.add(child.copy())
         return shallow
 
+    def copy(self):
+        """Create a shallow copy of :obj:`~conkit.core.entity.Entity`"""
+        return self._copy_with(self)
+
     def deepcopy(self):
         """Create a deep copy of :obj:`~conkit.core.entity.Entity`"""
-        deep = copy.deepcopy(self)
+        # Children are copied below, so never descend into them or the parent here
+        memo = {id(self._child_list): [], id(self.child_dict): {}, id(self._removed): set(), id(self.parent): None}
+        # Cached results belong to the original, and may be large or memory-mapped
+        cache = getattr(self, "_cache", None)
+        if cache is not None:
+            memo[id(cache)] = {}
+        deep = copy.deepcopy(self, memo)
 
         deep.child_list = []
         deep.child_dict = {}
@@ -260,6 +303,76 @@ class Entity(object):
         """
         del self[id]
 
+    def remove_many(self, ids):
+        """Remove multiple children at once
+
+        Parameters
+        ----------
+        ids : list, tuple
+           The identifiers of the children to remove
+
+        Raises
+        ------
+        :exc:`KeyError`
+           Child not found
+
+        """
+        # Repeated identifiers are removed once
+        ids = list(dict.fromkeys(ids))
+        for id in ids:
+            if id not in self.child_dict:
+                raise KeyError(id)
+        for id in ids:
+            child = self.child_dict.pop(id)
+            child.parent = None
+            self._removed.add(child)
+        self._compact()
+        self._touch()
+
+    def keep(self, selection):
+        """Keep only the selected children and remove all others at once
+
+        Parameters
+        ----------
+        selection : list, tuple, :obj:`~numpy.ndarray`
+           Either a boolean mask with one value per child in the current order, or
+           the identifiers of the children to keep
+
+        Raises
+        ------
+        :exc:`ValueError`
+           Boolean mask does not match the number of children
+
+        """
+        if hasattr(selection, "dtype"):
+            is_mask = selection.dtype.kind == "b"
+            selection = selection.tolist()
+        else:
+            selection = list(selection)
+            is_mask = len(selection) > 0 and all(isinstance(s, (bool, np.bool_)) for s in selection)
+        if is_mask:
+            if len(selection) != len(self):
+                raise ValueError("Boolean mask does not match the number of children")
+            keep = set(child for child, s in zip(self.child_list, selection) if s)
+        else:
+            keep = set(self.child_dict[id] for id in selection if id in self.child_dict)
+        child_list = []
+        for child in self.child_list:
+            if child in keep:
+                child_list.append(child)
+            else:
+                child.parent = None
+        self.child_list = child_list
+        self.child_dict = {k: v for k, v in self.child_dict.items() if v in keep}
+        self._touch()
+
+    @staticmethod
+    def _slice_indexes(s, length):
+        """The ascending child indexes selected by a :obj:`slice`, children keep their order regardless of step"""
+        start, stop, step = s.indices(length)
+        indexes = range(start, stop, step)
+        return indexes[::-1] if step < 0 else indexes
+
     @staticmethod
     def listify(s):
         """Convert unknown input to a list
@@ -4,17 +4,34 @@ cimport cython
 import numpy as np
 cimport numpy as np
 
-from libc.stdlib cimport abs
+from cython.parallel import prange
 
 np.import_array()
 
 
-def c_singletons(np.ndarray[np.int64_t, ndim=2] X, double threshold, np.ndarray[np.uint8_t, ndim=1, cast=True] throwables):
-    cdef Py_ssize_t i, j
-    for i in xrange(X.shape[0]):
-        for j in xrange(i + 1, X.shape[0]):
-            if throwables[j]:
-                continue
-            if abs(int(X[j, 0] - X[i, 0])) <= threshold and abs(int(X[j, 1] - X[i, 1])) <= threshold:
-                throwables[i] = True 
-                throwables[j] = True 
+@cython.cdivision(True)
+def c_jaccard_matrix(np.ndarray[np.int64_t, ndim=1] keys, np.ndarray[np.int64_t, ndim=1] offsets, np.ndarray[double, ndim=2] jaccard, int nthreads):
+    cdef Py_ssize_t i, j, a, b, a_end, b_end, intersection, union
+    cdef Py_ssize_t n = offsets.shape[0] - 1
+    for i in prange(n, nogil=True, schedule="dynamic", num_threads=nthreads):
+        for j in xrange(i, n):
+            a = offsets[i]
+            a_end = offsets[i + 1]
+            b = offsets[j]
+            b_end = offsets[j + 1]
+            intersection = 0
+            while a < a_end and b < b_end:
+                if keys[a] < keys[b]:
+                    a = a + 1
+                elif keys[a] > keys[b]:
+                    b = b + 1
+                else:
+                    intersection = intersection + 1
+                    a = a + 1
+                    b = b + 1
+            union = (offsets[i + 1] - offsets[i]) + (offsets[j + 1] - offsets[j]) - intersection
+            if union == 0:
+                jaccard[i, j] = 1.0
+            else:
+                jaccard[i, j] = <double> intersection / union
+            jaccard[j, i] = jaccard[i, j]
@@ -4,45 +4,213 @@ cimport cython
 import numpy as np
 cimport numpy as np
 
-from cython.parallel import prange
+from cython.parallel import prange, threadid
 
 np.import_array()
 
 
-def c_get_frequency(np.ndarray[np.int64_t, ndim=2] X, Py_ssize_t symbol, np.ndarray[np.int64_t, ndim=1] frequencies):
-    cdef Py_ssize_t i, j
-    for j in prange(X.shape[1], nogil=True): 
-        for i in xrange(X.shape[0]):
-            frequencies[j] += X[i, j] == symbol
+def c_get_profile(const np.uint8_t[:, ::1] X, const np.uint8_t[::1] encoding, const double[::1] weights, double[:, :, ::1] profiles):
+    """Accumulate the weighted count of every encoded symbol in every column in a single row-major pass
 
+    Each thread accumulates into its own profile in ``profiles``, which the caller sums up.
 
-def c_get_weights(np.ndarray[np.int64_t, ndim=2] X, double identity, np.ndarray[double, ndim=1] hamming):
-    cdef Py_ssize_t i, j, k
-    cdef double threshold, dist
-    threshold = (1.0 - identity) * X.shape[1]
-    for i in prange(X.shape[0], nogil=True):
-        for j in xrange(X.shape[0]):
-            dist = 0.0
-            for k in xrange(X.shape[1]):
-                dist += X[i, k] != X[j, k]
-            hamming[i] += dist < threshold
-        hamming[i] = 1.0 / hamming[i]
+    """
+    cdef Py_ssize_t n = X.shape[0], length = X.shape[1]
+    cdef Py_ssize_t nthreads = profiles.shape[0]
+    cdef Py_ssize_t chunk = (n + nthreads - 1) // nthreads
+    cdef Py_ssize_t t, i, k
+    cdef double w
+    for t in prange(nthreads, nogil=True, num_threads=nthreads):
+        for i in range(t * chunk, min((t + 1) * chunk, n)):
+            w = weights[i]
+            for k in range(length):
+                profiles[t, k, encoding[X[i, k]]] += w
 
 
-def c_filter(np.ndarray[np.int64_t, ndim=2] X, double min_id, double max_id, np.ndarray[np.uint8_t, ndim=1, cast=True] throwables):
-    cdef Py_ssize_t i, j, k
-    cdef double dist
-    for i in xrange(X.shape[0]):
-        for j in xrange(i + 1, X.shape[0]):
-            if not throwables[j]:
-                dist = 0
-                for k in xrange(X.shape[1]):
-                    dist += X[i, k] != X[j, k]
-                ident = 1.0 - dist / X.shape[1]
-                throwables[j] = (ident < min_id) or (ident > max_id)
+def c_get_weights(const np.uint8_t[:, ::1] X, double identity, int[:, ::1] counts, Py_ssize_t tile, int nthreads):
+    """Count the similar sequences of every sequence, excluding itself
+
+    Each unordered pair is compared once in tiles of ``tile`` rows, so that both tiles stay
+    in cache. Comparisons stop as soon as the distance reaches the threshold. Every thread
+    accumulates into its own row of ``counts``, which the caller sums up.
+
+    """
+    cdef Py_ssize_t n = X.shape[0], length = X.shape[1]
+    cdef Py_ssize_t nblocks = (n + tile - 1) // tile
+    cdef Py_ssize_t bi, bj, i, j, k, k0, kend, jstart, iend, jend, dist
+    cdef int tid
+    cdef double threshold = (1.0 - identity) * length
+    cdef const np.uint8_t* a
+    cdef const np.uint8_t* b
+    if n == 0 or length == 0:
+        return
+    for bi in prange(nblocks, nogil=True, schedule="dynamic", num_threads=nthreads):
+        tid = threadid()
+        iend = min((bi + 1) * tile, n)
+        for bj in range(bi, nblocks):
+            jend = min((bj + 1) * tile, n)
+            for i in range(bi * tile, iend):
+                a = &X[i, 0]
+                jstart = i + 1 if bi == bj else bj * tile
+                for j in range(jstart, jend):
+                    b = &X[j, 0]
+                    dist = 0
+                    k0 = 0
+                    while k0 < length and dist < threshold:
+                        kend = min(k0 + 64, length)
+                        for k in range(k0, kend):
+                            dist = dist + (a[k] != b[k])
+                        k0 = kend
+                    if dist < threshold:
+                        counts[tid, i] += 1
+                        counts[tid, j] += 1
+
+
+def c_get_identities(const np.uint8_t[:, ::1] X, Py_ssize_t start, Py_ssize_t tile, np.int32_t[:, ::1] distances, int nthreads):
+    """Count the differing positions between a block of rows and all following rows
+
+    ``distances[i - start, j - start]`` receives the distance between rows ``i`` and ``j`` for
+    every ``j >= i``, the entries below the diagonal are left untouched. Tiles of ``tile`` rows
+    are compared against each other, so that both tiles stay in cache.
+
+    """
+    cdef Py_ssize_t n = X.shape[0], length = X.shape[1]
+    cdef Py_ssize_t stop = start + distances.shape[0]
+    cdef Py_ssize_t ntiles = (n - start + tile - 1) // tile
+    cdef Py_ssize_t bi, bj, i, j, k, istart, jstart, iend, jend
+    cdef int dist
+    cdef const np.uint8_t* a
+    cdef const np.uint8_t* b
+    for bj in prange(ntiles, nogil=True, schedule="dynamic", num_threads=nthreads):
+        jstart = start + bj * tile
+        jend = min(jstart + tile, n)
+        for bi in range((stop - start + tile - 1) // tile):
+            istart = start + bi * tile
+            iend = min(istart + tile, stop)
+            for i in range(istart, iend):
+                a = &X[i, 0]
+                for j in range(max(i, jstart), jend):
+                    b = &X[j, 0]
+                    dist = 0
+                    for k in range(length):
+                        dist = dist + (a[k] != b[k])
+                    distances[i - start, j - start] = dist
+
+
+def c_filter(const np.uint8_t[:, ::1] X, const np.int32_t[::1] alphabet, Py_ssize_t nsymbols, Py_ssize_t min_dist, Py_ssize_t max_dist, np.ndarray[np.uint8_t, ndim=1, cast=True] throwables, int nthreads):
+    """Throw every sequence whose distance to any preceding sequence is outside ``[min_dist, max_dist]``
+
+    Whether a sequence is thrown does not depend on any other decision, so all sequences are
+    tested in parallel. A pair is rejected without comparison if the residue composition
+    alone implies a distance greater than ``max_dist``. Comparisons stop as soon as the
+    distance is known to be inside or outside the window.
 
+    """
+    cdef Py_ssize_t n = X.shape[0], length = X.shape[1]
+    cdef Py_ssize_t i, j, k, k0, kend, c, dist, shared
+    cdef bint thrown
+    cdef const np.uint8_t* a
+    cdef const np.uint8_t* b
+    cdef np.int32_t[:, ::1] composition = np.zeros((n, max(nsymbols, 1)), dtype=np.int32)
+    for i in prange(n, nogil=True, num_threads=nthreads):
+        for k in range(length):
+            composition[i, alphabet[X[i, k]]] += 1
+    for j in prange(1, n, nogil=True, schedule="dynamic", num_threads=nthreads):
+        b = &X[j, 0]
+        thrown = False
+        for i in range(j):
+            shared = 0
+            for c in range(nsymbols):
+                shared = shared + min(composition[i, c], composition[j, c])
+            if length - shared > max_dist:
+                thrown = True
+                break
+            a = &X[i, 0]
+            dist = 0
+            k0 = 0
+            while True:
+                kend = min(k0 + 64, length)
+                for k in range(k0, kend):
+                    dist = dist + (a[k] != b[k])
+                k0 = kend
+                if dist > max_dist or dist + length - k0 < min_dist:
+                    thrown = True
+                    break
+                elif dist >= min_dist and dist + length - k0 <= max_dist:
+                    break
+            if thrown:
+                break
+        throwables[j] = thrown
 
-def c_filter_symbol(np.ndarray[np.int64_t, ndim=2] X, double min_prop, double max_prop, Py_ssize_t symbol, np.ndarray[np.uint8_t, ndim=1, cast=True] throwables):
+
+cdef inline bint _within(const np.uint8_t[:, ::1] X, const np.int32_t[:, ::1] composition, Py_ssize_t i, Py_ssize_t j, Py_ssize_t max_dist) noexcept nogil:
+    """True if the distance between rows ``i`` and ``j`` is at most ``max_dist``"""
+    cdef Py_ssize_t length = X.shape[1]
+    cdef Py_ssize_t c, k, k0, kend, shared = 0, dist = 0
+    cdef const np.uint8_t* a = &X[i, 0]
+    cdef const np.uint8_t* b = &X[j, 0]
+    for c in range(composition.shape[1]):
+        shared = shared + min(composition[i, c], composition[j, c])
+    if length - shared > max_dist:
+        return False
+    k0 = 0
+    while k0 < length and dist <= max_dist:
+        kend = min(k0 + 64, length)
+        for k in range(k0, kend):
+            dist = dist + (a[k] != b[k])
+        k0 = kend
+    return dist <= max_dist
+
+
+def c_cluster(const np.uint8_t[:, ::1] X, const np.int64_t[::1] order, const np.int32_t[::1] alphabet, Py_ssize_t nsymbols, Py_ssize_t max_dist, np.int64_t[::1] labels, Py_ssize_t batch, int nthreads):
+    """Greedily cluster the rows in the given order and return the number of clusters
+
+    Every row joins the first representative within ``max_dist``, or becomes the representative
+    of a new cluster. Rows are processed in batches: all rows of a batch are first compared to
+    the representatives of earlier batches in parallel, and only the remaining rows are compared
+    to the representatives created within the batch, in order. A pair is rejected without
+    comparison if the residue composition alone implies a distance greater than ``max_dist``.
+
+    """
+    cdef Py_ssize_t n = X.shape[0], length = X.shape[1]
+    cdef Py_ssize_t bi, b, size, c, r, i, k, nprevious, row, found
+    cdef Py_ssize_t nreps = 0
+    cdef np.int32_t[:, ::1] composition = np.zeros((n, max(nsymbols, 1)), dtype=np.int32)
+    cdef np.int64_t[::1] reps = np.empty(max(n, 1), dtype=np.int64)
+    cdef np.int64_t[::1] matches = np.empty(max(batch, 1), dtype=np.int64)
+    for i in prange(n, nogil=True, num_threads=nthreads):
+        for k in range(length):
+            composition[i, alphabet[X[i, k]]] += 1
+    with nogil:
+        for bi in range((n + batch - 1) // batch):
+            b = bi * batch
+            size = min(batch, n - b)
+            nprevious = nreps
+            for c in prange(size, schedule="dynamic", num_threads=nthreads):
+                row = order[b + c]
+                found = -1
+                for r in range(nprevious):
+                    if _within(X, composition, row, reps[r], max_dist):
+                        found = r
+                        break
+                matches[c] = found
+            for c in range(size):
+                row = order[b + c]
+                found = matches[c]
+                if found < 0:
+                    for r in range(nprevious, nreps):
+                        if _within(X, composition, row, reps[r], max_dist):
+                            found = r
+                            break
+                if found < 0:
+                    reps[nreps] = row
+                    found = nreps
+                    nreps = nreps + 1
+                labels[row] = found
+    return nreps
+
+
+def c_filter_symbol(const np.uint8_t[:, :] X, double min_prop, double max_prop, Py_ssize_t symbol, np.ndarray[np.uint8_t, ndim=1, cast=True] throwables):
     cdef Py_ssize_t i, k
     cdef double prop
     for i in xrange(X.shape[0]):
@@ -51,3 +219,27 @@ def c_filter_symbol(np.ndarray[np.int64_t, ndim=2] X, double min_prop, double ma
             prop += X[i, k] == symbol
         prop /= X.shape[1]
         throwables[i] = (prop < min_prop) or (prop > max_prop)
+
+
+def c_count_similar(const np.uint8_t[:, ::1] X, np.ndarray[np.int64_t, ndim=1] rows, double identity, np.ndarray[np.int64_t, ndim=1] counts, int nthreads):
+    cdef Py_ssize_t n = X.shape[0], length = X.shape[1]
+    cdef Py_ssize_t r, i, j, k, k0, kend, dist, count
+    cdef double threshold = (1.0 - identity) * length
+    cdef const np.uint8_t* a
+    cdef const np.uint8_t* b
+    for r in prange(rows.shape[0], nogil=True, schedule="dynamic", num_threads=nthreads):
+        i = rows[r]
+        a = &X[i, 0]
+        count = 0
+        for j in range(n):
+            b = &X[j, 0]
+            dist = 0
+            k0 = 0
+            while k0 < length and dist < threshold:
+                kend = min(k0 + 64, length)
+                for k in range(k0, kend):
+                    dist = dist + (a[k] != b[k])
+                k0 = kend
+            if dist < threshold:
+                count = count + 1
+        counts[r] = count
@@ -38,10 +38,59 @@ __author__ = "Felix Simkovic"
 __date__ = "03 Aug 2016"
 __version__ = "1.0"
 
-from Bio import pairwise2
+import functools
+import numpy as np
+
+from Bio.Align import PairwiseAligner
 from conkit.core.entity import Entity
 from conkit.core.mappings import AminoAcidMapping, AminoAcidOneToThree
 
+# Byte tables indexed by ASCII code, used with :meth:`bytes.translate`
+VALID_CHARACTERS = bytes(b for b in range(128) if chr(b) == "-" or chr(b).upper() in AminoAcidOneToThree.__members__)
+ENCODING_TABLE = bytes(
+    [getattr(AminoAcidMapping, chr(b), AminoAcidMapping.X).value for b in range(128)]
+    + [AminoAcidMapping.X.value] * 128
+)
+
+
+def _format_alignment(alignment, seq1, seq2):
+    """Convert a :obj:`~Bio.Align.Alignment` to the padded strings returned by :mod:`~Bio.pairwise2`"""
+    coordinates = alignment.coordinates.tolist()
+    start1, start2 = coordinates[0][0], coordinates[1][0]
+    end1, end2 = coordinates[0][-1], coordinates[1][-1]
+    width = max(start1, start2)
+    aligned1 = ["-" * (width - start1) + seq1[:start1]]
+    aligned2 = ["-" * (width - start2) + seq2[:start2]]
+    for i in range(len(coordinates[0]) - 1):
+        i1, i2 = coordinates[0][i], coordinates[0][i + 1]
+        j1, j2 = coordinates[1][i], coordinates[1][i + 1]
+        aligned1.append(seq1[i1:i2] if i2 > i1 else "-" * (j2 - j1))
+        aligned2.append(seq2[j1:j2] if j2 > j1 else "-" * (i2 - i1))
+    width = max(len(seq1) - end1, len(seq2) - end2)
+    aligned1.append(seq1[end1:] + "-" * (width - len(seq1) + end1))
+    aligned2.append(seq2[end2:] + "-" * (width - len(seq2) + end2))
+    return "".join(aligned1), "".join(aligned2)
+
+
+@functools.lru_cache(maxsize=512)
+def _pairwise_align(mode, seq1, seq2, id_chars, nonid_chars, gap_open_pen, gap_ext_pen):
+    """Align two sequences and return both aligned sequences
+
+    The alignment is computed with :obj:`~Bio.Align.PairwiseAligner`. Of several co-optimal alignments,
+    the first one it produces is returned, so the others are never enumerated. Results are memoised
+    for the most recently used sequence pairs.
+
+    """
+    aligner = PairwiseAligner(
+        mode=mode,
+        match_score=id_chars,
+        mismatch_score=nonid_chars,
+        open_gap_score=gap_open_pen,
+        extend_gap_score=gap_ext_pen,
+    )
+    alignment = next(iter(aligner.align(seq1, seq2)))
+    return _format_alignment(alignment, seq1, seq2)
+
 
 class Sequence(Entity):
     """A sequence template to store all associated information
@@ -66,7 +115,7 @@ class Sequence(Entity):
 
     """
 
-    __slots__ = ["_remark", "_seq"]
+    __slots__ = ["_remark", "_seq", "_seq_array"]
 
     def __init__(self, id, seq):
         """Initialise a generic sequence
@@ -81,8 +130,9 @@ class Sequence(Entity):
         """
         self._remark = []
         self._seq = None
-        self.seq = seq
+        self._seq_array = None
         super(Sequence, self).__init__(id)
+        self.seq = seq
 
     def __add__(self, other):
         """Concatenate two sequence instances to a new"""
@@ -131,24 +181,39 @@ class Sequence(Entity):
 
         Raises
         ------
-        :exc:`ValueError`
+        :exc:`KeyError`
            One or more amino acids in the sequence are not recognised
 
         """
-        if all(AminoAcidOneToThree[c].value for c in seq.upper() if c != "-"):
-            self._seq = seq
-        else:
-            raise ValueError("Unrecognized amino acids in sequence")
+        # Non-ASCII characters are replaced by "?", which is never valid
+        if seq.encode("ascii", "replace").translate(None, VALID_CHARACTERS):
+            valid = VALID_CHARACTERS.decode("ascii")
+            raise KeyError(next(c.upper() for c in seq if c not in valid))
+        self._seq = seq
+        self._seq_array = None
+        if self.parent is not None:
+            self.parent._touch()
 
     @property
     def seq_ascii(self):
         """The protein sequence as ASCII-encoded :obj:`str`"""
         return bytearray(self._seq, "ascii")
 
+    @property
+    def seq_array(self):
+        """The protein sequence as read-only :obj:`numpy.uint8` array of ASCII codes
+
+        The array is created once and shared by all subsequent calls until the sequence changes.
+
+        """
+        if self._seq_array is None:
+            self._seq_array = np.frombuffer(self._seq.encode("ascii"), dtype=np.uint8)
+        return self._seq_array
+
     @property
     def seq_encoded(self):
         """The protein sequence encoded by numbers"""
-        return [getattr(AminoAcidMapping, c, AminoAcidMapping.X).value for c in self.seq]
+        return list(self._seq.encode("ascii").translate(ENCODING_TABLE))
 
     @property
     def seq_len(self):
@@ -177,11 +242,9 @@ class Sequence(Entity):
         sequence1 = self._inplace(inplace)
         sequence2 = other._inplace(inplace)
 
-        alignment = pairwise2.align.globalms(
-            sequence1.seq, sequence2.seq, id_chars, nonid_chars, gap_open_pen, gap_ext_pen
+        sequence1.seq, sequence2.seq = _pairwise_align(
+            "global", sequence1.seq, sequence2.seq, id_chars, nonid_chars, gap_open_pen, gap_ext_pen
         )
-        sequence1.seq = alignment[-1][0]
-        sequence2.seq = alignment[-1][1]
 
         return sequence1, sequence2
 
@@ -207,11 +270,8 @@ class Sequence(Entity):
         sequence1 = self._inplace(inplace)
         sequence2 = other._inplace(inplace)
 
-        alignment = pairwise2.align.localms(
-            sequence1.seq, sequence2.seq, id_chars, nonid_chars, gap_open_pen, gap_ext_pen
+        sequence1.seq, sequence2.seq = _pairwise_align(
+            "local", sequence1.seq, sequence2.seq, id_chars, nonid_chars, gap_open_pen, gap_ext_pen
         )
 
-        sequence1.seq = alignment[-1][0]
-        sequence2.seq = alignment[-1][1]
-
         return sequence1, sequence2
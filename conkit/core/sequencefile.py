@@ -37,8 +37,12 @@ __author__ = "Felix Simkovic"
 __date__ = "03 Aug 2016"
 __version__ = "1.0"
 
+import copy
+import math
 import numpy as np
+import os
 import sys
+import tempfile
 
 from conkit.core.entity import Entity
 from conkit.core.mappings import AminoAcidMapping, SequenceAlignmentState
@@ -79,9 +83,34 @@ class SequenceFile(Entity):
     >>> print(sequence_file)
     SequenceFile(id="example" nseq=2)
 
+    Note
+    ----
+    A :obj:`~conkit.core.sequencefile.SequenceFile` created with
+    :meth:`~conkit.core.sequencefile.SequenceFile.from_matrix` stores its alignment in a single
+    :obj:`numpy.uint8` matrix held by a :obj:`~conkit.core.sequencestore.SequenceStore`. Its
+    :obj:`~conkit.core.sequence.Sequence` instances are lightweight row views created on access. Any
+    operation without a matrix implementation, e.g. adding a new sequence, converts the file back to
+    individual :obj:`~conkit.core.sequence.Sequence` instances first.
+
+    Derived statistics, e.g. the sequence weights, are computed once and reused until the
+    :obj:`~conkit.core.sequencefile.SequenceFile` or one of its sequences is modified.
+
     """
 
-    __slots__ = ["_remark", "_status"]
+    __slots__ = ["_remark", "_status", "_store", "_row_order", "_nremoved", "_cache"]
+
+    # Bytes of each tile of sequences compared by the tiled weights kernel
+    _TILE_BYTES = 1 << 16
+    # Default working memory of the matrix product weights kernel
+    _GEMM_MEMORY = 1 << 28
+    # Initial number of sequences sampled to estimate the number of effective sequences
+    _MEFF_SAMPLE = 100
+    # Default maximum size of an identity matrix held in memory rather than in a memory-mapped file
+    _IDENTITY_MEMORY = 1 << 30
+    # Bytes of pairwise distances computed per block of rows of the identity matrix
+    _IDENTITY_BLOCK_BYTES = 1 << 26
+    # Number of sequences compared to the existing cluster representatives in parallel
+    _CLUSTER_BATCH = 1024
 
     def __init__(self, id):
         """Initialise a new :obj:`~conkit.core.sequencefile.SequenceFile`
@@ -94,19 +123,122 @@ class SequenceFile(Entity):
         """
         self._remark = []
         self._status = SequenceAlignmentState.unknown
+        self._store = None
+        self._rows = None
+        self._cache = {}
         super(SequenceFile, self).__init__(id)
 
+    def __contains__(self, id):
+        """True if there is a sequence with the given id"""
+        if self._store is None:
+            return super(SequenceFile, self).__contains__(id)
+        return self._store.find(id) is not None
+
+    def __delitem__(self, id):
+        """Remove a sequence with given id"""
+        if self._store is None:
+            return super(SequenceFile, self).__delitem__(id)
+        row = self._store.find(id)
+        if row is None:
+            raise KeyError(id)
+        self._store.alive[row] = False
+        self._nremoved += 1
+        self._touch()
+        view = self._store._views.get(row)
+        if view is not None:
+            view.parent = None
+
+    def __getitem__(self, id):
+        """Return the sequence with the given id"""
+        if self._store is None:
+            return super(SequenceFile, self).__getitem__(id)
+        elif isinstance(id, slice):
+            indexes = np.asarray(Entity._slice_indexes(id, len(self)), dtype=np.int64)
+            return self._columnar_copy(self._rows[indexes], deep=False)
+        elif isinstance(id, int):
+            return self._view(int(self._rows[id]))
+        row = self._store.find(id)
+        if row is None:
+            raise KeyError(id)
+        return self._view(row)
+
+    def __iter__(self):
+        """Iterate over sequences"""
+        if self._store is None:
+            for sequence in super(SequenceFile, self).__iter__():
+                yield sequence
+        else:
+            for row in self._rows.tolist():
+                yield self._view(row)
+
+    def __len__(self):
+        """Return the number of sequences"""
+        if self._store is None:
+            return super(SequenceFile, self).__len__()
+        return self._row_order.shape[0] - self._nremoved
+
     def __repr__(self):
         return '{}(id="{}" nseq={})'.format(self.__class__.__name__, self.id, self.nseq)
 
+    def __reversed__(self):
+        """Reversed list of the sequences"""
+        if self._store is None:
+            for sequence in super(SequenceFile, self).__reversed__():
+                yield sequence
+        else:
+            for row in self._rows[::-1].tolist():
+                yield self._view(row)
+
+    def _get_child_list(self):
+        if self._store is not None:
+            self._materialize()
+        return Entity.child_list.__get__(self, Entity)
+
+    def _set_child_list(self, child_list):
+        Entity.child_list.__set__(self, child_list)
+
+    def _get_child_dict(self):
+        if self._store is not None:
+            self._materialize()
+        return Entity.child_dict.__get__(self, Entity)
+
+    def _set_child_dict(self, child_dict):
+        Entity.child_dict.__set__(self, child_dict)
+
+    # Any direct access to the children converts a matrix-backed file to individual sequences
+    child_list = property(_get_child_list, _set_child_list)
+    child_dict = property(_get_child_dict, _set_child_dict)
+
+    @property
+    def _rows(self):
+        """The store rows of all sequences in order, without any removed ones"""
+        if self._nremoved:
+            self._row_order = self._row_order[self._store.alive[self._row_order]]
+            self._nremoved = 0
+        return self._row_order
+
+    @_rows.setter
+    def _rows(self, rows):
+        self._row_order = rows
+        self._nremoved = 0
+
     @property
     def ascii_matrix(self):
         """The alignment encoded in a 2-D ASCII matrix"""
+        if self._store is not None:
+            return self._ascii_array().tolist()
         return [list(seq.seq_ascii) for seq in self]
 
+    @property
+    def columnar(self):
+        """A boolean status for the matrix storage of sequences"""
+        return self._store is not None
+
     @property
     def encoded_matrix(self):
         """The alignment encoded for contact prediction"""
+        if self._store is not None:
+            return self._encoded_array().tolist()
         return [list(seq.seq_encoded) for seq in self]
 
     @property
@@ -119,13 +251,12 @@ class SequenceFile(Entity):
            A boolean status for the alignment
 
         """
-        seq_length = self.top_sequence.seq_len
-        self._status = SequenceAlignmentState.aligned
-        for sequence in self:
-            if sequence.seq_len != seq_length:
-                self._status = SequenceAlignmentState.unaligned
-                break
-        return self._status == SequenceAlignmentState.aligned
+        if self._store is not None:
+            aligned = True
+        else:
+            aligned = self._cached("is_alignment", self._check_alignment)
+        self._status = SequenceAlignmentState.aligned if aligned else SequenceAlignmentState.unaligned
+        return aligned
 
     @property
     def diversity(self):
@@ -138,7 +269,9 @@ class SequenceFile(Entity):
         if self.empty:
             return 0.0
         elif self.is_alignment:
-            return (np.sqrt(len(self)) / float(self.top.seq_len)).round(decimals=3).item()
+            return self._cached(
+                "diversity", lambda: (np.sqrt(len(self)) / float(self.top.seq_len)).round(decimals=3).item()
+            )
         else:
             raise ValueError("This is not an alignment")
 
@@ -156,7 +289,7 @@ class SequenceFile(Entity):
     @property
     def meff(self):
         """The number of effective sequences"""
-        return int(sum(self.get_weights()))
+        return self.get_meff_with_id(0.8)
 
     @property
     def nseq(self):
@@ -221,6 +354,215 @@ class SequenceFile(Entity):
         """
         return self.top
 
+    @property
+    def top(self):
+        """The first :obj:`~conkit.core.sequence.Sequence` in the :obj:`~conkit.core.sequencefile.SequenceFile`"""
+        if len(self) > 0:
+            return self[0]
+        else:
+            return None
+
+    @classmethod
+    def from_matrix(cls, id, ids, matrix):
+        """Create a matrix-backed :obj:`~conkit.core.sequencefile.SequenceFile` from an alignment
+
+        Parameters
+        ----------
+        id : str
+           A unique identifier
+        ids : list, tuple
+           The identifier of each sequence
+        matrix : :obj:`~numpy.ndarray`
+           The :math:`N \\times L` matrix of ASCII codes with one row per sequence, used
+           without a copy if it is already a C-contiguous :obj:`numpy.uint8` array
+
+        Returns
+        -------
+        :obj:`~conkit.core.sequencefile.SequenceFile`
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from conkit.core.sequencefile import SequenceFile
+        >>> matrix = np.frombuffer(b"ABCDEFZYXWVU", dtype=np.uint8).reshape(2, 6)
+        >>> sequence_file = SequenceFile.from_matrix("example", ["foo", "bar"], matrix)
+        >>> print(sequence_file)
+        SequenceFile(id="example" nseq=2)
+
+        """
+        from conkit.core.sequencestore import SequenceStore
+
+        sequence_file = cls(id)
+        sequence_file._attach(SequenceStore.from_matrix(ids, matrix))
+        return sequence_file
+
+    def _touch(self):
+        """Record a modification, which drops all cached statistics"""
+        self._cache.clear()
+
+    def _cached(self, key, compute):
+        """Return a cached statistic, computing it if the sequences were modified since"""
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def _check_alignment(self):
+        """True if all sequences have the same length"""
+        seq_length = self.top_sequence.seq_len
+        return all(sequence.seq_len == seq_length for sequence in self)
+
+    def _cached_identities(self):
+        """The cached floating point identity matrix, or ``None`` if there is none for the current sequences"""
+        entry = self._cache.get("identities")
+        if entry is None or entry[0]:
+            return None
+        return entry[2]
+
+    def _copy_with(self, children):
+        """Create a shallow copy of :obj:`~conkit.core.sequencefile.SequenceFile` with its own cache"""
+        shallow = super(SequenceFile, self)._copy_with(children)
+        shallow._cache = {}
+        return shallow
+
+    def _attach(self, store, rows=None):
+        """Replace all sequences with the rows of a :obj:`~conkit.core.sequencestore.SequenceStore`"""
+        Entity.child_list.__set__(self, [])
+        Entity.child_dict.__set__(self, {})
+        self._store = store
+        self._rows = np.arange(len(store), dtype=np.int64) if rows is None else rows
+
+    def _columnar_copy(self, rows, deep):
+        """Create a new matrix-backed :obj:`~conkit.core.sequencefile.SequenceFile` from selected rows"""
+        sequence_file = self.__class__(self.id)
+        sequence_file._remark = copy.deepcopy(self._remark) if deep else self._remark
+        sequence_file._status = self._status
+        sequence_file._attach(self._store.take(rows))
+        return sequence_file
+
+    def _materialize(self):
+        """Convert a matrix-backed :obj:`~conkit.core.sequencefile.SequenceFile` to individual sequences"""
+        store, rows = self._store, self._rows
+        self._store = self._rows = None
+        sequences = store.to_sequences(rows)
+        for sequence in sequences:
+            sequence.parent = self
+        Entity.child_list.__set__(self, sequences)
+        Entity.child_dict.__set__(self, {sequence.id: sequence for sequence in sequences})
+
+    def _view(self, row):
+        """Return the :obj:`~conkit.core.sequencestore.SequenceView` of a row"""
+        view = self._store.view(row)
+        view.parent = self
+        return view
+
+    def _ascii_array(self):
+        """The alignment as :math:`N \\times L` :obj:`numpy.uint8` matrix of ASCII codes"""
+        if self._store is not None:
+            rows = self._rows
+            if rows.shape[0] == len(self._store) and np.array_equal(rows, np.arange(rows.shape[0])):
+                return self._store.matrix
+            return self._store.matrix[rows]
+        sequences = [sequence.seq for sequence in self]
+        buffer = bytearray("".join(sequences), "ascii")
+        return np.frombuffer(buffer, dtype=np.uint8).reshape(len(sequences), len(sequences[0]) if sequences else 0)
+
+    def _encoded_array(self):
+        """The alignment as :math:`N \\times L` :obj:`numpy.uint8` matrix encoded for contact prediction"""
+        from conkit.core.sequencestore import ENCODING
+
+        return ENCODING[self._ascii_array()]
+
+    def _sort(self, kword, reverse):
+        """Sort the :obj:`~conkit.core.sequencefile.SequenceFile`"""
+        if self._store is None:
+            return super(SequenceFile, self)._sort(kword, reverse)
+        sequences = list(self)
+        if any(not hasattr(s, kword) for s in sequences):
+            raise ValueError("Attribute not defined")
+        keys = [getattr(s, kword) for s in sequences]
+        order = sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+        self._rows = self._rows[np.array(order, dtype=np.int64)]
+        self._touch()
+
+    def add(self, entity):
+        """Add a :obj:`~conkit.core.sequence.Sequence` to the :obj:`~conkit.core.sequencefile.SequenceFile`
+
+        Parameters
+        ----------
+        entity : :obj:`~conkit.core.sequence.Sequence`
+
+        """
+        if self._store is not None:
+            self._materialize()
+        super(SequenceFile, self).add(entity)
+
+    def keep(self, selection):
+        """Keep only the selected sequences and remove all others at once
+
+        Parameters
+        ----------
+        selection : list, tuple, :obj:`~numpy.ndarray`
+           Either a boolean mask with one value per sequence in the current order, or
+           the identifiers of the sequences to keep
+
+        Raises
+        ------
+        :exc:`ValueError`
+           Boolean mask does not match the number of sequences
+
+        """
+        if self._store is None:
+            return super(SequenceFile, self).keep(selection)
+        mask = np.asarray(selection)
+        if mask.dtype.kind != "b" or mask.ndim != 1:
+            rows = [self._store.find(id) for id in selection]
+            mask = np.isin(self._rows, [row for row in rows if row is not None])
+        elif mask.shape[0] != len(self):
+            raise ValueError("Boolean mask does not match the number of sequences")
+        for row in self._rows[~mask].tolist():
+            self._store.alive[row] = False
+            view = self._store._views.get(row)
+            if view is not None:
+                view.parent = None
+        self._rows = self._rows[mask]
+        self._touch()
+
+    def remove_many(self, ids):
+        """Remove multiple sequences at once
+
+        Parameters
+        ----------
+        ids : list, tuple
+           The identifiers of the sequences to remove
+
+        Raises
+        ------
+        :exc:`KeyError`
+           Sequence not found
+
+        """
+        if self._store is None:
+            return super(SequenceFile, self).remove_many(ids)
+        rows = []
+        for id in ids:
+            row = self._store.find(id)
+            if row is None:
+                raise KeyError(id)
+            rows.append(row)
+        self.keep(~np.isin(self._rows, rows))
+
+    def copy(self):
+        """Create a shallow copy of :obj:`~conkit.core.sequencefile.SequenceFile`"""
+        if self._store is None:
+            return super(SequenceFile, self).copy()
+        return self._columnar_copy(self._rows, deep=False)
+
+    def deepcopy(self):
+        """Create a deep copy of :obj:`~conkit.core.sequencefile.SequenceFile`"""
+        if self._store is None:
+            return super(SequenceFile, self).deepcopy()
+        return self._columnar_copy(self._rows, deep=True)
+
     @deprecate("0.11", msg="Use calculate_meff_with_identity instead.")
     def calculate_meff(self, identity=0.8):
         """Calculate the number of effective sequences"""
@@ -241,7 +583,56 @@ class SequenceFile(Entity):
         """Calculate the gap frequency in each alignment column"""
         return self.get_frequency("X")
 
-    def get_meff_with_id(self, identity):
+    def cluster(self, identity=0.9, method="greedy", nthreads=None):
+        """Cluster the sequences by sequence identity
+
+        The ``greedy`` method visits the top sequence first, followed by all others in order of
+        decreasing number of residues. Each sequence joins the cluster of the first representative
+        with a sequence identity of at least ``identity``, otherwise it becomes the representative
+        of a new cluster. Identities are calculated over all alignment columns as in :meth:`get_weights`,
+        and read from the cached identity matrix if :meth:`get_identity_matrix` was called before.
+
+        Parameters
+        ----------
+        identity : float, optional
+           The minimum sequence identity to the representative of a cluster [default: 0.9]
+        method : str, optional
+           The clustering method, currently only ``greedy`` [default: greedy]
+        nthreads : int, optional
+           The number of threads [default: all available]
+
+        Returns
+        -------
+        tuple
+           The cluster of every sequence as :obj:`~numpy.ndarray`, and a list of the identifiers
+           of the cluster representatives
+
+        Raises
+        ------
+        :exc:`ValueError`
+           :obj:`~conkit.core.sequencefile.SequenceFile` is not an alignment
+        :exc:`ValueError`
+           Sequence Identity needs to be between 0 and 1
+        :exc:`ValueError`
+           Unknown method
+
+        """
+        if identity < 0 or identity > 1:
+            raise ValueError("Sequence Identity needs to be between 0 and 1")
+        elif method != "greedy":
+            raise ValueError("Unknown method: {}".format(method))
+
+        if self.is_alignment:
+            X = np.ascontiguousarray(self._ascii_array())
+            with np.errstate(invalid="ignore"):
+                identities = 1.0 - np.arange(X.shape[1] + 1) / X.shape[1]
+            max_dist = max(0, int(np.count_nonzero(identities >= identity)) - 1)
+            labels, representatives = self._cluster_greedy(X, max_dist, nthreads)
+            return labels, [self[row].id for row in representatives.tolist()]
+        else:
+            raise ValueError("This is not an alignment")
+
+    def get_meff_with_id(self, identity, method="tiled", nthreads=None, max_memory=None):
         """Calculate the number of effective sequences with specified sequence identity
 
         See Also
@@ -249,9 +640,97 @@ class SequenceFile(Entity):
         meff, get_weights
 
         """
-        return int(sum(self.get_weights(identity=identity)))
+        def compute():
+            weights = self.get_weights(identity=identity, method=method, nthreads=nthreads, max_memory=max_memory)
+            return int(sum(weights))
+
+        return self._cached(("meff", identity), compute)
 
-    def get_weights(self, identity=0.8):
+    def estimate_meff(self, identity=0.8, error=0.05, confidence=0.95, seed=None, nthreads=None):
+        """Estimate the number of effective sequences from a random sample of sequences
+
+        The weight of each sampled sequence is computed exactly against the entire alignment, and
+        :math:`M_{eff}` is estimated as :math:`N` times their mean. The sample grows until the
+        confidence interval is within the requested relative ``error`` of the estimate, so the
+        runtime grows linearly with the number of sequences for a fixed ``error``.
+
+        Parameters
+        ----------
+        identity : float, optional
+           The sequence identity to use for similarity decision [default: 0.8]
+        error : float, optional
+           The maximum half-width of the confidence interval relative to the estimate [default: 0.05]
+        confidence : float, optional
+           The confidence level of the interval [default: 0.95]
+        seed : int, optional
+           The seed for the random sample of sequences
+        nthreads : int, optional
+           The number of threads [default: all available]
+
+        Returns
+        -------
+        tuple
+           The estimated number of effective sequences, and the lower and upper bound of its confidence interval
+
+        Raises
+        ------
+        :exc:`ValueError`
+           :obj:`~conkit.core.sequencefile.SequenceFile` is not an alignment
+        :exc:`ValueError`
+           Sequence Identity needs to be between 0 and 1
+        :exc:`ValueError`
+           Error needs to be greater than 0
+        :exc:`ValueError`
+           Confidence needs to be between 0 and 1
+
+        See Also
+        --------
+        meff, get_meff_with_id
+
+        """
+        if identity < 0 or identity > 1:
+            raise ValueError("Sequence Identity needs to be between 0 and 1")
+        elif error <= 0:
+            raise ValueError("Error needs to be greater than 0")
+        elif confidence <= 0 or confidence >= 1:
+            raise ValueError("Confidence needs to be between 0 and 1")
+
+        if not self.is_alignment:
+            raise ValueError("This is not an alignment")
+
+        from conkit.core.ext.c_sequencefile import c_count_similar
+        from scipy.stats import norm
+
+        X = np.ascontiguousarray(self._ascii_array())
+        nseq = X.shape[0]
+        nthreads = max(1, os.cpu_count() or 1) if nthreads is None else max(1, int(nthreads))
+        z = float(norm.ppf(0.5 + confidence / 2.0))
+        order = np.random.RandomState(seed).permutation(nseq).astype(np.int64)
+
+        weights = np.zeros(0, dtype=np.float64)
+        nsample = min(nseq, SequenceFile._MEFF_SAMPLE)
+        while True:
+            rows = order[weights.shape[0] : nsample]
+            counts = np.zeros(rows.shape[0], dtype=np.int64)
+            c_count_similar(X, rows, identity, counts, nthreads)
+            # Every sequence is similar to itself, even at an identity of 1
+            weights = np.concatenate((weights, 1.0 / np.maximum(counts, 1)))
+            meff = float(nseq * weights.mean())
+            if nsample == nseq:
+                return meff, meff, meff
+            # Weights lie between 1/N and 1, so never trust a sample standard deviation below that of
+            # the sample with one more weight at either bound, e.g. if all sampled weights are equal
+            sd = float(weights.std(ddof=1))
+            sd = max(sd, float(np.concatenate((weights, [1.0 / nseq, 1.0])).std(ddof=1)))
+            # Standard error of the mean with the finite population correction
+            halfwidth = z * nseq * sd / math.sqrt(nsample) * math.sqrt((nseq - nsample) / (nseq - 1.0))
+            if halfwidth <= error * meff:
+                return meff, max(1.0, meff - halfwidth), min(float(nseq), meff + halfwidth)
+            required = (z * sd * nseq / (error * meff)) ** 2
+            required /= 1.0 + required / nseq
+            nsample = min(nseq, max(int(math.ceil(required)), 2 * nsample))
+
+    def get_weights(self, identity=0.8, method="tiled", nthreads=None, max_memory=None):
         """Calculate the sequence weights
 
         This function calculates the sequence weights in the
@@ -263,10 +742,23 @@ class SequenceFile(Entity):
 
            M_{eff}=\\sum_{i}\\frac{1}{\\sum_{j}S_{i,j}}
 
+        The identities are read from the cached identity matrix instead if
+        :meth:`get_identity_matrix` was called before.
+
         Parameters
         ----------
         identity : float, optional
            The sequence identity to use for similarity decision [default: 0.8]
+        method : str, optional
+           The method to compare sequences, either ``tiled`` to compare the ASCII codes of each
+           pair of sequences once, or ``gemm`` to count identical residues with a matrix product
+           of one-hot encoded blocks of sequences [default: tiled]
+        nthreads : int, optional
+           The number of threads used by the ``tiled`` method, the ``gemm`` method uses the threads
+           of the linked BLAS library [default: all available]
+        max_memory : int, optional
+           The maximum number of bytes of working memory, excluding the alignment itself [default: 256 MiB
+           for ``gemm``, unlimited for ``tiled``]
 
         Returns
         -------
@@ -279,18 +771,34 @@ class SequenceFile(Entity):
            :obj:`~conkit.core.sequencefile.SequenceFile` is not an alignment
         :exc:`ValueError`
            Sequence Identity needs to be between 0 and 1
+        :exc:`ValueError`
+           Unknown method
 
         """
         if identity < 0 or identity > 1:
             raise ValueError("Sequence Identity needs to be between 0 and 1")
+        elif method not in ("tiled", "gemm"):
+            raise ValueError("Unknown method: {}".format(method))
 
         if self.is_alignment:
-            from conkit.core.ext.c_sequencefile import c_get_weights
 
-            X = np.array(self.ascii_matrix, dtype=np.int64)
-            hamming = np.zeros(X.shape[0], dtype=np.float64)
-            c_get_weights(X, identity, hamming)
-            return hamming.tolist()
+            def compute():
+                X = self._ascii_array()
+                matrix = self._cached_identities() if X.shape[1] > 0 else None
+                if matrix is not None:
+                    counts = SequenceFile._count_similar_identities(matrix, X.shape[1], identity)
+                else:
+                    if method == "gemm":
+                        counts = SequenceFile._count_similar_gemm(X, identity, max_memory)
+                    else:
+                        counts = SequenceFile._count_similar_tiled(X, identity, nthreads, max_memory)
+                    # Every sequence is similar to itself unless no mismatch is tolerated
+                    counts += 0 < (1.0 - identity) * X.shape[1]
+                with np.errstate(divide="ignore"):
+                    return (1.0 / counts).tolist()
+
+            # The weights do not depend on the method, so they are cached by identity only
+            return list(self._cached(("weights", identity), compute))
         else:
             raise ValueError("This is not an alignment")
 
@@ -309,20 +817,156 @@ class SequenceFile(Entity):
 
         """
         if self.is_alignment:
-            from conkit.core.ext.c_sequencefile import c_get_frequency
-
-            X = np.array(self.encoded_matrix, dtype=np.int64)
             symbol = getattr(AminoAcidMapping, symbol, AminoAcidMapping["X"]).value
-            frequencies = np.zeros(X.shape[1], dtype=np.int64)
-            c_get_frequency(X, symbol, frequencies)
-            return frequencies.tolist()
+            return self._cached(("frequency", symbol), lambda: self.get_profile()[:, symbol - 1].tolist())[:]
+        else:
+            raise ValueError("This is not an alignment")
+
+    def get_identity_matrix(self, percent=False, nthreads=None, max_memory=None, filename=None):
+        """Calculate the pairwise sequence identities of all sequences in the alignment
+
+        The identity of two sequences is the proportion of alignment columns, including gaps, in
+        which they are identical. Each pair is compared once, in parallel blocks of rows. The matrix
+        is cached and read-only until the :obj:`~conkit.core.sequencefile.SequenceFile` is modified,
+        and a cached floating point matrix is reused by :meth:`get_weights` and :meth:`filter`. Only the
+        most recently requested matrix is cached, and it replaces any other one.
+
+        Parameters
+        ----------
+        percent : bool, optional
+           Return the identities as :obj:`numpy.uint8` percentages rounded to the nearest integer
+           instead of :obj:`numpy.float32` values [default: False]
+        nthreads : int, optional
+           The number of threads [default: all available]
+        max_memory : int, optional
+           The maximum number of bytes of a matrix held in memory, larger matrices are
+           stored in a memory-mapped file [default: 1 GiB]
+        filename : str, optional
+           The memory-mapped file to store the matrix in regardless of its size, otherwise a
+           temporary file is created when needed [default: None]
+
+        Returns
+        -------
+        :obj:`~numpy.ndarray`, :obj:`~numpy.memmap`
+           The symmetric :math:`N \\times N` identity matrix
+
+        Raises
+        ------
+        :exc:`ValueError`
+           :obj:`~conkit.core.sequencefile.SequenceFile` is not an alignment
+
+        """
+        if self.is_alignment:
+
+            def compute():
+                from conkit.core.ext.c_sequencefile import c_get_identities
+
+                X = np.ascontiguousarray(self._ascii_array())
+                nseq, seq_len = X.shape
+                values = SequenceFile._identity_values(seq_len, percent)
+                limit = SequenceFile._IDENTITY_MEMORY if max_memory is None else int(max_memory)
+                if filename is not None or nseq * nseq * values.itemsize > limit:
+                    target = tempfile.TemporaryFile() if filename is None else filename
+                    matrix = np.memmap(target, dtype=values.dtype, mode="w+", shape=(nseq, nseq))
+                else:
+                    matrix = np.empty((nseq, nseq), dtype=values.dtype)
+                threads = max(1, os.cpu_count() or 1) if nthreads is None else max(1, int(nthreads))
+                tile = max(1, min(nseq, SequenceFile._TILE_BYTES // max(1, seq_len)))
+                block = max(tile, SequenceFile._IDENTITY_BLOCK_BYTES // max(1, 4 * nseq))
+                for start in range(0, nseq, block):
+                    stop = min(start + block, nseq)
+                    distances = np.empty((stop - start, nseq - start), dtype=np.int32)
+                    c_get_identities(X, start, tile, distances, threads)
+                    square = distances[:, : stop - start]
+                    square[...] = np.triu(square) + np.triu(square, 1).T
+                    identities = values[distances]
+                    matrix[start:stop, start:] = identities
+                    matrix[stop:, start:stop] = identities[:, stop - start :].T
+                if isinstance(matrix, np.memmap):
+                    matrix.flush()
+                matrix.flags.writeable = False
+                return matrix
+
+            key = (bool(percent), filename)
+            entry = self._cache.get("identities")
+            if entry is not None and entry[:2] == key:
+                return entry[2]
+            # Only one identity matrix is cached, so release the previous one before computing another
+            del entry
+            self._cache.pop("identities", None)
+            matrix = compute()
+            self._cache["identities"] = key + (matrix,)
+            return matrix
         else:
             raise ValueError("This is not an alignment")
 
-    def filter(self, min_id=0.3, max_id=0.9, inplace=False):
+    def get_profile(self, weights=None, normalize=False, nthreads=None):
+        """Calculate the amino acid profile of the Multiple Sequence Alignment
+
+        All symbols of all columns are counted in a single pass over the alignment.
+
+        Parameters
+        ----------
+        weights : list, tuple, :obj:`~numpy.ndarray`, optional
+           A weight per sequence, e.g. from :meth:`~conkit.core.sequencefile.SequenceFile.get_weights` [default: 1]
+        normalize : bool, optional
+           Divide the counts in each column by their total to return frequencies [default: False]
+        nthreads : int, optional
+           The number of threads [default: all available]
+
+        Returns
+        -------
+        :obj:`~numpy.ndarray`
+           A :math:`L \\times 21` matrix with the (weighted) count or frequency of each symbol in each
+           alignment column, with one column per :obj:`~conkit.core.mappings.AminoAcidMapping` value in
+           ascending order, i.e. the last column counts gaps and unknown residues
+
+        Raises
+        ------
+        :exc:`ValueError`
+           :obj:`~conkit.core.sequencefile.SequenceFile` is not an alignment
+        :exc:`ValueError`
+           Weights do not match the number of sequences
+
+        """
+        if not self.is_alignment:
+            raise ValueError("This is not an alignment")
+
+        def compute():
+            from conkit.core.ext.c_sequencefile import c_get_profile
+            from conkit.core.sequencestore import ENCODING
+
+            X = np.ascontiguousarray(self._ascii_array())
+            if weights is None:
+                w = np.ones(X.shape[0], dtype=np.float64)
+            else:
+                w = np.ascontiguousarray(weights, dtype=np.float64)
+                if w.shape != (X.shape[0],):
+                    raise ValueError("Weights do not match the number of sequences")
+            # Small alignments are not worth the per-thread profiles
+            threads = max(1, os.cpu_count() or 1) if nthreads is None else max(1, int(nthreads))
+            threads = max(1, min(threads, X.shape[0] // 1024))
+            profiles = np.zeros((threads, X.shape[1], len(AminoAcidMapping) + 1), dtype=np.float64)
+            c_get_profile(X, ENCODING, w, profiles)
+            return profiles.sum(axis=0)[:, 1:]
+
+        if weights is None:
+            profile = self._cached("profile", lambda: compute().astype(np.int64)).copy()
+        else:
+            profile = compute()
+        if normalize:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                profile = profile / profile.sum(axis=1, keepdims=True)
+        return profile
+
+    def filter(self, min_id=0.3, max_id=0.9, inplace=False, nthreads=None):
         """Filter sequences from an alignment according to the minimum and maximum identity
         between the sequences
 
+        A sequence is removed if its identity to any preceding sequence is outside
+        the range given by ``min_id`` and ``max_id``. The identities are read from the
+        cached identity matrix if :meth:`get_identity_matrix` was called before.
+
         Parameters
         ----------
         min_id : float, optional
@@ -331,6 +975,8 @@ class SequenceFile(Entity):
            Maximum sequence identity
         inplace : bool, optional
            Replace the saved order of sequences [default: False]
+        nthreads : int, optional
+           The number of threads [default: all available]
 
         Returns
         -------
@@ -355,13 +1001,23 @@ class SequenceFile(Entity):
         if self.is_alignment:
             from conkit.core.ext.c_sequencefile import c_filter
 
-            X = np.array(self.ascii_matrix, dtype=np.int64)
-            throwables = np.full(X.shape[0], False, dtype=np.bool)
-            c_filter(X, min_id, max_id, throwables)
+            X = np.ascontiguousarray(self._ascii_array())
+            nthreads = max(1, os.cpu_count() or 1) if nthreads is None else max(1, int(nthreads))
+            # The identities are evaluated exactly as before for every possible distance, and their
+            # monotonicity turns the identity range into a range of distances
+            with np.errstate(invalid="ignore"):
+                identities = 1.0 - np.arange(X.shape[1] + 1) / X.shape[1]
+            distances = np.flatnonzero(~((identities < min_id) | (identities > max_id)))
+            min_dist, max_dist = (distances[0], distances[-1]) if distances.size else (X.shape[1] + 1, -1)
+            matrix = self._cached_identities() if X.shape[1] > 0 else None
+            if matrix is not None:
+                throwables = SequenceFile._filter_identities(matrix, X.shape[1], min_dist, max_dist)
+            else:
+                alphabet, nsymbols = SequenceFile._alphabet(X)
+                throwables = np.full(X.shape[0], False, dtype=np.bool_)
+                c_filter(X, alphabet, nsymbols, min_dist, max_dist, throwables, nthreads)
             filtered = self._inplace(inplace)
-            for i, sequence in enumerate(self):
-                if throwables[i]:
-                    filtered.remove(sequence.id)
+            filtered.keep(~throwables)
             return filtered
         else:
             raise ValueError("This is not an alignment")
@@ -403,18 +1059,225 @@ class SequenceFile(Entity):
         if self.is_alignment:
             from conkit.core.ext.c_sequencefile import c_filter_symbol
 
-            X = np.array(self.encoded_matrix, dtype=np.int64)
+            X = self._encoded_array()
             symbol = getattr(AminoAcidMapping, symbol, AminoAcidMapping["X"]).value
             throwables = np.full(X.shape[0], False, dtype=np.bool)
             c_filter_symbol(X, min_prop, max_prop, symbol, throwables)
             filtered = self._inplace(inplace)
-            for i, sequence in enumerate(self):
-                if throwables[i]:
-                    filtered.remove(sequence.id)
+            filtered.keep(~throwables)
             return filtered
         else:
             raise ValueError("This is not an alignment")
 
+    def filter_columns(self, max_prop=1.0, query_gaps=True, inplace=False):
+        """Remove alignment columns with too many gaps
+
+        Parameters
+        ----------
+        max_prop : float, optional
+           Maximum allowed gap proportion in a column [default: 1.0]
+        query_gaps : bool, optional
+           Remove all columns with a gap in the top sequence [default: True]
+        inplace : bool, optional
+           Replace the saved alignment columns [default: False]
+
+        Returns
+        -------
+        :obj:`~conkit.core.sequencefile.SequenceFile`
+           The reference to the :obj:`~conkit.core.sequencefile.SequenceFile`, regardless of inplace
+
+        Raises
+        ------
+        :exc:`ValueError`
+           :obj:`~conkit.core.sequencefile.SequenceFile` is not an alignment
+        :exc:`ValueError`
+           Maximum gap proportion needs to be between 0 and 1
+
+        """
+        if not 0.0 <= max_prop <= 1.0:
+            raise ValueError("Maximum gap proportion needs to be between 0 and 1")
+
+        if self.is_alignment:
+            X = self._ascii_array()
+            gaps = X == ord("-")
+            mask = np.count_nonzero(gaps, axis=0) <= max_prop * X.shape[0]
+            if query_gaps:
+                mask &= ~gaps[0]
+            return self.keep_columns(mask, inplace=inplace)
+        else:
+            raise ValueError("This is not an alignment")
+
+    def filter_coverage(self, min_cov=0.0, inplace=False):
+        """Remove sequences covering too few residues of the top sequence
+
+        The coverage of a sequence is the proportion of non-gap positions in the top
+        sequence that are aligned to a residue rather than a gap.
+
+        Parameters
+        ----------
+        min_cov : float, optional
+           Minimum coverage of the top sequence [default: 0.0]
+        inplace : bool, optional
+           Replace the saved order of sequences [default: False]
+
+        Returns
+        -------
+        :obj:`~conkit.core.sequencefile.SequenceFile`
+           The reference to the :obj:`~conkit.core.sequencefile.SequenceFile`, regardless of inplace
+
+        Raises
+        ------
+        :exc:`ValueError`
+           :obj:`~conkit.core.sequencefile.SequenceFile` is not an alignment
+        :exc:`ValueError`
+           Minimum coverage needs to be between 0 and 1
+
+        """
+        if not 0.0 <= min_cov <= 1.0:
+            raise ValueError("Minimum coverage needs to be between 0 and 1")
+
+        if self.is_alignment:
+            X = self._ascii_array()
+            gap = ord("-")
+            query = X[0] != gap
+            covered = np.count_nonzero(X[:, query] != gap, axis=1)
+            filtered = self._inplace(inplace)
+            filtered.keep(covered >= min_cov * np.count_nonzero(query))
+            return filtered
+        else:
+            raise ValueError("This is not an alignment")
+
+    def keep_columns(self, selection, inplace=False):
+        """Keep only the selected alignment columns
+
+        Parameters
+        ----------
+        selection : list, tuple, slice, :obj:`~numpy.ndarray`
+           Either a boolean mask with one value per column, the zero-based indexes
+           of the columns to keep or a :obj:`slice`
+        inplace : bool, optional
+           Replace the saved alignment columns [default: False]
+
+        Returns
+        -------
+        :obj:`~conkit.core.sequencefile.SequenceFile`
+           The reference to the :obj:`~conkit.core.sequencefile.SequenceFile`, regardless of inplace
+
+        Raises
+        ------
+        :exc:`ValueError`
+           :obj:`~conkit.core.sequencefile.SequenceFile` is not an alignment
+        :exc:`ValueError`
+           Boolean mask does not match the number of columns
+
+        """
+        if not self.is_alignment:
+            raise ValueError("This is not an alignment")
+        if not isinstance(selection, slice):
+            selection = np.asarray(selection)
+            if selection.dtype.kind == "b" and selection.shape != (self.top_sequence.seq_len,):
+                raise ValueError("Boolean mask does not match the number of columns")
+            selection = selection.astype(np.int64) if selection.dtype.kind != "b" else selection
+        sequence_file = self._inplace(inplace)
+        if sequence_file._store is not None:
+            store = sequence_file._store
+            store.matrix = np.ascontiguousarray(store.matrix[:, selection])
+        elif len(sequence_file) > 0:
+            X = np.ascontiguousarray(sequence_file._ascii_array()[:, selection])
+            # All sequences are decoded at once and only sliced per sequence
+            text, seq_len = X.tobytes().decode("ascii"), X.shape[1]
+            for i, sequence in enumerate(sequence_file):
+                sequence._seq = text[i * seq_len : (i + 1) * seq_len]
+                sequence._seq_array = None
+        sequence_file._touch()
+        return sequence_file
+
+    def reduce_to(self, nseq=None, meff=None, identity=0.8, inplace=False, nthreads=None):
+        """Reduce the redundancy of the alignment to a number of sequences or effective sequences
+
+        The alignment is reduced to the representatives of the ``greedy`` clusters of :meth:`cluster`.
+        The maximum distance to a representative is bisected to find the highest clustering identity
+        that leaves at most ``nseq`` sequences, or the lowest clustering identity whose representatives
+        still have at least ``meff`` effective sequences. The top sequence is always kept.
+
+        Parameters
+        ----------
+        nseq : int, optional
+           The maximum number of sequences to keep
+        meff : int, optional
+           The minimum number of effective sequences to keep
+        identity : float, optional
+           The sequence identity used to calculate the number of effective sequences [default: 0.8]
+        inplace : bool, optional
+           Replace the saved order of sequences [default: False]
+        nthreads : int, optional
+           The number of threads [default: all available]
+
+        Returns
+        -------
+        :obj:`~conkit.core.sequencefile.SequenceFile`
+           The reference to the :obj:`~conkit.core.sequencefile.SequenceFile`, regardless of inplace
+
+        Raises
+        ------
+        :exc:`ValueError`
+           :obj:`~conkit.core.sequencefile.SequenceFile` is not an alignment
+        :exc:`ValueError`
+           Provide either the number of sequences or the number of effective sequences
+        :exc:`ValueError`
+           Number of sequences needs to be at least 1
+
+        """
+        if (nseq is None) == (meff is None):
+            raise ValueError("Provide either the number of sequences or the number of effective sequences")
+        elif nseq is not None and nseq < 1:
+            raise ValueError("Number of sequences needs to be at least 1")
+
+        if self.is_alignment:
+            X = np.ascontiguousarray(self._ascii_array())
+            clusterings = {}
+
+            def representatives(max_dist):
+                if max_dist not in clusterings:
+                    clusterings[max_dist] = self._cluster_greedy(X, max_dist, nthreads)[1]
+                return clusterings[max_dist]
+
+            def effective(max_dist):
+                rows = np.sort(representatives(max_dist))
+                counts = SequenceFile._count_similar_tiled(X[rows], identity, nthreads, None)
+                counts += 0 < (1.0 - identity) * X.shape[1]
+                with np.errstate(divide="ignore"):
+                    return int(sum((1.0 / counts).tolist()))
+
+            # Fewer sequences are kept as the maximum distance grows, and a maximum distance of -1 keeps all
+            if nseq is not None:
+                lower, upper = -1, -1 if len(self) <= nseq else X.shape[1]
+                while upper - lower > 1:
+                    middle = (lower + upper) // 2
+                    if representatives(middle).shape[0] <= nseq:
+                        upper = middle
+                    else:
+                        lower = middle
+                max_dist = upper
+            else:
+                lower, upper = -1, X.shape[1] + 1
+                while upper - lower > 1:
+                    middle = (lower + upper) // 2
+                    if effective(middle) >= meff:
+                        lower = middle
+                    else:
+                        upper = middle
+                max_dist = lower
+            keep = np.ones(X.shape[0], dtype=np.bool_)
+            if max_dist >= 0:
+                keep[:] = False
+                keep[representatives(max_dist)] = True
+            reduced = self._inplace(inplace)
+            reduced.keep(keep)
+            return reduced
+        else:
+            raise ValueError("This is not an alignment")
+
     def sort(self, kword, reverse=False, inplace=False):
         """Sort the :obj:`~conkit.core.sequencefile.SequenceFile`
 
@@ -442,6 +1305,131 @@ class SequenceFile(Entity):
         sequence_file._sort(kword, reverse)
         return sequence_file
 
+    @staticmethod
+    def _identity_values(seq_len, percent):
+        """The identity matrix entry for every possible distance between two sequences"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            identities = 1.0 - np.arange(seq_len + 1) / seq_len
+        if percent:
+            return np.rint(identities * 100).astype(np.uint8)
+        return identities.astype(np.float32)
+
+    @staticmethod
+    def _count_similar_identities(identities, seq_len, identity):
+        """Count the similar sequences of every sequence, including itself, in an identity matrix"""
+        nseq = identities.shape[0]
+        counts = np.zeros(nseq, dtype=np.int64)
+        # Entries decrease with the distance, so the largest similar distance gives the smallest similar entry
+        max_dist = math.ceil((1.0 - identity) * seq_len) - 1
+        if max_dist >= 0:
+            threshold = SequenceFile._identity_values(seq_len, False)[min(max_dist, seq_len)]
+            block = max(1, SequenceFile._IDENTITY_BLOCK_BYTES // max(1, identities.itemsize * nseq))
+            for start in range(0, nseq, block):
+                counts[start : start + block] = np.count_nonzero(identities[start : start + block] >= threshold, axis=1)
+        return counts
+
+    @staticmethod
+    def _filter_identities(identities, seq_len, min_dist, max_dist):
+        """Find the sequences whose distance to any preceding sequence is outside a range in an identity matrix"""
+        nseq = identities.shape[0]
+        throwables = np.zeros(nseq, dtype=np.bool_)
+        if min_dist > max_dist:
+            throwables[1:] = True
+            return throwables
+        values = SequenceFile._identity_values(seq_len, False)
+        lower, upper = values[max_dist], values[min_dist]
+        block = max(1, SequenceFile._IDENTITY_BLOCK_BYTES // max(1, identities.itemsize * nseq))
+        for start in range(0, nseq, block):
+            stop = min(start + block, nseq)
+            preceding = identities[start:stop, :stop]
+            outside = (preceding < lower) | (preceding > upper)
+            outside &= np.arange(stop) < np.arange(start, stop)[:, np.newaxis]
+            throwables[start:stop] = outside.any(axis=1)
+        return throwables
+
+    @staticmethod
+    def _alphabet(X):
+        """Map the ASCII codes present in an alignment matrix to consecutive symbols"""
+        present = np.zeros(256, dtype=np.bool_)
+        present[X.ravel()] = True
+        return (np.cumsum(present) - 1).astype(np.int32), int(present.sum())
+
+    def _cluster_greedy(self, X, max_dist, nthreads):
+        """Greedily cluster the rows of an alignment matrix, return the cluster of every row and the representatives"""
+        nseq = X.shape[0]
+        labels = np.empty(nseq, dtype=np.int64)
+        residues = np.count_nonzero(X != ord("-"), axis=1)
+        residues[:1] = X.shape[1] + 1
+        order = np.argsort(-residues, kind="stable").astype(np.int64)
+        matrix = self._cached_identities() if X.shape[1] > 0 else None
+        if matrix is not None:
+            threshold = SequenceFile._identity_values(X.shape[1], False)[min(max_dist, X.shape[1])]
+            representatives = []
+            for row in order.tolist():
+                hits = np.flatnonzero(matrix[row, representatives] >= threshold) if representatives else ()
+                if len(hits) > 0:
+                    labels[row] = hits[0]
+                else:
+                    labels[row] = len(representatives)
+                    representatives.append(row)
+            return labels, np.array(representatives, dtype=np.int64)
+
+        from conkit.core.ext.c_sequencefile import c_cluster
+
+        alphabet, nsymbols = SequenceFile._alphabet(X)
+        nthreads = max(1, os.cpu_count() or 1) if nthreads is None else max(1, int(nthreads))
+        c_cluster(X, order, alphabet, nsymbols, max_dist, labels, SequenceFile._CLUSTER_BATCH, nthreads)
+        # The representative of a cluster is its first row in visiting order
+        first = np.unique(labels[order], return_index=True)[1]
+        return labels, order[first]
+
+    @staticmethod
+    def _count_similar_tiled(X, identity, nthreads, max_memory):
+        """Count the similar sequences of every sequence by comparing the ASCII codes of each pair once"""
+        from conkit.core.ext.c_sequencefile import c_get_weights
+
+        nseq, seq_len = X.shape
+        nthreads = max(1, os.cpu_count() or 1) if nthreads is None else max(1, int(nthreads))
+        if max_memory is not None:
+            # Every thread accumulates into its own row of counts
+            nthreads = max(1, min(nthreads, int(max_memory) // max(1, 4 * nseq)))
+        counts = np.zeros((nthreads, nseq), dtype=np.int32)
+        tile = max(1, min(nseq, SequenceFile._TILE_BYTES // max(1, seq_len)))
+        c_get_weights(np.ascontiguousarray(X), identity, counts, tile, nthreads)
+        return counts.sum(axis=0, dtype=np.int64)
+
+    @staticmethod
+    def _count_similar_gemm(X, identity, max_memory):
+        """Count the similar sequences of every sequence with matrix products of one-hot encoded blocks"""
+        nseq, seq_len = X.shape
+        counts = np.zeros(nseq, dtype=np.int64)
+        if nseq == 0 or seq_len == 0:
+            return counts
+        # Distances are integers, so d < threshold is equivalent to a minimum number of identical residues
+        min_identical = seq_len - (math.ceil((1.0 - identity) * seq_len) - 1)
+        alphabet = np.unique(X)
+        width = seq_len * alphabet.shape[0]
+        max_memory = SequenceFile._GEMM_MEMORY if max_memory is None else int(max_memory)
+        # Two float32 one-hot blocks, their float32 product and the boolean similarity mask
+        block = int((math.sqrt(64 * width ** 2 + 20 * max_memory) - 8 * width) / 10)
+        block = max(1, min(nseq, block))
+
+        def onehot(start):
+            rows = X[start : start + block]
+            return (rows[:, :, np.newaxis] == alphabet).reshape(rows.shape[0], width).astype(np.float32)
+
+        for i in range(0, nseq, block):
+            a = onehot(i)
+            for j in range(i, nseq, block):
+                b = a if i == j else onehot(j)
+                similar = np.dot(a, b.T) >= min_identical
+                if i == j:
+                    np.fill_diagonal(similar, False)
+                counts[i : i + a.shape[0]] += similar.sum(axis=1)
+                if i != j:
+                    counts[j : j + b.shape[0]] += similar.sum(axis=0)
+        return counts
+
     def to_string(self):
         """Return the :obj:`~conkit.core.sequencefile.SequenceFile` as :obj:`str`"""
         content = [s.seq for s in self]
@@ -465,13 +1453,8 @@ class SequenceFile(Entity):
            The reference to the :obj:`~conkit.core.sequencefile.SequenceFile`, regardless of inplace
 
         """
-        sequence_file = self._inplace(inplace)
         if self.is_alignment:
-            i = start - 1
-            j = end
-            for sequence in sequence_file:
-                sequence.seq = sequence.seq[i:j]
-            return sequence_file
+            return self.keep_columns(slice(start - 1, end), inplace=inplace)
         else:
             raise ValueError("This is not an alignment")
 
@@ -485,9 +1468,9 @@ class SequenceFile(Entity):
         """
         sstream = "Summary for {id}{nline}"
         sstream += "-------------------------------{nline}"
-        sstream += "Alignment:{tab}{tab}{is_alignment}"
-        sstream += "Number of sequences:{tab}{nseq}{nline}" % self.nseq
-        sstream += "Alignment depth (0.8):{tab}{meff}{nline}" % self.meff
+        sstream += "Alignment:{tab}{tab}{is_alignment}{nline}"
+        sstream += "Number of sequences:{tab}{nseq}{nline}"
+        sstream += "Alignment depth (0.8):{tab}{meff}{nline}"
         return sstream.format(
             id=self.id, is_alignment=self.is_alignment, tab="\t", nline="\n", nseq=self.nseq, meff=self.meff
         )
@@ -0,0 +1,379 @@
+# coding=utf-8
+#
+# BSD 3-Clause License
+#
+# Copyright (c) 2016-19, University of Liverpool
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Matrix storage backend for :obj:`~conkit.core.sequencefile.SequenceFile` alignments"""
+
+from __future__ import division
+from __future__ import print_function
+
+__author__ = "Felix Simkovic"
+__date__ = "16 Oct 2026"
+__version__ = "1.0"
+
+import numpy as np
+import weakref
+
+from conkit.core.sequence import ENCODING_TABLE, VALID_CHARACTERS, Sequence
+
+# Lookup tables indexed by ASCII code
+VALID = np.zeros(256, dtype=np.bool_)
+VALID[np.frombuffer(VALID_CHARACTERS, dtype=np.uint8)] = True
+ENCODING = np.frombuffer(ENCODING_TABLE, dtype=np.uint8)
+
+
+class SequenceStore(object):
+    """Contiguous matrix storage for the sequences of an alignment
+
+    All sequences are held as ASCII codes in a single C-contiguous :obj:`numpy.uint8` matrix
+    with one row per sequence. Rows are never re-ordered or deleted once the store is created,
+    which allows :obj:`~conkit.core.sequencestore.SequenceView` instances to keep a stable
+    reference to their row. The owning :obj:`~conkit.core.sequencefile.SequenceFile` keeps
+    track of the order and membership of the rows.
+
+    Attributes
+    ----------
+    alive : :obj:`~numpy.ndarray`
+       A boolean mask of rows still present in the owning :obj:`~conkit.core.sequencefile.SequenceFile`
+    ids : list
+       The sequence identifier of each row
+    matrix : :obj:`~numpy.ndarray`
+       The :math:`N \\times L` matrix of ASCII codes
+    remarks : dict
+       The remarks of each row with at least one remark
+
+    """
+
+    __slots__ = ["matrix", "ids", "alive", "remarks", "_index", "_views"]
+
+    def __init__(self, ids, matrix):
+        """Initialise a new store without validating its content
+
+        Parameters
+        ----------
+        ids : list, tuple
+           The sequence identifier of each row
+        matrix : :obj:`~numpy.ndarray`
+           The C-contiguous :obj:`numpy.uint8` matrix of ASCII codes
+
+        """
+        self.__setstate__({"ids": list(ids), "matrix": matrix, "remarks": {}})
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in ("matrix", "ids", "alive", "remarks")}
+
+    def __len__(self):
+        return self.matrix.shape[0]
+
+    def __repr__(self):
+        return "{}(nseq={}, seq_len={})".format(self.__class__.__name__, *self.matrix.shape)
+
+    def __setstate__(self, state):
+        state.setdefault("alive", np.ones(len(state["ids"]), dtype=np.bool_))
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._index = None
+        self._views = weakref.WeakValueDictionary()
+
+    @classmethod
+    def from_matrix(cls, ids, matrix):
+        """Create a new store from an alignment matrix
+
+        Parameters
+        ----------
+        ids : list, tuple
+           The sequence identifier of each row
+        matrix : :obj:`~numpy.ndarray`
+           The :math:`N \\times L` matrix of ASCII codes, used without a copy if it is
+           already a C-contiguous :obj:`numpy.uint8` array. A read-only matrix is copied
+           the first time a sequence is modified
+
+        Returns
+        -------
+        :obj:`~conkit.core.sequencestore.SequenceStore`
+
+        Raises
+        ------
+        :exc:`TypeError`
+           Please provide data type of str, list, or tuple
+        :exc:`ValueError`
+           Alignment matrix needs to be two-dimensional with one row per identifier
+        :exc:`ValueError`
+           Unrecognized amino acids in sequence
+        :exc:`ValueError`
+           Identifier defined twice
+
+        """
+        matrix = np.ascontiguousarray(matrix, dtype=np.uint8)
+        ids = [tuple(id) if isinstance(id, list) else id for id in ids]
+        if matrix.ndim != 2 or matrix.shape[0] != len(ids):
+            raise ValueError("Alignment matrix needs to be two-dimensional with one row per identifier")
+        if any(isinstance(id, (float, int)) for id in ids):
+            raise TypeError("Please provide data type of str, list, or tuple")
+        # Validate in chunks of rows to avoid a temporary the size of the entire matrix
+        chunk = max(1, (1 << 22) // max(1, matrix.shape[1]))
+        for i in range(0, matrix.shape[0], chunk):
+            if not VALID[matrix[i : i + chunk]].all():
+                raise ValueError("Unrecognized amino acids in sequence")
+        store = cls(ids, matrix)
+        if len(store._get_index()) != len(ids):
+            seen = set()
+            for id in ids:
+                if id in seen:
+                    raise ValueError("%s defined twice" % str(id))
+                seen.add(id)
+        return store
+
+    @classmethod
+    def from_sequences(cls, sequences):
+        """Create a new store from aligned :obj:`~conkit.core.sequence.Sequence` instances
+
+        Parameters
+        ----------
+        sequences : list, tuple, :obj:`~conkit.core.sequencefile.SequenceFile`
+
+        Returns
+        -------
+        :obj:`~conkit.core.sequencestore.SequenceStore`
+
+        Raises
+        ------
+        :exc:`ValueError`
+           This is not an alignment
+
+        """
+        sequences = list(sequences)
+        seq_len = len(sequences[0]) if sequences else 0
+        if any(len(s) != seq_len for s in sequences):
+            raise ValueError("This is not an alignment")
+        buffer = bytearray("".join(s.seq for s in sequences), "ascii")
+        matrix = np.frombuffer(buffer, dtype=np.uint8).reshape(len(sequences), seq_len)
+        store = cls([s.id for s in sequences], matrix)
+        store.remarks = {i: list(s.remark) for i, s in enumerate(sequences) if s.remark}
+        return store
+
+    def _get_index(self):
+        """The mapping of identifiers to rows"""
+        if self._index is None:
+            self._index = {id: row for row, id in enumerate(self.ids)}
+        return self._index
+
+    def find(self, id):
+        """Find the row of an alive sequence with the given id
+
+        Parameters
+        ----------
+        id : str
+           The sequence identifier
+
+        Returns
+        -------
+        int, None
+           The row index or :obj:`None` if not found
+
+        """
+        try:
+            row = self._get_index().get(id)
+        except TypeError:
+            return None
+        if row is not None and self.alive[row]:
+            return row
+        return None
+
+    def _writable(self):
+        """Return a matrix that is safe to modify, copying it first if it is read-only"""
+        if not self.matrix.flags.writeable:
+            self.matrix = self.matrix.copy()
+        return self.matrix
+
+    def set_id(self, row, id):
+        """Set the identifier of a row"""
+        self.ids[row] = id
+        self._index = None
+
+    def take(self, rows):
+        """Create a new compact store from selected rows
+
+        Parameters
+        ----------
+        rows : :obj:`~numpy.ndarray`
+           The row indices to copy in order
+
+        Returns
+        -------
+        :obj:`~conkit.core.sequencestore.SequenceStore`
+
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        store = SequenceStore([self.ids[row] for row in rows.tolist()], self.matrix[rows])
+        store.remarks = {i: list(self.remarks[row]) for i, row in enumerate(rows.tolist()) if self.remarks.get(row)}
+        return store
+
+    def copy(self):
+        """Create a copy of the store"""
+        return self.take(np.arange(len(self)))
+
+    def view(self, row):
+        """Return the :obj:`~conkit.core.sequencestore.SequenceView` for a row
+
+        Views are cached for as long as they are referenced elsewhere, which
+        guarantees that the same row always returns the same object.
+
+        """
+        view = self._views.get(row)
+        if view is None:
+            view = SequenceView(self, row)
+            self._views[row] = view
+        return view
+
+    def to_sequences(self, rows, detach=True):
+        """Convert rows to standalone :obj:`~conkit.core.sequence.Sequence` instances
+
+        Parameters
+        ----------
+        rows : :obj:`~numpy.ndarray`
+           The row indices to convert in order
+        detach : bool, optional
+           Detach any view on one of the rows that is still referenced elsewhere
+           and return it instead of a new instance [default: True]
+
+        Returns
+        -------
+        list
+           A list of :obj:`~conkit.core.sequence.Sequence` instances
+
+        """
+        sequences = []
+        for row in np.asarray(rows, dtype=np.int64).tolist():
+            view = self._views.get(row) if detach else None
+            if view is not None:
+                view.detach()
+                sequences.append(view)
+                continue
+            sequence = Sequence.__new__(Sequence)
+            sequence.parent = None
+            sequence.child_list = []
+            sequence.child_dict = {}
+            sequence._id = self.ids[row]
+            sequence._seq = self.matrix[row].tobytes().decode("ascii")
+            sequence._seq_array = None
+            sequence._remark = list(self.remarks.get(row, []))
+            sequences.append(sequence)
+        return sequences
+
+
+class SequenceView(Sequence):
+    """A :obj:`~conkit.core.sequence.Sequence` backed by a row in a :obj:`~conkit.core.sequencestore.SequenceStore`
+
+    All reads and writes go straight to the underlying matrix, so any public attribute
+    or method of :obj:`~conkit.core.sequence.Sequence` behaves identically. Assigning a
+    sequence of a different length converts the owning :obj:`~conkit.core.sequencefile.SequenceFile`
+    back to individual :obj:`~conkit.core.sequence.Sequence` instances first. Copies of a view
+    are standalone :obj:`~conkit.core.sequence.Sequence` instances.
+
+    """
+
+    # No __slots__ here: the inherited ones must stay visible through ``self.__slots__``
+
+    def __init__(self, store, row):
+        self._store = store
+        self._row = row
+        self.parent = None
+        self.child_list = []
+        self.child_dict = {}
+
+    def __len__(self):
+        """The sequence length"""
+        return self._store.matrix.shape[1]
+
+    @property
+    def _id(self):
+        return self._store.ids[self._row]
+
+    @_id.setter
+    def _id(self, id):
+        self._store.set_id(self._row, id)
+
+    @property
+    def _remark(self):
+        return self._store.remarks.setdefault(self._row, [])
+
+    @_remark.setter
+    def _remark(self, remark):
+        self._store.remarks[self._row] = remark
+
+    @property
+    def _seq(self):
+        return self._store.matrix[self._row].tobytes().decode("ascii")
+
+    @_seq.setter
+    def _seq(self, seq):
+        encoded = np.frombuffer(seq.encode("ascii"), dtype=np.uint8)
+        if encoded.shape[0] != len(self):
+            # The alignment no longer holds, so it is converted to individual sequences
+            parent = self.parent
+            if parent is not None and getattr(parent, "_store", None) is self._store:
+                parent._materialize()
+            if self._row in self._store._views:
+                self.detach()
+            self._store.matrix = encoded.reshape(1, -1).copy()
+        else:
+            self._store._writable()[self._row] = encoded
+
+    @property
+    def seq_ascii(self):
+        """The protein sequence as ASCII-encoded :obj:`str`"""
+        return bytearray(self._store.matrix[self._row].tobytes())
+
+    @property
+    def seq_array(self):
+        """The protein sequence as read-only :obj:`numpy.uint8` array of ASCII codes, viewing the matrix row"""
+        array = self._store.matrix[self._row]
+        array.flags.writeable = False
+        return array
+
+    @property
+    def seq_encoded(self):
+        """The protein sequence encoded by numbers"""
+        return ENCODING[self._store.matrix[self._row]].tolist()
+
+    def copy(self):
+        """Create a standalone :obj:`~conkit.core.sequence.Sequence` copy"""
+        return self._store.to_sequences([self._row], detach=False)[0]
+
+    def deepcopy(self):
+        """Create a standalone :obj:`~conkit.core.sequence.Sequence` copy"""
+        return self.copy()
+
+    def detach(self):
+        """Move the view onto a private single-row store"""
+        self._store._views.pop(self._row, None)
+        self._store = self._store.take([self._row])
+        self._row = 0
@@ -5,13 +5,6 @@ __date__ = "12 Aug 2016"
 
 import unittest
 
-try:
-    import sklearn.neighbors
-
-    SKLEARN = True
-except ImportError:
-    SKLEARN = False
-
 from conkit.core.struct import Gap, Residue
 from conkit.core.contact import Contact
 from conkit.core.contactmap import ContactMap
@@ -19,13 +12,6 @@ from conkit.core.mappings import ContactMatchState
 from conkit.core.sequence import Sequence
 
 
-def skipUnless(condition):
-    if condition:
-        return lambda x: x
-    else:
-        return lambda x: None
-
-
 TP = ContactMatchState.true_positive.value
 FP = ContactMatchState.false_positive.value
 FN = ContactMatchState.false_negative.value
@@ -295,7 +281,34 @@ class TestContactMap(unittest.TestCase):
         jindex = contact_map1.get_jaccard_index(contact_map2)
         self.assertEqual(1.0, jindex)
 
-    @skipUnless(SKLEARN)
+    def test_get_jaccard_index_5(self):
+        contact_map1 = ContactMap.from_arrays("foo", [1, 3, 2, 5], [5, 3, 4, 1], [1.0, 0.4, 0.1, 0.2])
+        contact_map2 = ContactMap("bar")
+        for c in [Contact(1, 7, 1.0), Contact(3, 3, 0.4), Contact(2, 5, 0.1), Contact(5, 1, 0.2)]:
+            contact_map2.add(c)
+        jindex = contact_map1.get_jaccard_index(contact_map2)
+        self.assertEqual(0.333333, round(jindex, 6))
+
+    def test_get_jaccard_matrix_1(self):
+        contact_map1 = ContactMap("foo")
+        for c in [Contact(1, 5, 1.0), Contact(3, 3, 0.4), Contact(2, 4, 0.1), Contact(5, 1, 0.2)]:
+            contact_map1.add(c)
+        contact_map2 = ContactMap("bar")
+        for c in [Contact(1, 7, 1.0), Contact(3, 3, 0.4), Contact(2, 5, 0.1), Contact(5, 1, 0.2)]:
+            contact_map2.add(c)
+        contact_map3 = ContactMap.from_arrays("baz", [1, 3], [7, 2], [1.0, 0.4])
+        contact_map4 = ContactMap("empty")
+        contact_maps = [contact_map1, contact_map2, contact_map3, contact_map4]
+        jaccard = ContactMap.get_jaccard_matrix(contact_maps)
+        self.assertEqual((4, 4), jaccard.shape)
+        for i, contact_map_i in enumerate(contact_maps):
+            for j, contact_map_j in enumerate(contact_maps):
+                self.assertEqual(contact_map_i.get_jaccard_index(contact_map_j), jaccard[i, j])
+        self.assertEqual(jaccard.tolist(), ContactMap.get_jaccard_matrix(contact_maps, nthreads=2).tolist())
+
+    def test_get_jaccard_matrix_2(self):
+        self.assertEqual((0, 0), ContactMap.get_jaccard_matrix([]).shape)
+
     def test_get_contact_density_1(self):
         contact_map1 = ContactMap("foo")
         for c in [Contact(1, 5, 1.0), Contact(3, 3, 0.4), Contact(2, 4, 0.1)]:
@@ -304,7 +317,6 @@ class TestContactMap(unittest.TestCase):
         answer = [0.1194466, 0.2012433, 0.2386849, 0.2012433, 0.1194466]
         self.assertListEqual(answer, density)
 
-    @skipUnless(SKLEARN)
     def test_get_contact_density_2(self):
         contact_map1 = ContactMap("foo")
         for c in [Contact(1, 5, 1.0), Contact(3, 3, 0.4), Contact(2, 4, 0.1), Contact(3, 4, 0.4)]:
@@ -313,7 +325,6 @@ class TestContactMap(unittest.TestCase):
         answer = [0.1001259, 0.1983717, 0.2684149, 0.2313211, 0.1217899]
         self.assertEqual(answer, density)
 
-    @skipUnless(SKLEARN)
     def test_get_contact_density_3(self):
         contact_map1 = ContactMap("foo")
         for c in [Contact(3, 5, 0.4), Contact(2, 4, 0.1), Contact(3, 4, 0.4)]:
@@ -322,6 +333,25 @@ class TestContactMap(unittest.TestCase):
         answer = [0.1442296, 0.4134216, 0.4134216, 0.1442296]
         self.assertEqual(answer, density)
 
+    def test_get_contact_density_4(self):
+        contact_map1 = ContactMap.from_arrays("foo", [3, 2, 3, 9], [5, 4, 4, 7], [0.4, 0.1, 0.4, 0.2])
+        density = [round(x, 7) for x in contact_map1.get_contact_density()]
+        answer = [0.1442296, 0.4134216, 0.4134216, 0.1442296]
+        self.assertEqual(answer, density)
+
+    def test_get_contact_density_5(self):
+        contact_map1 = ContactMap("foo")
+        for c in [Contact(1, 5, 1.0), Contact(3, 3, 0.4), Contact(2, 4, 0.1), Contact(3, 4, 0.4)]:
+            contact_map1.add(c)
+        for bw_method in ["bowman", "linear", "scott", "silverman"]:
+            density = contact_map1.get_contact_density(bw_method)
+            self.assertEqual(5, len(density))
+            self.assertTrue(all(d > 0.0 for d in density))
+        with self.assertRaises(ValueError):
+            contact_map1.get_contact_density("garbage")
+        with self.assertRaises(ValueError):
+            ContactMap("empty").get_contact_density()
+
     def test_find_1(self):
         contact_map1 = ContactMap("1")
         for comb in [(1, 5, 1.0), (2, 6, 1.0), (1, 4, 1.0), (3, 6, 1.0), (2, 5, 1.0)]:
@@ -1077,6 +1107,14 @@ class TestContactMap(unittest.TestCase):
         found_contacts = ContactMap._find_single(contact_map, 4)
         self.assertEqual([(2, 4)], [c.id for c in found_contacts])
 
+    def test__index_by_id_1(self):
+        contact_map = ContactMap("test")
+        for contact in [Contact(1, 5, 1.0), Contact(2, 4, 0.1), Contact(1, 1, 0.2), Contact(4, 5, 0.3)]:
+            contact_map.add(contact)
+        index = ContactMap._index_by_id(contact_map)
+        for i in (1, 2, 4, 5, 8):
+            self.assertEqual([c.id for c in ContactMap._find_single(contact_map, i)], [c.id for c in index.get(i, [])])
+
     def test__insert_states_1(self):
         keymap = [Residue(1, 1, "X", ""), Residue(2, 2, "X", ""), Residue(3, 3, "X", "")]
         sequence = [ord(x) for x in "XXX"]
@@ -1232,6 +1270,30 @@ class TestContactMap(unittest.TestCase):
             contact_map.add(c)
         self.assertListEqual([[4, 5], [7, 8]], contact_map.singletons.as_list())
 
+    def test_singletons_8(self):
+        contact_map = ContactMap("test")
+        for c in [Contact(1, 1, 1.0), Contact(5, 5, 0.4), Contact(3, 3, 0.2)]:
+            contact_map.add(c)
+        self.assertListEqual([], contact_map.singletons.as_list())
+
+    def test_get_singletons_1(self):
+        contact_map = ContactMap("test")
+        for c in [Contact(4, 5, 1.0), Contact(6, 7, 0.4), Contact(-3, 20, 0.2), Contact(-1, 17, 0.2)]:
+            contact_map.add(c)
+        self.assertListEqual([[-3, 20], [-1, 17]], contact_map.get_singletons(threshold=2).as_list())
+        self.assertListEqual([], contact_map.get_singletons(threshold=3).as_list())
+        self.assertEqual(4, len(contact_map.get_singletons(threshold=1)))
+        self.assertEqual(4, len(contact_map))
+
+    def test_get_singletons_2(self):
+        contact_map = ContactMap.from_arrays("test", [4, 7, 10], [5, 8, 20], [1.0, 0.4, 0.2])
+        singletons = contact_map.get_singletons(threshold=3)
+        self.assertTrue(singletons.columnar)
+        self.assertListEqual([[10, 20]], singletons.as_list())
+        self.assertEqual(0, len(ContactMap("empty").get_singletons()))
+        with self.assertRaises(ValueError):
+            contact_map.get_singletons(threshold=-1)
+
     def test_remove_false_negatives_1(self):
         contact_map = ContactMap("foo")
         for params in [(1, 5, 1.0), (1, 6, 1.0), (2, 7, 1.0), (3, 5, 1.0), (2, 8, 1.0)]:
@@ -1259,6 +1321,195 @@ class TestContactMap(unittest.TestCase):
         contact_map.remove_false_negatives(inplace=True)
         self.assertListEqual([[1, 5], [1, 6], [2, 7], [3, 5], [2, 8]], contact_map.as_list())
 
+    def test_from_arrays_1(self):
+        contact_map = ContactMap.from_arrays("test", [1, 5, 2], [10, 30, 8], [0.3, 0.6, 0.1])
+        self.assertTrue(contact_map.columnar)
+        self.assertEqual(3, contact_map.ncontacts)
+        self.assertEqual([[1, 10], [5, 30], [2, 8]], contact_map.as_list())
+        self.assertEqual([0.3, 0.6, 0.1], [c.raw_score for c in contact_map])
+        self.assertTrue((5, 30) in contact_map)
+        self.assertFalse((5, 31) in contact_map)
+        self.assertEqual(0.6, contact_map[(5, 30)].raw_score)
+        self.assertEqual((2, 8), contact_map[-1].id)
+        self.assertEqual((1, 10), contact_map.top_contact.id)
+        self.assertEqual(30, contact_map.highest_residue_number)
+
+    def test_from_arrays_2(self):
+        contact_map = ContactMap.from_arrays("test", [1, 5, 2, 3], [10, 30, 8, 9], [0.3, 0.6, 0.3, 0.1])
+        contact_map.sort("raw_score", reverse=True, inplace=True)
+        self.assertTrue(contact_map.columnar)
+        self.assertEqual([[5, 30], [1, 10], [2, 8], [3, 9]], contact_map.as_list())
+        contact_map.sort("raw_score", inplace=True)
+        self.assertEqual([[3, 9], [1, 10], [2, 8], [5, 30]], contact_map.as_list())
+        contact_map.sort("id", inplace=True)
+        self.assertEqual([[1, 10], [2, 8], [3, 9], [5, 30]], contact_map.as_list())
+
+    def test_from_arrays_3(self):
+        contact_map = ContactMap.from_arrays("test", [1, 5, 2, 3], [10, 30, 8, 9], [0.3, 0.6, 0.3, 0.1])
+        contact_map.sequence = Sequence("foo", "ACDEFGHIKL")
+        sliced = contact_map[1:3]
+        self.assertTrue(sliced.columnar)
+        self.assertIs(contact_map.sequence, sliced.sequence)
+        self.assertEqual([[5, 30], [2, 8]], sliced.as_list())
+        sliced[0].raw_score = 1.0
+        self.assertEqual(0.6, contact_map[1].raw_score)
+
+    def test_from_arrays_4(self):
+        contact_map = ContactMap.from_arrays("test", [1, 5, 2, 3], [10, 30, 8, 9], [0.3, 0.6, 0.3, 0.1])
+        contact = contact_map[(2, 8)]
+        contact_map.remove((2, 8))
+        self.assertIsNone(contact.parent)
+        self.assertEqual([[1, 10], [5, 30], [3, 9]], contact_map.as_list())
+        with self.assertRaises(KeyError):
+            contact_map.remove((2, 8))
+
+    def test_from_arrays_5(self):
+        contact_map = ContactMap.from_arrays("test", [1, 5], [10, 30], [0.3, 0.6])
+        contact = contact_map[0]
+        contact_map.add(Contact(2, 8, 0.1))
+        self.assertFalse(contact_map.columnar)
+        self.assertIs(contact, contact_map[0])
+        contact.raw_score = 1.0
+        self.assertEqual(1.0, contact_map[(1, 10)].raw_score)
+        self.assertEqual([[1, 10], [5, 30], [2, 8]], contact_map.as_list())
+
+    def test_from_arrays_6(self):
+        contact_map = ContactMap.from_arrays("test", [1, 5], [10, 30], [0.3, 0.6])
+        self.assertEqual(2, len(contact_map.child_list))
+        self.assertFalse(contact_map.columnar)
+        self.assertEqual([(1, 10), (5, 30)], sorted(contact_map.child_dict.keys()))
+
+    def test_from_arrays_7(self):
+        contact_map = ContactMap.from_arrays("test", [1, 5, 2], [10, 30, 8], [1.0, 2.0, 3.0])
+        deep = contact_map.deepcopy()
+        deep.set_scalar_score()
+        deep.rescale(inplace=True)
+        self.assertTrue(deep.columnar)
+        self.assertEqual([0.5, 1.0, 1.5], [c.scalar_score for c in deep])
+        self.assertEqual([0.0, 0.5, 1.0], [c.raw_score for c in deep])
+        self.assertEqual([1.0, 2.0, 3.0], [c.raw_score for c in contact_map])
+
+    def test_from_arrays_8(self):
+        with self.assertRaises(ValueError):
+            ContactMap.from_arrays("test", [1, 1], [5, 5], [0.1, 0.2])
+
+    def test_remove_neighbors_columnar_1(self):
+        contact_map = ContactMap.from_arrays("test", [1, 1, 2, 3], [5, 6, 20, 4], [1.0, 1.0, 1.0, 1.0])
+        filtered = contact_map.remove_neighbors(min_distance=5, max_distance=17)
+        self.assertTrue(filtered.columnar)
+        self.assertEqual([[1, 6]], filtered.as_list())
+        self.assertEqual(4, contact_map.ncontacts)
+
+    def test_remove_neighbors_inplace_1(self):
+        contact_map = ContactMap("test")
+        for params in [(1, 5, 1.0), (1, 6, 1.0), (2, 20, 1.0), (3, 4, 1.0)]:
+            contact_map.add(Contact(*params))
+        removed = contact_map[(3, 4)]
+        contact_map.remove_neighbors(min_distance=2, inplace=True)
+        self.assertEqual([[1, 5], [1, 6], [2, 20]], contact_map.as_list())
+        self.assertEqual(sorted([(1, 5), (1, 6), (2, 20)]), sorted(contact_map.child_dict.keys()))
+        self.assertIsNone(removed.parent)
+
+    def test_filter_columnar_1(self):
+        contact_map = ContactMap.from_arrays("test", [1, 1, 2, 3], [5, 6, 20, 4], [0.1, 0.5, 0.7, 0.3])
+        contact_map.filter(0.4, inplace=True)
+        self.assertTrue(contact_map.columnar)
+        self.assertEqual([[1, 6], [2, 20]], contact_map.as_list())
+        self.assertFalse((1, 5) in contact_map)
+
+    def test_find_columnar_1(self):
+        contact_map = ContactMap.from_arrays("test", [1, 1, 2, 3], [5, 6, 20, 4], [0.1, 0.5, 0.7, 0.3])
+        self.assertEqual([[1, 5], [1, 6], [3, 4]], contact_map.find([1, 4]).as_list())
+        self.assertEqual([[2, 20]], contact_map.find([1, 4], inverse=True).as_list())
+
+    def test_keep_columnar_1(self):
+        contact_map = ContactMap.from_arrays("test", [1, 1, 2, 3], [5, 6, 20, 4], [0.1, 0.5, 0.7, 0.3])
+        contact_map.keep([(3, 4), (1, 5)])
+        self.assertTrue(contact_map.columnar)
+        self.assertEqual([[1, 5], [3, 4]], contact_map.as_list())
+        contact_map.keep([False, True])
+        self.assertEqual([[3, 4]], contact_map.as_list())
+
+    def test_remove_many_columnar_1(self):
+        contact_map = ContactMap.from_arrays("test", [1, 1, 2, 3], [5, 6, 20, 4], [0.1, 0.5, 0.7, 0.3])
+        contact_map.remove_many([(1, 6), (3, 4)])
+        self.assertEqual([[1, 5], [2, 20]], contact_map.as_list())
+        with self.assertRaises(KeyError):
+            contact_map.remove_many([(1, 6)])
+        contact_map.remove((1, 5))
+        self.assertEqual(1, len(contact_map))
+        self.assertEqual([[2, 20]], contact_map.as_list())
+
+    def test_remove_many_columnar_2(self):
+        contact_map = ContactMap.from_arrays("test", [1, 1, 2, 3], [5, 6, 20, 4], [0.1, 0.5, 0.7, 0.3])
+        contact_map.remove_many([(1, 6), (1, 6)])
+        self.assertEqual([[1, 5], [2, 20], [3, 4]], contact_map.as_list())
+        contact_map = ContactMap("test")
+        for res1_seq, res2_seq in [(1, 5), (1, 6), (2, 20), (3, 4)]:
+            contact_map.add(Contact(res1_seq, res2_seq, 0.5))
+        contact_map.remove_many([(1, 6), (1, 6)])
+        self.assertEqual([[1, 5], [2, 20], [3, 4]], contact_map.as_list())
+
+    def test_getitem_columnar_1(self):
+        contact_map = ContactMap.from_arrays("test", [1, 1, 2, 3, 4], [5, 6, 20, 8, 9], [0.1, 0.5, 0.7, 0.3, 0.2])
+        sliced = contact_map[3:0:-2]
+        self.assertTrue(sliced.columnar)
+        self.assertEqual([[1, 6], [3, 8]], sliced.as_list())
+        self.assertEqual(5, len(contact_map))
+
+    def test_deepcopy_columnar_1(self):
+        contact_map = ContactMap.from_arrays("test", [1, 1, 2, 3], [5, 6, 20, 4], [0.1, 0.5, 0.7, 0.3])
+        contact_map.remove((1, 6))
+        contact_map_deepcopy = contact_map.deepcopy()
+        self.assertTrue(contact_map_deepcopy.columnar)
+        contact_map_deepcopy[0].raw_score = 1.0
+        contact_map_deepcopy.remove((2, 20))
+        self.assertEqual([0.1, 0.7, 0.3], [c.raw_score for c in contact_map])
+        self.assertEqual([1.0, 0.3], [c.raw_score for c in contact_map_deepcopy])
+        contact_map[1].res1_seq = 10
+        self.assertEqual([1, 3], [c.res1_seq for c in contact_map_deepcopy])
+        self.assertTrue(all(c.parent is contact_map_deepcopy for c in contact_map_deepcopy))
+
+    def test_sort_columnar_1(self):
+        contact_map = ContactMap.from_arrays("test", [1, 1, 2, 3], [5, 6, 20, 4], [0.1, 0.5, 0.7, 0.3])
+        contact_map_sorted = contact_map.sort("raw_score", reverse=True)
+        contact_map_sorted.rescale(inplace=True)
+        self.assertEqual([[2, 20], [1, 6], [3, 4], [1, 5]], contact_map_sorted.as_list())
+        self.assertEqual([0.1, 0.5, 0.7, 0.3], [c.raw_score for c in contact_map])
+        self.assertEqual([[1, 5], [1, 6], [2, 20], [3, 4]], contact_map.as_list())
+
+    def test_top_k_1(self):
+        contact_map = ContactMap("test")
+        for c in [Contact(1, 5, 0.3), Contact(1, 6, 0.5), Contact(2, 7, 0.3), Contact(3, 8, 0.9), Contact(4, 9, 0.3)]:
+            contact_map.add(c)
+        top = contact_map.top_k(3)
+        self.assertEqual([(3, 8), (1, 6), (1, 5)], [c.id for c in top])
+        self.assertEqual(5, len(contact_map))
+        self.assertEqual([c.id for c in contact_map.sort("raw_score", reverse=True)[:3]], [c.id for c in top])
+
+    def test_top_k_2(self):
+        contact_map = ContactMap.from_arrays("test", [1, 1, 2, 3, 4], [5, 6, 7, 8, 9], [0.3, 0.5, 0.3, 0.9, 0.3])
+        top = contact_map.top_k(4)
+        self.assertTrue(top.columnar)
+        self.assertEqual([[3, 8], [1, 6], [1, 5], [2, 7]], top.as_list())
+        self.assertEqual(5, len(contact_map))
+        self.assertEqual(5, len(contact_map.top_k(10)))
+        self.assertEqual(0, len(contact_map.top_k(0)))
+
+    def test_top_k_3(self):
+        contact_map = ContactMap.from_arrays("test", [1, 1, 2, 3, 4], [5, 6, 7, 8, 9], [0.3, 0.5, 0.3, 0.9, 0.3])
+        contact_map.set_scalar_score()
+        top = contact_map.top_k(2, by="res1_seq", inplace=True)
+        self.assertIs(contact_map, top)
+        self.assertEqual([[4, 9], [3, 8]], contact_map.as_list())
+        self.assertEqual(2, len(contact_map))
+
+    def test_top_k_4(self):
+        contact_map = ContactMap("test")
+        contact_map.add(Contact(1, 5, 0.3))
+        with self.assertRaises(ValueError):
+            contact_map.top_k(-1)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,191 @@
+"""Testing facility for conkit.core.ContactStore"""
+
+__author__ = "Felix Simkovic"
+__date__ = "16 Oct 2026"
+
+import numpy as np
+import unittest
+
+from conkit.core.contact import Contact
+from conkit.core.contactstore import ContactStore, ContactView, pack_ids
+from conkit.core.mappings import ContactMatchState
+
+
+class TestContactStore(unittest.TestCase):
+    def test_from_arrays_1(self):
+        store = ContactStore.from_arrays([1, 2, 3], [10, 20, 30], [0.1, 0.2, 0.3])
+        self.assertEqual(3, store.size)
+        self.assertEqual([[1, 10], [2, 20], [3, 30]], store.id.tolist())
+        self.assertEqual([0.1, 0.2, 0.3], store.raw_score.tolist())
+        self.assertEqual([1.0, 1.0, 1.0], store.weight.tolist())
+        self.assertEqual([[0.0, 8.0]] * 3, store.distance_bound.tolist())
+
+    def test_from_arrays_2(self):
+        store = ContactStore.from_arrays(
+            [1, 2], [10, 20], [0.1, 0.2], res1=["ALA", "c"], res2="G", res1_chain=["A", "LONG"], status=[1, 3]
+        )
+        self.assertEqual([ord("A"), ord("C")], store.res1.tolist())
+        self.assertEqual([ord("G"), ord("G")], store.res2.tolist())
+        self.assertEqual(["A", "LONG"], store.res1_chain.tolist())
+        self.assertEqual([1, 3], store.status.tolist())
+
+    def test_from_arrays_3(self):
+        with self.assertRaises(TypeError):
+            ContactStore.from_arrays([1.0, 2.0], [10, 20], [0.1, 0.2])
+
+    def test_from_arrays_4(self):
+        with self.assertRaises(ValueError):
+            ContactStore.from_arrays([1, 2], [10, 20], [0.1, 0.2], foo=[1, 2])
+
+    def test_from_arrays_5(self):
+        with self.assertRaises(ValueError):
+            ContactStore.from_arrays([1, 2], [10, 20], [0.1, 0.2], res1=["A", "!"])
+
+    def test_from_arrays_6(self):
+        with self.assertRaises(ValueError):
+            ContactStore.from_arrays([1, 2, 1], [10, 20, 10], [0.1, 0.2, 0.3])
+        store = ContactStore.from_arrays([1, 1], [10, 20], [0.1, 0.2])
+        self.assertEqual(1, store.find((1, 20)))
+
+    def test_from_contacts_1(self):
+        contact = Contact(1, 10, 0.5, distance_bound=(1, 6))
+        contact.res1_chain = "B"
+        contact.true_positive = True
+        store = ContactStore.from_contacts([contact, Contact(2, 20, 0.7)])
+        self.assertEqual([[1, 10], [2, 20]], store.id.tolist())
+        self.assertEqual([[1.0, 6.0], [0.0, 8.0]], store.distance_bound.tolist())
+        self.assertEqual(["B", ""], store.res1_chain.tolist())
+        self.assertEqual([1, 0], store.status.tolist())
+
+    def test_find_1(self):
+        store = ContactStore.from_arrays([1, 2, 3], [10, 20, 30], [0.1, 0.2, 0.3])
+        self.assertEqual(1, store.find((2, 20)))
+        self.assertIsNone(store.find((2, 21)))
+        self.assertIsNone(store.find("foo"))
+        store.alive[1] = False
+        self.assertIsNone(store.find((2, 20)))
+
+    def test_find_2(self):
+        store = ContactStore.from_arrays([1, 2, 3], [10, 20, 30], [0.1, 0.2, 0.3])
+        self.assertEqual(2, store.find((3, 30)))
+        store.set_column("id", (4, 40), rows=2)
+        self.assertIsNone(store.find((3, 30)))
+        self.assertEqual(2, store.find((4, 40)))
+
+    def test_take_1(self):
+        store = ContactStore.from_arrays([1, 2, 3], [10, 20, 30], [0.1, 0.2, 0.3])
+        taken = store.take([2, 0])
+        self.assertEqual(2, taken.size)
+        self.assertEqual([[3, 30], [1, 10]], taken.id.tolist())
+        taken.raw_score[0] = 1.0
+        self.assertEqual(0.3, store.raw_score[2])
+
+    def test_to_contacts_1(self):
+        store = ContactStore.from_arrays(
+            [1, 2], [10, 20], [0.1, 0.2], res2_chain="A", status=ContactMatchState.false_positive
+        )
+        contacts = store.to_contacts([1, 0])
+        self.assertEqual([Contact, Contact], [type(c) for c in contacts])
+        self.assertEqual([(2, 20), (1, 10)], [c.id for c in contacts])
+        self.assertEqual(["A", "A"], [c.res2_chain for c in contacts])
+        self.assertTrue(all(c.false_positive for c in contacts))
+
+    def test_to_contacts_2(self):
+        store = ContactStore.from_arrays([1, 2], [10, 20], [0.1, 0.2])
+        view = store.view(0)
+        contacts = store.to_contacts([0, 1])
+        self.assertIs(view, contacts[0])
+        view.raw_score = 1.0
+        self.assertEqual(0.1, store.raw_score[0])
+
+    def test_pack_ids_1(self):
+        keys = pack_ids([1, 1, 2, -5], [2, 3, 1, 4])
+        self.assertEqual(4, np.unique(keys).size)
+        self.assertTrue(keys[0] < keys[1] < keys[2])
+
+    def test_share_1(self):
+        store = ContactStore.from_arrays([1, 2], [10, 20], [0.1, 0.2])
+        shared = store.share()
+        self.assertIs(store.raw_score, shared.raw_score)
+        shared.set_column("raw_score", [0.5, 0.6])
+        self.assertEqual([0.1, 0.2], store.raw_score.tolist())
+        self.assertEqual([0.5, 0.6], shared.raw_score.tolist())
+        self.assertIs(store.res1_seq, shared.res1_seq)
+        store.alive[0] = False
+        self.assertTrue(shared.alive[0])
+
+    def test_share_2(self):
+        store = ContactStore.from_arrays([1, 2], [10, 20], [0.1, 0.2])
+        shared = store.share()
+        view = store.view(1)
+        view.raw_score = 0.9
+        view.false_positive = True
+        view.upper_bound = 12.0
+        self.assertEqual([0.1, 0.9], store.raw_score.tolist())
+        self.assertEqual([0.1, 0.2], shared.raw_score.tolist())
+        self.assertEqual(ContactMatchState.unknown.value, shared.status[1])
+        self.assertEqual([0.0, 8.0], shared.distance_bound[1].tolist())
+        self.assertEqual([0.0, 12.0], store.distance_bound[1].tolist())
+        self.assertEqual((2, 20), shared.view(1).id)
+
+
+class TestContactView(unittest.TestCase):
+    def test_view_1(self):
+        store = ContactStore.from_arrays([1, 2], [10, 20], [0.1, 0.2])
+        view = store.view(1)
+        self.assertIsInstance(view, Contact)
+        self.assertIsInstance(view, ContactView)
+        self.assertIs(view, store.view(1))
+        self.assertEqual((2, 20), view.id)
+        self.assertEqual(2, view.res1_seq)
+        self.assertEqual(0.2, view.raw_score)
+        self.assertEqual((0.0, 8.0), view.distance_bound)
+        self.assertTrue(view.status_unknown)
+
+    def test_view_2(self):
+        store = ContactStore.from_arrays([1, 2], [10, 20], [0.1, 0.2])
+        view = store.view(0)
+        view.res1_seq = 5
+        view.res1_altseq = 6
+        view.raw_score = 0.9
+        view.res1 = "TRP"
+        view.res2_chain = "XY"
+        view.upper_bound = 10
+        view.false_negative = True
+        self.assertEqual(5, store.res1_seq[0])
+        self.assertEqual(6, store.res1_altseq[0])
+        self.assertEqual(0.9, store.raw_score[0])
+        self.assertEqual(ord("W"), store.res1[0])
+        self.assertEqual("XY", store.res2_chain[0])
+        self.assertEqual([0.0, 10.0], store.distance_bound[0].tolist())
+        self.assertEqual(ContactMatchState.false_negative.value, store.status[0])
+        self.assertEqual((1, 10), view.id)
+
+    def test_view_3(self):
+        store = ContactStore.from_arrays([1, 2], [10, 20], [0.1, 0.2])
+        view = store.view(0)
+        with self.assertRaises(TypeError):
+            view.res1_seq = 1.0
+        with self.assertRaises(TypeError):
+            view.id = "foo"
+
+    def test_copy_1(self):
+        store = ContactStore.from_arrays([1, 2], [10, 20], [0.1, 0.2])
+        view = store.view(0)
+        contact = view.copy()
+        self.assertIs(Contact, type(contact))
+        contact.raw_score = 1.0
+        self.assertEqual(0.1, view.raw_score)
+
+    def test_detach_1(self):
+        store = ContactStore.from_arrays([1, 2], [10, 20], [0.1, 0.2])
+        view = store.view(1)
+        view.detach()
+        view.raw_score = 1.0
+        self.assertEqual(0.2, store.raw_score[1])
+        self.assertEqual(1.0, view.raw_score)
+        self.assertEqual((2, 20), view.id)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -3,6 +3,7 @@
 __author__ = "Felix Simkovic"
 __date__ = "12 Aug 2016"
 
+import numpy as np
 import unittest
 
 from conkit.core.entity import Entity
@@ -104,6 +105,16 @@ class TestEntity(unittest.TestCase):
         self.assertEqual(5, len(new_entity))
         self.assertEqual(["foo_1", "foo_3", "foo_5", "foo_7", "foo_9"], [e.id for e in new_entity])
 
+    def test_getitem_8(self):
+        entity = Entity("test")
+        for i in range(10):
+            entity.add(Entity("foo_{0}".format(i)))
+        new_entity = entity[8:2:-3]
+        self.assertEqual(["foo_5", "foo_8"], [e.id for e in new_entity])
+        self.assertEqual(0, len(entity[5:5]))
+        self.assertEqual(10, len(entity))
+        self.assertTrue(all(e.parent is entity for e in entity))
+
     def test_iter_1(self):
         entity = Entity("test")
         for i in range(10):
@@ -316,6 +327,85 @@ class TestEntity(unittest.TestCase):
         with self.assertRaises(KeyError):
             entity.remove("foo")
 
+    def test_remove_4(self):
+        entity = Entity("test")
+        children = [Entity(c) for c in "abcde"]
+        for child in children:
+            entity.add(child)
+        child_list = entity.child_list
+        entity.remove("b")
+        entity.remove("d")
+        self.assertEqual(3, len(entity))
+        self.assertEqual(["a", "c", "e"], [c.id for c in entity])
+        self.assertEqual(["a", "c", "e"], [c.id for c in child_list])
+        self.assertIsNone(children[1].parent)
+
+    def test_remove_5(self):
+        entity = Entity("test")
+        child = Entity("foo")
+        entity.add(child)
+        entity.add(Entity("bar"))
+        entity.remove("foo")
+        entity.add(child)
+        self.assertEqual(["bar", "foo"], [c.id for c in entity])
+
+    def test_remove_many_1(self):
+        entity = Entity("test")
+        for c in "abcde":
+            entity.add(Entity(c))
+        entity.remove_many(["a", "d"])
+        self.assertEqual(["b", "c", "e"], [c.id for c in entity])
+        self.assertEqual(["b", "c", "e"], sorted(entity.child_dict.keys()))
+
+    def test_remove_many_2(self):
+        entity = Entity("test")
+        for c in "abc":
+            entity.add(Entity(c))
+        with self.assertRaises(KeyError):
+            entity.remove_many(["a", "x"])
+        self.assertEqual(["a", "b", "c"], [c.id for c in entity])
+
+    def test_remove_many_3(self):
+        entity = Entity("test")
+        for c in "abc":
+            entity.add(Entity(c))
+        entity.remove_many(["b", "b"])
+        self.assertEqual(["a", "c"], [c.id for c in entity])
+        with self.assertRaises(KeyError):
+            entity.remove_many(["a", "a", "b"])
+        self.assertEqual(["a", "c"], [c.id for c in entity])
+
+    def test_keep_1(self):
+        entity = Entity("test")
+        for c in "abcde":
+            entity.add(Entity(c))
+        removed = entity["b"]
+        entity.keep([True, False, True, False, True])
+        self.assertEqual(["a", "c", "e"], [c.id for c in entity])
+        self.assertEqual(["a", "c", "e"], sorted(entity.child_dict.keys()))
+        self.assertIsNone(removed.parent)
+
+    def test_keep_2(self):
+        entity = Entity("test")
+        for c in "abcde":
+            entity.add(Entity(c))
+        entity.keep(["e", "b", "x"])
+        self.assertEqual(["b", "e"], [c.id for c in entity])
+
+    def test_keep_3(self):
+        entity = Entity("test")
+        for c in "abc":
+            entity.add(Entity(c))
+        with self.assertRaises(ValueError):
+            entity.keep([True, False])
+
+    def test_keep_4(self):
+        entity = Entity("test")
+        for c in "abcd":
+            entity.add(Entity(c))
+        entity.keep(list(np.array([False, True, False, True])))
+        self.assertEqual(["b", "d"], [c.id for c in entity])
+
     def test_listify_1(self):
         self.assertListEqual([1], Entity.listify(1))
 
@@ -2,9 +2,10 @@
 __author__ = "Felix Simkovic"
 __date__ = "12 Aug 2016"
 
+import numpy as np
 import unittest
 
-from conkit.core.sequence import Sequence
+from conkit.core.sequence import Sequence, _pairwise_align
 
 
 class TestSequence(unittest.TestCase):
@@ -39,6 +40,18 @@ class TestSequence(unittest.TestCase):
         sequence = Sequence("foo", "GSMFTPK")
         sequence.seq = "-------"
 
+    def test_seq_5(self):
+        sequence = Sequence("foo", "GSMFTPK")
+        with self.assertRaises(KeyError) as context:
+            sequence.seq = "GSM\u00e9TPK"
+        self.assertEqual("\u00c9", context.exception.args[0])
+        with self.assertRaises(KeyError) as context:
+            sequence.seq = "gsm*"
+        self.assertEqual("*", context.exception.args[0])
+        self.assertEqual("GSMFTPK", sequence.seq)
+        sequence.seq = "gsm-bjoUzx"
+        self.assertEqual("gsm-bjoUzx", sequence.seq)
+
     def test_seq_ascii_1(self):
         sequence = Sequence("foo", "GSMFTPK")
         self.assertEqual([71, 83, 77, 70, 84, 80, 75], list(sequence.seq_ascii))
@@ -48,6 +61,21 @@ class TestSequence(unittest.TestCase):
         sequence.seq = "AAAAAA"
         self.assertEqual([65, 65, 65, 65, 65, 65], list(sequence.seq_ascii))
 
+    def test_seq_array_1(self):
+        sequence = Sequence("foo", "GSMFTPK")
+        array = sequence.seq_array
+        self.assertEqual(np.uint8, array.dtype)
+        self.assertEqual([71, 83, 77, 70, 84, 80, 75], array.tolist())
+        self.assertIs(array, sequence.seq_array)
+        self.assertFalse(array.flags.writeable)
+
+    def test_seq_array_2(self):
+        sequence = Sequence("foo", "GSMFTPK")
+        array = sequence.seq_array
+        sequence.seq = "AA-A"
+        self.assertEqual([65, 65, 45, 65], sequence.seq_array.tolist())
+        self.assertEqual([71, 83, 77, 70, 84, 80, 75], array.tolist())
+
     def test_seq_encoded_1(self):
         sequence = Sequence("foo", "ABCDEFGHIJKLMNOPQRSTUVWXYZ")
         self.assertEqual(
@@ -55,6 +83,10 @@ class TestSequence(unittest.TestCase):
             list(sequence.seq_encoded),
         )
 
+    def test_seq_encoded_2(self):
+        sequence = Sequence("foo", "ac-Y")
+        self.assertEqual([21, 21, 21, 20], sequence.seq_encoded)
+
     def test_seq_len_1(self):
         sequence = Sequence("foo", "GSMFTPK")
         self.assertEqual("foo", sequence.id)
@@ -165,6 +197,40 @@ class TestSequence(unittest.TestCase):
         self.assertEqual(aligned1, sequence1.seq)
         self.assertEqual(aligned2, sequence2.seq)
 
+    def test_align_local_4(self):
+        for seq1, seq2, expected in [
+            ("GSMFTPKPPQDSAV", "PKPPQDS", ("GSMFTPKPPQDSAV", "-----PKPPQDS--")),
+            ("AAAAGAAA", "AAGA", ("AAAAGAAA", "--AAGA--")),
+            ("ACDEFGH", "XCD-FGY", ("ACDEFGH", "XCD-FGY")),
+        ]:
+            sequence1, sequence2 = Sequence("foo", seq1), Sequence("bar", seq2)
+            sequence1, sequence2 = sequence1.align_local(sequence2, gap_ext_pen=-0.2)
+            self.assertEqual(expected, (sequence1.seq, sequence2.seq))
+
+    def test_align_global_1(self):
+        for seq1, seq2, expected in [
+            ("GSMFTPKPPQDSAV", "PKPPQDS", ("GSMFTPKPPQDSAV", "-----PKPPQDS--")),
+            ("AAAAGAAA", "AAGA", ("AAAAGAAA", "--AAG--A")),
+            ("ACDEFGH", "XCD-FGY", ("ACDEFGH", "XCD-FGY")),
+        ]:
+            sequence1, sequence2 = Sequence("foo", seq1), Sequence("bar", seq2)
+            sequence1.align_global(sequence2, inplace=True)
+            self.assertEqual(expected, (sequence1.seq, sequence2.seq))
+
+    def test_align_global_3(self):
+        # Repetitive sequences have very many co-optimal alignments, only the first one is built
+        sequence1, sequence2 = Sequence("foo", "A" * 300), Sequence("bar", "A" * 150)
+        sequence1.align_global(sequence2, inplace=True)
+        self.assertEqual("A" * 300, sequence1.seq)
+        self.assertEqual(150, sequence2.seq.count("A"))
+        self.assertEqual(300, len(sequence2.seq))
+
+    def test_align_global_2(self):
+        _pairwise_align.cache_clear()
+        Sequence("foo", "ACDEFGH").align_global(Sequence("bar", "ACDFGH"))
+        Sequence("foo", "ACDEFGH").align_global(Sequence("bar", "ACDFGH"))
+        self.assertEqual(1, _pairwise_align.cache_info().hits)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
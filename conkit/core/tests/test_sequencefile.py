@@ -3,10 +3,13 @@
 __author__ = "Felix Simkovic"
 __date__ = "12 Aug 2016"
 
+import numpy as np
+import os
 import unittest
 
 from conkit.core.sequence import Sequence
 from conkit.core.sequencefile import SequenceFile
+from conkit.io._iotools import create_tmp_f
 
 
 class TestSequenceFile(unittest.TestCase):
@@ -192,6 +195,92 @@ class TestSequenceFile(unittest.TestCase):
             sequence_file.add(s)
         self.assertEqual(5, sequence_file.meff)
 
+    def test_get_weights_7(self):
+        sequence_file = SequenceFile("test")
+        for s in [
+            Sequence("foo", "AAAAAAA"),
+            Sequence("bar", "AA-ACA-"),
+            Sequence("cho", "AAADCAA"),
+            Sequence("doo", "C-CAA--"),
+            Sequence("miu", "CCCCCCC"),
+            Sequence("nop", "AAAAAAB"),
+        ]:
+            sequence_file.add(s)
+        expected = [0.3333333333333333, 1.0, 0.5, 1.0, 1.0, 0.5]
+        self.assertEqual(expected, sequence_file.get_weights(identity=0.6, nthreads=2, max_memory=1))
+        self.assertEqual(expected, sequence_file.get_weights(identity=0.6, method="gemm"))
+        self.assertEqual(expected, sequence_file.get_weights(identity=0.6, method="gemm", max_memory=1))
+        self.assertEqual(4, sequence_file.get_meff_with_id(0.6, method="gemm"))
+
+    def test_get_weights_8(self):
+        rng = np.random.RandomState(41)
+        matrix = np.frombuffer(b"ACDEFGHIKLMNPQRSTVWY-", dtype=np.uint8)[rng.randint(0, 5, (300, 23))]
+        sequence_file = SequenceFile.from_matrix("test", [str(i) for i in range(300)], matrix)
+        for identity in (0.0, 0.3, 0.6, 0.9, 1.0):
+            expected = []
+            for i in range(300):
+                distances = (matrix != matrix[i]).sum(axis=1)
+                expected.append(1.0 / (distances < (1.0 - identity) * 23).sum())
+            self.assertEqual(expected, sequence_file.get_weights(identity=identity))
+            self.assertEqual(expected, sequence_file.get_weights(identity=identity, method="gemm", max_memory=40000))
+
+    def test_get_weights_9(self):
+        sequence_file = SequenceFile("test")
+        sequence_file.add(Sequence("foo", "AAAAAAA"))
+        with self.assertRaises(ValueError):
+            sequence_file.get_weights(method="foo")
+
+    def test_estimate_meff_1(self):
+        sequence_file = SequenceFile("test")
+        for s in [
+            Sequence("foo", "AAAAAAA"),
+            Sequence("bar", "AA-ACA-"),
+            Sequence("cho", "AAADCAA"),
+            Sequence("doo", "C-CAA--"),
+            Sequence("miu", "CCCCCCC"),
+            Sequence("nop", "AAAAAAB"),
+        ]:
+            sequence_file.add(s)
+        estimate, lower, upper = sequence_file.estimate_meff(identity=0.6, seed=0)
+        self.assertAlmostEqual(sum(sequence_file.get_weights(identity=0.6)), estimate)
+        self.assertEqual((estimate, estimate), (lower, upper))
+
+    def test_estimate_meff_2(self):
+        rng = np.random.RandomState(41)
+        families = rng.randint(0, 20, (40, 50))
+        rows = np.where(rng.rand(5000, 50) < 0.15, rng.randint(0, 21, (5000, 50)), families[rng.randint(0, 40, 5000)])
+        matrix = np.frombuffer(b"ACDEFGHIKLMNPQRSTVWY-", dtype=np.uint8)[rows]
+        sequence_file = SequenceFile.from_matrix("test", [str(i) for i in range(5000)], matrix)
+        meff = sum(sequence_file.get_weights())
+        estimate, lower, upper = sequence_file.estimate_meff(error=0.1, seed=1)
+        self.assertEqual((estimate, lower, upper), sequence_file.estimate_meff(error=0.1, seed=1))
+        self.assertLess(lower, estimate)
+        self.assertLess(estimate, upper)
+        self.assertLessEqual(upper - estimate, 0.1 * estimate)
+        self.assertTrue(lower <= meff <= upper)
+
+    def test_estimate_meff_3(self):
+        sequence_file = SequenceFile("test")
+        sequence_file.add(Sequence("foo", "AAAAAAA"))
+        sequence_file.add(Sequence("bar", "AAAAAA"))
+        with self.assertRaises(ValueError):
+            sequence_file.estimate_meff()
+        with self.assertRaises(ValueError):
+            sequence_file.estimate_meff(error=0.0)
+        with self.assertRaises(ValueError):
+            sequence_file.estimate_meff(confidence=1.0)
+
+    def test_estimate_meff_4(self):
+        rng = np.random.RandomState(3)
+        matrix = np.frombuffer(b"ACDEFGHIKLMNPQRSTVWY", dtype=np.uint8)[rng.randint(0, 20, (2000, 30))]
+        sequence_file = SequenceFile.from_matrix("test", [str(i) for i in range(2000)], matrix)
+        for identity in (0.8, 1.0):
+            estimate, lower, upper = sequence_file.estimate_meff(identity=identity, seed=0)
+            self.assertEqual(2000.0, estimate)
+            self.assertLess(lower, estimate)
+            self.assertEqual(2000.0, upper)
+            self.assertEqual([float, float, float], [type(v) for v in (estimate, lower, upper)])
+
     def test_get_frequency_1(self):
         sequence_file = SequenceFile("test")
         for s in [Sequence("foo", "AAAAAAA"), Sequence("bar", "A-AAAA-"), Sequence("cho", "--AAA--")]:
@@ -282,6 +371,101 @@ class TestSequenceFile(unittest.TestCase):
         self.assertEqual(["CD", "DE", "EF"], [s.seq for s in sequence_file_trimmed])
         self.assertNotEqual(sequence_file, sequence_file_trimmed)
 
+    def test_get_identity_matrix_1(self):
+        sequence_file = SequenceFile("test")
+        for seq in [Sequence("foo", "AAAA"), Sequence("bar", "AAA-"), Sequence("doe", "CC--")]:
+            sequence_file.add(seq)
+        matrix = sequence_file.get_identity_matrix()
+        self.assertEqual(np.float32, matrix.dtype)
+        self.assertEqual([[1.0, 0.75, 0.0], [0.75, 1.0, 0.25], [0.0, 0.25, 1.0]], matrix.tolist())
+        self.assertFalse(matrix.flags.writeable)
+        self.assertIs(matrix, sequence_file.get_identity_matrix())
+        sequence_file.add(Sequence("baz", "AAAC"))
+        self.assertEqual([0.75, 0.75, 0.0, 1.0], sequence_file.get_identity_matrix()[3].tolist())
+
+    def test_get_identity_matrix_2(self):
+        sequence_file = SequenceFile("test")
+        for seq in [Sequence("foo", "AAA"), Sequence("bar", "AAC"), Sequence("doe", "CCC")]:
+            sequence_file.add(seq)
+        matrix = sequence_file.get_identity_matrix(percent=True, max_memory=0)
+        self.assertIsInstance(matrix, np.memmap)
+        self.assertEqual(np.uint8, matrix.dtype)
+        self.assertEqual([[100, 67, 0], [67, 100, 33], [0, 33, 100]], matrix.tolist())
+        fname = create_tmp_f()
+        self.addCleanup(os.remove, fname)
+        matrix = sequence_file.get_identity_matrix(percent=True, filename=fname)
+        self.assertIsInstance(matrix, np.memmap)
+        self.assertEqual(9, os.path.getsize(fname))
+        self.assertEqual([100, 67, 0, 67, 100, 33, 0, 33, 100], list(np.fromfile(fname, dtype=np.uint8)))
+
+    def test_get_identity_matrix_4(self):
+        sequence_file = SequenceFile("test")
+        for seq in [Sequence("foo", "AAA"), Sequence("bar", "AAC"), Sequence("doe", "CCC")]:
+            sequence_file.add(seq)
+        matrix = sequence_file.get_identity_matrix()
+        for fname in (create_tmp_f(), create_tmp_f()):
+            self.addCleanup(os.remove, fname)
+            sequence_file.get_identity_matrix(filename=fname)
+        sequence_file.get_identity_matrix(percent=True)
+        self.assertEqual(1, sum(1 for key in sequence_file._cache if "identities" in key))
+        self.assertIsNot(matrix, sequence_file.get_identity_matrix())
+        self.assertEqual(1, sum(1 for key in sequence_file._cache if "identities" in key))
+
+    def test_get_identity_matrix_3(self):
+        rng = np.random.RandomState(41)
+        matrix = np.frombuffer(b"ACDEFGHIKLMNPQRSTVWY-", dtype=np.uint8)[rng.randint(0, 5, (300, 23))]
+        ids = [str(i) for i in range(300)]
+        sequence_file = SequenceFile.from_matrix("test", ids, matrix)
+        identities = sequence_file.get_identity_matrix(nthreads=2)
+        expected = 1.0 - (matrix[:, np.newaxis] != matrix[np.newaxis]).sum(axis=2) / 23.0
+        self.assertTrue(np.array_equal(expected.astype(np.float32), identities))
+        for identity in (0.0, 0.3, 0.6, 0.9, 1.0):
+            reference = SequenceFile.from_matrix("test", ids, matrix)
+            self.assertEqual(reference.get_weights(identity=identity), sequence_file.get_weights(identity=identity))
+        for min_id, max_id in ((0.0, 0.9), (0.3, 0.7), (0.6, 0.5), (0.0, 1.0)):
+            reference = SequenceFile.from_matrix("test", ids, matrix)
+            self.assertEqual(
+                [s.id for s in reference.filter(min_id, max_id)], [s.id for s in sequence_file.filter(min_id, max_id)]
+            )
+
+    def test_get_profile_1(self):
+        sequence_file = SequenceFile("test")
+        for s in [Sequence("foo", "AAC"), Sequence("bar", "A-C"), Sequence("cho", "CBa")]:
+            sequence_file.add(s)
+        profile = sequence_file.get_profile()
+        self.assertEqual((3, 21), profile.shape)
+        self.assertEqual([2, 1, 0], profile[:, 0].tolist())
+        self.assertEqual([1, 0, 2], profile[:, 1].tolist())
+        self.assertEqual([0, 2, 1], profile[:, 20].tolist())
+        self.assertEqual([3, 3, 3], profile.sum(axis=1).tolist())
+        self.assertEqual(sequence_file.get_frequency("X"), profile[:, 20].tolist())
+
+    def test_get_profile_2(self):
+        sequence_file = SequenceFile("test")
+        for s in [Sequence("foo", "AAC"), Sequence("bar", "A-C"), Sequence("cho", "CBa")]:
+            sequence_file.add(s)
+        profile = sequence_file.get_profile(weights=[0.5, 0.25, 1.0])
+        self.assertEqual([0.75, 0.5, 0.0], profile[:, 0].tolist())
+        self.assertEqual([1.0, 0.0, 0.75], profile[:, 1].tolist())
+        profile = sequence_file.get_profile(weights=[0.5, 0.25, 1.0], normalize=True)
+        self.assertEqual([0.75 / 1.75, 0.5 / 1.75, 0.0], profile[:, 0].tolist())
+        self.assertEqual([1.0, 1.0, 1.0], profile.sum(axis=1).tolist())
+        with self.assertRaises(ValueError):
+            sequence_file.get_profile(weights=[1.0, 1.0])
+
+    def test_get_profile_3(self):
+        rng = np.random.RandomState(41)
+        indexes = rng.randint(0, 21, (3000, 17))
+        matrix = np.frombuffer(b"ACDEFGHIKLMNPQRSTVWY-", dtype=np.uint8)[indexes]
+        sequence_file = SequenceFile.from_matrix("test", [str(i) for i in range(3000)], matrix)
+        weights = rng.rand(3000)
+        expected = np.zeros((17, 21))
+        for i in range(17):
+            np.add.at(expected[i], indexes[:, i], weights)
+        self.assertTrue(np.allclose(expected, sequence_file.get_profile(weights=weights, nthreads=3)))
+        self.assertEqual(np.round(expected / weights.sum(), 6).tolist(), np.round(
+            sequence_file.get_profile(weights=weights, normalize=True), 6).tolist())
+
     def test_filter_1(self):
         sequence_file = SequenceFile("test")
         for seq in [Sequence("foo", "AAAAAA"), Sequence("bar", "AAAAAA"), Sequence("doe", "AAAAAA")]:
@@ -324,6 +508,21 @@ class TestSequenceFile(unittest.TestCase):
         filtered = sequence_file.filter(min_id=0.1, max_id=0.9)
         self.assertEqual(["foo", "bar"], [s.id for s in filtered])
 
+    def test_filter_7(self):
+        rng = np.random.RandomState(41)
+        families = rng.randint(0, 20, (5, 30))
+        mutated = rng.rand(200, 30) < rng.rand(200, 1)
+        rows = np.where(mutated, rng.randint(0, 8, (200, 30)), families[rng.randint(0, 5, 200)])
+        matrix = np.frombuffer(b"ACDEFGHIKLMNPQRSTVWY-", dtype=np.uint8)[rows]
+        sequence_file = SequenceFile.from_matrix("test", [str(i) for i in range(200)], matrix)
+        for min_id, max_id in [(0.0, 0.9), (0.0, 0.5), (0.0, 0.2), (0.01, 1.0), (0.03, 0.8)]:
+            identities = 1.0 - (matrix[:, np.newaxis] != matrix[np.newaxis]).sum(axis=2) / 30.0
+            expected = [
+                str(j) for j in range(200) if all(min_id <= identities[i, j] <= max_id for i in range(j))
+            ]
+            self.assertEqual(expected, [s.id for s in sequence_file.filter(min_id=min_id, max_id=max_id)])
+            self.assertEqual(expected, [s.id for s in sequence_file.filter(min_id=min_id, max_id=max_id, nthreads=3)])
+
     def test_filter_gapped_1(self):
         sequence_file = SequenceFile("test")
         sequence_file.add(Sequence("foo", "-----"))
@@ -354,6 +553,166 @@ class TestSequenceFile(unittest.TestCase):
         filtered = sequence_file.filter_gapped(min_prop=0.199999999, max_prop=1.0)
         self.assertEqual([], [s.id for s in filtered])
 
+    def test_filter_columns_1(self):
+        sequence_file = SequenceFile("test")
+        for seq in [Sequence("foo", "A-CDE"), Sequence("bar", "AA-DE"), Sequence("doe", "A--D-")]:
+            sequence_file.add(seq)
+        filtered = sequence_file.filter_columns()
+        self.assertEqual(["ACDE", "A-DE", "A-D-"], [s.seq for s in filtered])
+        self.assertEqual(["A-CDE", "AA-DE", "A--D-"], [s.seq for s in sequence_file])
+
+    def test_filter_columns_2(self):
+        sequence_file = SequenceFile("test")
+        for seq in [Sequence("foo", "A-CDE"), Sequence("bar", "AA-DE"), Sequence("doe", "A--D-")]:
+            sequence_file.add(seq)
+        filtered = sequence_file.filter_columns(max_prop=0.5, query_gaps=False, inplace=True)
+        self.assertIs(sequence_file, filtered)
+        self.assertEqual(["ADE", "ADE", "AD-"], [s.seq for s in sequence_file])
+        self.assertEqual([3, 3, 3], [s.seq_array.shape[0] for s in sequence_file])
+
+    def test_filter_columns_3(self):
+        matrix = np.frombuffer(b"A-CDEAA-DEA--D-", dtype=np.uint8).reshape(3, 5)
+        sequence_file = SequenceFile.from_matrix("test", ["foo", "bar", "doe"], matrix)
+        filtered = sequence_file.filter_columns(max_prop=0.5)
+        self.assertTrue(filtered.columnar)
+        self.assertEqual(["foo", "bar", "doe"], [s.id for s in filtered])
+        self.assertEqual(["ADE", "ADE", "AD-"], [s.seq for s in filtered])
+        self.assertEqual(["A-CDE", "AA-DE", "A--D-"], [s.seq for s in sequence_file])
+        with self.assertRaises(ValueError):
+            sequence_file.filter_columns(max_prop=1.1)
+
+    def test_filter_coverage_1(self):
+        sequence_file = SequenceFile("test")
+        for seq in [Sequence("foo", "AC-DE"), Sequence("bar", "A--D-"), Sequence("doe", "-CCDE")]:
+            sequence_file.add(seq)
+        filtered = sequence_file.filter_coverage(min_cov=0.6)
+        self.assertEqual(["foo", "doe"], [s.id for s in filtered])
+        self.assertEqual(["foo", "bar", "doe"], [s.id for s in sequence_file])
+        filtered = sequence_file.filter_coverage(min_cov=0.5)
+        self.assertEqual(["foo", "bar", "doe"], [s.id for s in filtered])
+
+    def test_filter_coverage_2(self):
+        matrix = np.frombuffer(b"AC-DEA--D--CCDE", dtype=np.uint8).reshape(3, 5)
+        sequence_file = SequenceFile.from_matrix("test", ["foo", "bar", "doe"], matrix)
+        filtered = sequence_file.filter_coverage(min_cov=0.8, inplace=True)
+        self.assertIs(sequence_file, filtered)
+        self.assertEqual(["foo"], [s.id for s in sequence_file])
+        with self.assertRaises(ValueError):
+            sequence_file.filter_coverage(min_cov=-0.1)
+
+    def test_keep_columns_1(self):
+        sequence_file = SequenceFile("test")
+        for seq in [Sequence("foo", "ACDEF"), Sequence("bar", "CDEFG")]:
+            sequence_file.add(seq)
+        self.assertEqual(["ADF", "CEG"], [s.seq for s in sequence_file.keep_columns([0, 2, 4])])
+        self.assertEqual(["CE", "DF"], [s.seq for s in sequence_file.keep_columns(slice(1, 4, 2))])
+        mask = np.array([False, True, True, False, False])
+        self.assertEqual(["CD", "DE"], [s.seq for s in sequence_file.keep_columns(mask)])
+        with self.assertRaises(ValueError):
+            sequence_file.keep_columns([True, False])
+
+    def test_keep_columns_2(self):
+        sequence_file = SequenceFile("test")
+        for seq in [Sequence("foo", "ACDEF"), Sequence("bar", "CDE")]:
+            sequence_file.add(seq)
+        with self.assertRaises(ValueError):
+            sequence_file.keep_columns([0, 1])
+
+    def test_cluster_1(self):
+        sequence_file = SequenceFile("test")
+        for seq in [
+            Sequence("foo", "AAAA-"),
+            Sequence("bar", "AAAAC"),
+            Sequence("cho", "CCCCD"),
+            Sequence("doe", "AAAC-"),
+            Sequence("fox", "CCCC-"),
+        ]:
+            sequence_file.add(seq)
+        labels, representatives = sequence_file.cluster(identity=0.8)
+        self.assertEqual([0, 0, 1, 0, 1], labels.tolist())
+        self.assertEqual(["foo", "cho"], representatives)
+        labels, representatives = sequence_file.cluster(identity=1.0)
+        self.assertEqual([0, 1, 2, 3, 4], labels.tolist())
+        self.assertEqual(["foo", "bar", "cho", "doe", "fox"], representatives)
+        labels, representatives = sequence_file.cluster(identity=0.0)
+        self.assertEqual([0, 0, 0, 0, 0], labels.tolist())
+        self.assertEqual(["foo"], representatives)
+
+    def test_cluster_2(self):
+        rng = np.random.RandomState(41)
+        families = rng.randint(0, 20, (5, 30))
+        mutated = rng.rand(400, 30) < rng.rand(400, 1)
+        rows = np.where(mutated, rng.randint(0, 21, (400, 30)), families[rng.randint(0, 5, 400)])
+        matrix = np.frombuffer(b"ACDEFGHIKLMNPQRSTVWY-", dtype=np.uint8)[rows]
+        ids = [str(i) for i in range(400)]
+        order = np.argsort(-np.where(np.arange(400) == 0, 31, (rows != 20).sum(axis=1)), kind="stable")
+        for identity in (0.3, 0.6, 0.9):
+            sequence_file = SequenceFile.from_matrix("test", ids, matrix)
+            representatives, expected = [], [None] * 400
+            for row in order:
+                for i, representative in enumerate(representatives):
+                    if (matrix[row] != matrix[representative]).sum() <= (1.0 - identity) * 30 + 1e-9:
+                        expected[row] = i
+                        break
+                else:
+                    expected[row] = len(representatives)
+                    representatives.append(row)
+            labels, names = sequence_file.cluster(identity=identity, nthreads=2)
+            self.assertEqual(expected, labels.tolist())
+            self.assertEqual([str(r) for r in representatives], names)
+            sequence_file.get_identity_matrix()
+            self.assertEqual(expected, sequence_file.cluster(identity=identity)[0].tolist())
+
+    def test_cluster_3(self):
+        sequence_file = SequenceFile("test")
+        sequence_file.add(Sequence("foo", "AAAA"))
+        with self.assertRaises(ValueError):
+            sequence_file.cluster(method="foo")
+        with self.assertRaises(ValueError):
+            sequence_file.cluster(identity=1.1)
+        sequence_file.add(Sequence("bar", "AAA"))
+        with self.assertRaises(ValueError):
+            sequence_file.cluster()
+
+    def test_reduce_to_1(self):
+        sequence_file = SequenceFile("test")
+        for seq in [
+            Sequence("foo", "AAAA-"),
+            Sequence("bar", "AAAAC"),
+            Sequence("cho", "CCCCD"),
+            Sequence("doe", "AAAC-"),
+            Sequence("fox", "CCCC-"),
+        ]:
+            sequence_file.add(seq)
+        self.assertEqual(["foo", "cho"], [s.id for s in sequence_file.reduce_to(nseq=2)])
+        self.assertEqual(["foo"], [s.id for s in sequence_file.reduce_to(nseq=1)])
+        self.assertEqual(5, len(sequence_file.reduce_to(nseq=5)))
+        reduced = sequence_file.reduce_to(nseq=4, inplace=True)
+        self.assertIs(sequence_file, reduced)
+        self.assertEqual(["foo", "cho"], [s.id for s in sequence_file])
+
+    def test_reduce_to_2(self):
+        rng = np.random.RandomState(41)
+        families = rng.randint(0, 20, (5, 30))
+        mutated = rng.rand(400, 30) < rng.rand(400, 1)
+        rows = np.where(mutated, rng.randint(0, 21, (400, 30)), families[rng.randint(0, 5, 400)])
+        matrix = np.frombuffer(b"ACDEFGHIKLMNPQRSTVWY-", dtype=np.uint8)[rows]
+        sequence_file = SequenceFile.from_matrix("test", [str(i) for i in range(400)], matrix)
+        for nseq in (1, 10, 100, 399):
+            reduced = sequence_file.reduce_to(nseq=nseq)
+            self.assertLessEqual(len(reduced), nseq)
+            self.assertEqual("0", reduced.top.id)
+        for meff in (1, 10, 100):
+            reduced = sequence_file.reduce_to(meff=meff)
+            self.assertGreaterEqual(reduced.meff, meff)
+            self.assertLess(len(reduced), 400)
+        with self.assertRaises(ValueError):
+            sequence_file.reduce_to()
+        with self.assertRaises(ValueError):
+            sequence_file.reduce_to(nseq=10, meff=10)
+        with self.assertRaises(ValueError):
+            sequence_file.reduce_to(nseq=0)
+
     def test_diversity_1(self):
         sequence_file = SequenceFile("test")
         for seq in [Sequence("foo", "AAAAAA"), Sequence("bar", "CCCCCC"), Sequence("doe", "DDDDDD")]:
@@ -377,6 +736,154 @@ class TestSequenceFile(unittest.TestCase):
         with self.assertRaises(ValueError):
             sequence_file.diversity
 
+    def test_cache_1(self):
+        sequence_file = SequenceFile("test")
+        for s in [Sequence("foo", "AAAAAAA"), Sequence("bar", "AAAAAAC"), Sequence("cho", "CCCCCCC")]:
+            sequence_file.add(s)
+        weights = sequence_file.get_weights()
+        self.assertEqual([0.5, 0.5, 1.0], weights)
+        weights.append(1.0)
+        self.assertEqual([0.5, 0.5, 1.0], sequence_file.get_weights())
+        self.assertEqual(2, sequence_file.meff)
+        self.assertEqual(0.247, sequence_file.diversity)
+        sequence_file.add(Sequence("doo", "CCCCCCA"))
+        self.assertEqual([0.5, 0.5, 0.5, 0.5], sequence_file.get_weights())
+        self.assertEqual(0.286, sequence_file.diversity)
+        sequence_file["foo"].seq = "DDDDDDD"
+        self.assertEqual([1.0, 1.0, 0.5, 0.5], sequence_file.get_weights())
+        self.assertEqual([0, 0, 0, 0, 0, 0, 0], sequence_file.get_frequency("X"))
+        sequence_file.remove("cho")
+        self.assertEqual([1.0, 1.0, 1.0], sequence_file.get_weights())
+        sequence_file.sort("seq", inplace=True)
+        self.assertEqual(["bar", "doo", "foo"], [s.id for s in sequence_file])
+        self.assertEqual(3, sequence_file.meff)
+        self.assertEqual([1, 1, 1, 1, 1, 1, 1], sequence_file.get_frequency("A"))
+        sequence_file.trim(1, 1, inplace=True)
+        self.assertEqual([1], sequence_file.get_frequency("A"))
+        self.assertTrue(sequence_file.is_alignment)
+        sequence_file["foo"].seq = "DD"
+        self.assertFalse(sequence_file.is_alignment)
+
+    def test_cache_2(self):
+        sequence_file = self._columnar("AAAAAAA", "AAAAAAC", "CCCCCCC")
+        self.assertEqual([0.5, 0.5, 1.0], sequence_file.get_weights())
+        sequence_file[2].seq = "AAAAACC"
+        self.assertEqual([0.5, 0.3333333333333333, 0.5], sequence_file.get_weights())
+        sequence_file.keep([False, True, True])
+        self.assertEqual([0.5, 0.5], sequence_file.get_weights())
+        copy = sequence_file[:1]
+        self.assertEqual([1.0], copy.get_weights())
+        self.assertEqual([0.5, 0.5], sequence_file.get_weights())
+        self.assertEqual([0, 0, 0, 0, 0, 0, 0], sequence_file.get_frequency("X"))
+        sequence_file.trim(1, 3, inplace=True)
+        self.assertEqual([0, 0, 0], sequence_file.get_frequency("X"))
+
+    def test_cache_3(self):
+        sequence_file = SequenceFile("test")
+        for s in [Sequence("foo", "AAAAAAA"), Sequence("bar", "AAAAAAC"), Sequence("cho", "CCCCCCC")]:
+            sequence_file.add(s)
+        self.assertEqual([0.5, 0.5, 1.0], sequence_file.get_weights())
+        self.assertNotEqual({}, sequence_file._cache)
+        copy = sequence_file.deepcopy()
+        self.assertEqual({}, copy._cache)
+        self.assertNotEqual({}, sequence_file._cache)
+        self.assertEqual([0.5, 0.5, 1.0], copy.get_weights())
+
+    def test_cache_4(self):
+        sequence_file = self._columnar("AAAAAAA", "AAAAAAC", "CCCCCCC")
+        sequence_file.get_identity_matrix()
+        sequence_file.get_weights()
+        self.assertEqual(2, len(sequence_file._cache))
+        sequence_file.add(Sequence("doo", "CCCCCCA"))
+        self.assertEqual({}, sequence_file._cache)
+        self.assertEqual([0.5, 0.5, 0.5, 0.5], sequence_file.get_weights())
+
+    def test_summary_1(self):
+        sequence_file = SequenceFile("test")
+        for s in [Sequence("foo", "AAAAAAA"), Sequence("bar", "AAAAAAC"), Sequence("cho", "CCCCCCC")]:
+            sequence_file.add(s)
+        self.assertEqual(
+            "Summary for test\n-------------------------------\nAlignment:\t\tTrue\n"
+            "Number of sequences:\t3\nAlignment depth (0.8):\t2\n",
+            sequence_file.summary(),
+        )
+
+    def _columnar(self, *seqs):
+        matrix = np.frombuffer("".join(seqs).encode("ascii"), dtype=np.uint8).reshape(len(seqs), -1)
+        return SequenceFile.from_matrix("test", ["seq_%d" % i for i in range(len(seqs))], matrix)
+
+    def test_from_matrix_1(self):
+        sequence_file = self._columnar("AAAAA", "BBBBB", "CCCCC")
+        self.assertTrue(sequence_file.columnar)
+        self.assertTrue(sequence_file.is_alignment)
+        self.assertEqual(3, sequence_file.nseq)
+        self.assertIn("seq_1", sequence_file)
+        self.assertNotIn("seq_3", sequence_file)
+        self.assertEqual("BBBBB", sequence_file["seq_1"].seq)
+        self.assertEqual("CCCCC", sequence_file[-1].seq)
+        self.assertIs(sequence_file, sequence_file[0].parent)
+        self.assertEqual(["seq_2", "seq_1", "seq_0"], [s.id for s in reversed(sequence_file)])
+        self.assertEqual(["seq_0", "seq_2"], [s.id for s in sequence_file[::2]])
+        self.assertTrue(sequence_file.columnar)
+
+    def test_from_matrix_2(self):
+        seqs = ["AAAAA", "-AA-A", "CCCCC", "A-CC-"]
+        sequence_file = SequenceFile("test")
+        for i, seq in enumerate(seqs):
+            sequence_file.add(Sequence("seq_%d" % i, seq))
+        columnar = self._columnar(*seqs)
+        self.assertEqual(sequence_file.ascii_matrix, columnar.ascii_matrix)
+        self.assertEqual(sequence_file.encoded_matrix, columnar.encoded_matrix)
+        self.assertEqual(sequence_file.get_weights(identity=0.7), columnar.get_weights(identity=0.7))
+        self.assertEqual(sequence_file.get_frequency("X"), columnar.get_frequency("X"))
+        self.assertEqual(
+            [s.id for s in sequence_file.filter(min_id=0.1, max_id=0.7)],
+            [s.id for s in columnar.filter(min_id=0.1, max_id=0.7)],
+        )
+        filtered = columnar.filter_gapped(max_prop=0.3, inplace=False)
+        self.assertTrue(filtered.columnar)
+        self.assertEqual(["seq_0", "seq_2"], [s.id for s in filtered])
+        self.assertEqual(4, columnar.nseq)
+
+    def test_from_matrix_3(self):
+        sequence_file = self._columnar("AAAAA", "BBBBB", "CCCCC")
+        view = sequence_file["seq_1"]
+        del sequence_file["seq_0"]
+        sequence_file.remove_many(["seq_2"])
+        self.assertEqual(["seq_1"], [s.id for s in sequence_file])
+        self.assertTrue(sequence_file.columnar)
+        sequence_file.add(Sequence("foo", "DD"))
+        self.assertFalse(sequence_file.columnar)
+        self.assertIs(view, sequence_file["seq_1"])
+        self.assertEqual(["BBBBB", "DD"], [s.seq for s in sequence_file])
+
+    def test_from_matrix_4(self):
+        sequence_file = self._columnar("AAAAA", "BBBBB", "CCCCC")
+        view = sequence_file[1]
+        view.seq = "DDDDD"
+        self.assertTrue(sequence_file.columnar)
+        self.assertEqual("DDDDD", sequence_file["seq_1"].seq)
+        view.seq = "DD"
+        self.assertFalse(sequence_file.columnar)
+        self.assertFalse(sequence_file.is_alignment)
+        self.assertIs(view, sequence_file["seq_1"])
+        self.assertEqual(["AAAAA", "DD", "CCCCC"], [s.seq for s in sequence_file])
+
+    def test_from_matrix_5(self):
+        sequence_file = self._columnar("ACDEF", "BBBBB", "CC-CC")
+        deep = sequence_file.deepcopy()
+        deep[0].seq = "WWWWW"
+        self.assertEqual("ACDEF", sequence_file[0].seq)
+        trimmed = sequence_file.trim(2, 4)
+        self.assertTrue(trimmed.columnar)
+        self.assertEqual(["CDE", "BBB", "C-C"], [s.seq for s in trimmed])
+        self.assertEqual("ACDEF", sequence_file[0].seq)
+        ordered = sequence_file.sort("seq", reverse=True)
+        self.assertTrue(ordered.columnar)
+        self.assertEqual(["seq_2", "seq_1", "seq_0"], [s.id for s in ordered])
+        sequence_file.keep([True, False, True])
+        self.assertEqual(["seq_0", "seq_2"], [s.id for s in sequence_file])
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,134 @@
+"""Testing facility for conkit.core.SequenceStore"""
+
+__author__ = "Felix Simkovic"
+__date__ = "16 Oct 2026"
+
+import numpy as np
+import unittest
+
+from conkit.core.sequence import Sequence
+from conkit.core.sequencestore import SequenceStore, SequenceView
+
+
+def _matrix(*seqs):
+    return np.frombuffer("".join(seqs).encode("ascii"), dtype=np.uint8).reshape(len(seqs), -1)
+
+
+class TestSequenceStore(unittest.TestCase):
+    def test_from_matrix_1(self):
+        matrix = np.ascontiguousarray(_matrix("AC-D", "aCEF"))
+        store = SequenceStore.from_matrix(["foo", "bar"], matrix)
+        self.assertEqual(2, len(store))
+        self.assertIs(matrix, store.matrix)
+        self.assertEqual(["foo", "bar"], store.ids)
+
+    def test_from_matrix_2(self):
+        with self.assertRaises(ValueError):
+            SequenceStore.from_matrix(["foo", "bar"], _matrix("AC-D", "AC!D"))
+
+    def test_from_matrix_3(self):
+        with self.assertRaises(ValueError):
+            SequenceStore.from_matrix(["foo", "foo"], _matrix("ACDE", "ACDE"))
+
+    def test_from_matrix_4(self):
+        with self.assertRaises(ValueError):
+            SequenceStore.from_matrix(["foo"], _matrix("ACDE", "ACDE"))
+        with self.assertRaises(TypeError):
+            SequenceStore.from_matrix([1, 2], _matrix("ACDE", "ACDE"))
+
+    def test_from_sequences_1(self):
+        sequence = Sequence("bar", "CC-D")
+        sequence.remark = "hello"
+        store = SequenceStore.from_sequences([Sequence("foo", "ACDE"), sequence])
+        self.assertEqual([b"ACDE", b"CC-D"], [row.tobytes() for row in store.matrix])
+        self.assertEqual({1: ["hello"]}, store.remarks)
+
+    def test_from_sequences_2(self):
+        with self.assertRaises(ValueError):
+            SequenceStore.from_sequences([Sequence("foo", "ACDE"), Sequence("bar", "ACD")])
+
+    def test_find_1(self):
+        store = SequenceStore.from_matrix(["foo", "bar"], _matrix("ACDE", "CCDE"))
+        self.assertEqual(1, store.find("bar"))
+        self.assertIsNone(store.find("doe"))
+        self.assertIsNone(store.find(["foo"]))
+        store.alive[1] = False
+        self.assertIsNone(store.find("bar"))
+        store.set_id(0, "doe")
+        self.assertIsNone(store.find("foo"))
+        self.assertEqual(0, store.find("doe"))
+
+    def test_take_1(self):
+        store = SequenceStore.from_matrix(["foo", "bar", "doe"], _matrix("ACDE", "CCDE", "DCDE"))
+        store.remarks[2] = ["hello"]
+        taken = store.take([2, 0])
+        self.assertEqual(["doe", "foo"], taken.ids)
+        self.assertEqual({0: ["hello"]}, taken.remarks)
+        self.assertEqual(b"DCDEACDE", taken.matrix.tobytes())
+        taken.matrix[0, 0] = ord("W")
+        self.assertEqual(ord("D"), store.matrix[2, 0])
+
+    def test_to_sequences_1(self):
+        store = SequenceStore.from_matrix(["foo", "bar"], _matrix("ACDE", "CC-D"))
+        store.remarks[1] = ["hello"]
+        view = store.view(1)
+        sequences = store.to_sequences([1, 0], detach=False)
+        self.assertEqual([Sequence, Sequence], [type(s) for s in sequences])
+        self.assertEqual(["bar", "foo"], [s.id for s in sequences])
+        self.assertEqual(["CC-D", "ACDE"], [s.seq for s in sequences])
+        self.assertEqual([["hello"], []], [s.remark for s in sequences])
+        self.assertIsNot(view, sequences[0])
+        sequences = store.to_sequences([1, 0])
+        self.assertIs(view, sequences[0])
+        store._writable()[1, 0] = ord("W")
+        self.assertEqual("CC-D", view.seq)
+
+
+class TestSequenceView(unittest.TestCase):
+    def test_view_1(self):
+        store = SequenceStore.from_matrix(["foo", "bar"], _matrix("ACDE", "CC-D"))
+        view = store.view(1)
+        self.assertIsInstance(view, Sequence)
+        self.assertIs(view, store.view(1))
+        self.assertEqual("bar", view.id)
+        self.assertEqual("CC-D", view.seq)
+        self.assertEqual(4, view.seq_len)
+        self.assertEqual(bytearray(b"CC-D"), view.seq_ascii)
+        self.assertEqual([2, 2, 21, 3], view.seq_encoded)
+        self.assertEqual([67, 67, 45, 68], view.seq_array.tolist())
+        self.assertFalse(view.seq_array.flags.writeable)
+
+    def test_view_2(self):
+        store = SequenceStore.from_matrix(["foo", "bar"], _matrix("ACDE", "CC-D"))
+        view = store.view(0)
+        view.seq = "WWWW"
+        view.id = "doe"
+        view.remark = "hello"
+        self.assertEqual(b"WWWW", store.matrix[0].tobytes())
+        self.assertEqual(b"WWWW", view.seq_array.tobytes())
+        self.assertEqual(0, store.find("doe"))
+        self.assertEqual({0: ["hello"]}, store.remarks)
+        with self.assertRaises(KeyError):
+            view.seq = "WW!W"
+
+    def test_view_3(self):
+        store = SequenceStore.from_matrix(["foo", "bar"], _matrix("ACDE", "CC-D"))
+        view = store.view(0)
+        view.seq = "WW"
+        self.assertEqual("WW", view.seq)
+        self.assertEqual(2, len(view))
+        self.assertEqual("foo", view.id)
+        self.assertEqual(b"ACDE", store.matrix[0].tobytes())
+
+    def test_copy_1(self):
+        store = SequenceStore.from_matrix(["foo", "bar"], _matrix("ACDE", "CC-D"))
+        view = store.view(0)
+        for copy in (view.copy(), view.deepcopy()):
+            self.assertNotIsInstance(copy, SequenceView)
+            self.assertEqual(("foo", "ACDE"), (copy.id, copy.seq))
+            copy.seq = "WW"
+        self.assertEqual("ACDE", view.seq)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
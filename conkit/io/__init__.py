@@ -36,7 +36,7 @@ __version__ = "0.2"
 import importlib
 
 from conkit.io._cache import PARSER_CACHE
-from conkit.io._iotools import open_f_handle
+from conkit.io._iotools import is_str_like, open_f_handle, replace_f_handle
 
 # Accessed by some modules - might be deprecated in the future
 CONTACT_FILE_PARSERS = PARSER_CACHE.contact_file_parsers
@@ -117,6 +117,11 @@ def read(fname, format, f_id="conkit", **kwargs):
     >>> with open('example.mat', 'r') as f_in:
     ...     hierarchy = io.read(f_in, 'ccmpred')
 
+    3) Read a hierarchy previously written in the binary ConKit format, which memory-maps all arrays:
+
+    >>> from conkit import io
+    >>> hierarchy = io.read('example.ckt', 'conkit')
+
     """
     if format in PARSER_CACHE:
         parser_in = PARSER_CACHE.import_class(format)()
@@ -127,12 +132,103 @@ def read(fname, format, f_id="conkit", **kwargs):
     if format == "a3m-inserts":
         kwargs["remove_inserts"] = False
 
-    with open_f_handle(fname, "read") as f_in:
+    with open_f_handle(fname, "read", binary=parser_in.binary) as f_in:
         hierarchy = parser_in.read(f_in, **kwargs)
 
     return hierarchy
 
 
+def index(fname, format, **kwargs):
+    """Open a sequence file for random access to individual sequences
+
+    Parameters
+    ----------
+    fname : str
+       A file path
+    format : str
+       File format of the file, either ``fasta`` or ``a3m``
+    **kwargs
+       Keyword arguments passed on to :obj:`~conkit.io._index.SequenceIndex`
+
+    Returns
+    -------
+    :obj:`~conkit.io._index.SequenceIndex`
+
+    Raises
+    ------
+    :exc:`ValueError`
+       Sequence file format cannot be indexed
+
+    Examples
+    --------
+    1) Read the query and a single hit from a large Multiple Sequence Alignment file:
+
+    >>> from conkit import io
+    >>> with io.index('example.a3m', 'a3m') as sequence_index:
+    ...     query, hit = sequence_index[0], sequence_index['hit']
+
+    Note
+    ----
+    The index is stored next to the file with a ``.cki`` suffix and rebuilt automatically
+    whenever the file changes.
+
+    """
+    from conkit.io._index import SequenceIndex
+
+    if format not in ["a3m", "fasta"]:
+        raise ValueError("Sequence file format cannot be indexed: {}".format(format))
+    return SequenceIndex(fname, remove_inserts=format == "a3m", **kwargs)
+
+
+def iter_read(fname, format, **kwargs):
+    """Iterate over the sequences in a sequence file one record at a time
+
+    Parameters
+    ----------
+    fname : filehandle, filename
+       A file path or open file handle
+    format : str
+       File format of handle
+
+    Returns
+    -------
+    generator
+       A generator of :obj:`~conkit.core.sequence.Sequence` instances
+
+    Raises
+    ------
+    :exc:`ValueError`
+       Unrecognised sequence file format
+
+    Examples
+    --------
+    1) Count the sequences in a large Multiple Sequence Alignment file:
+
+    >>> from conkit import io
+    >>> nseq = sum(1 for _ in io.iter_read('example.a3m', 'a3m'))
+
+    Note
+    ----
+    FASTA, A2M/Jones and A3M files without insert states are read in constant memory.
+    All other formats are read completely before the first sequence is returned.
+
+    """
+    if format in SEQUENCE_FILE_PARSERS:
+        parser_in = PARSER_CACHE.import_class(format)()
+    else:
+        raise ValueError("Unrecognised sequence file format: {}".format(format))
+
+    if format == "a3m-inserts":
+        kwargs["remove_inserts"] = False
+
+    def iterate():
+        with open_f_handle(fname, "read") as f_in:
+            for sequence in parser_in.iter_read(f_in, **kwargs):
+                yield sequence
+
+    return iterate()
+
+
 def write(fname, format, hierarchy, **kwargs):
     """Parse a file handle to read into structure
 
@@ -170,5 +266,10 @@ def write(fname, format, hierarchy, **kwargs):
     if format in ["flib", "pconsc", "pconsc2", "saint2"]:
         kwargs["write_header_footer"] = False
 
-    with open_f_handle(fname, "write") as f_out:
+    if parser_out.binary and is_str_like(fname):
+        # Binary files may still be memory-mapped by a hierarchy that was read from them
+        f_context = replace_f_handle(fname)
+    else:
+        f_context = open_f_handle(fname, "write", binary=parser_out.binary)
+    with f_context as f_out:
         parser_out.write(f_out, hierarchy, **kwargs)
@@ -0,0 +1,217 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2016-19, University of Liverpool
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Random-access index for large FASTA and A3M sequence files"""
+
+__author__ = "Felix Simkovic"
+__date__ = "16 Oct 2026"
+__version__ = "0.1"
+
+import mmap
+import numbers
+import numpy as np
+import os
+
+from conkit.core.sequence import Sequence
+from conkit.core.sequencefile import SequenceFile
+from conkit.io.a3m import INSERT_STATES
+
+# Signature and version of the first line in an index file
+INDEX_SIGNATURE = "#conkit-index"
+INDEX_VERSION = 1
+
+
+class SequenceIndex(object):
+    """Lazy reader of a FASTA or A3M sequence file through an index of its records
+
+    The byte offset and length of each record are stored in an index file next to the sequence file.
+    The sequence file itself is memory-mapped, and each record is only parsed when accessed. The index
+    is rebuilt whenever the size or modification time of the sequence file changed since it was built.
+
+    Attributes
+    ----------
+    fname : str
+       The path to the sequence file
+    index_fname : str
+       The path to the index file
+    ids : list
+       The sequence identifier of each record
+
+    Examples
+    --------
+    >>> from conkit.io._index import SequenceIndex
+    >>> with SequenceIndex('example.fas') as sequence_index:
+    ...     query = sequence_index[0]
+    ...     hit = sequence_index['hit']
+
+    """
+
+    # Bytes of the sequence file scanned for records at once
+    _CHUNK_BYTES = 1 << 26
+
+    def __init__(self, fname, remove_inserts=False, index_fname=None, rebuild=False):
+        """Initialise a new index, building the index file if required
+
+        Parameters
+        ----------
+        fname : str
+           The path to the sequence file
+        remove_inserts : bool, optional
+           Remove lower-case A3M insert states from each sequence [default: False]
+        index_fname : str, optional
+           The path to the index file [default: ``fname`` with a ``.cki`` suffix]
+        rebuild : bool, optional
+           Rebuild the index file even if it is up to date [default: False]
+
+        """
+        self.fname = fname
+        self.index_fname = fname + ".cki" if index_fname is None else index_fname
+        self.remove_inserts = remove_inserts
+        self._f_handle = open(fname, "rb")
+        self._mmap = b""
+        try:
+            stat = os.fstat(self._f_handle.fileno())
+            self._stamp = (stat.st_size, stat.st_mtime_ns)
+            if stat.st_size > 0:
+                self._mmap = mmap.mmap(self._f_handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+            index = None if rebuild else self._read_index()
+            if index is None:
+                index = self._build_index()
+                self._write_index(index)
+        except BaseException:
+            self.close()
+            raise
+        self._offsets, self._lengths, self.ids = index
+        self._rows = {}
+        for row, id in enumerate(self.ids):
+            self._rows.setdefault(id, row)
+
+    def __contains__(self, id):
+        """True if there is a sequence with the given id"""
+        return id in self._rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __getitem__(self, id):
+        """Return the sequence with the given id or at the given position
+
+        A slice returns a :obj:`~conkit.core.sequencefile.SequenceFile` of all selected sequences.
+
+        """
+        if isinstance(id, slice):
+            sequence_file = SequenceFile(os.path.basename(self.fname))
+            for row in range(*id.indices(len(self))):
+                sequence_file.add(self._parse(row))
+            return sequence_file
+        elif isinstance(id, numbers.Integral) and not isinstance(id, (bool, np.bool_)):
+            id = int(id)
+            if id < 0:
+                id += len(self)
+            if not 0 <= id < len(self):
+                raise IndexError("Sequence index out of range")
+            return self._parse(id)
+        return self._parse(self._rows[id])
+
+    def __iter__(self):
+        """Iterate over all sequences in the order of the sequence file"""
+        for row in range(len(self)):
+            yield self._parse(row)
+
+    def __len__(self):
+        """Return the number of sequences"""
+        return len(self.ids)
+
+    def __repr__(self):
+        return '{}(fname="{}" nseq={})'.format(self.__class__.__name__, self.fname, len(self))
+
+    def close(self):
+        """Close the memory-mapped sequence file"""
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._f_handle.close()
+
+    def _parse(self, row):
+        """Parse the record at a row into a :obj:`~conkit.core.sequence.Sequence`"""
+        start = self._offsets[row]
+        lines = self._mmap[start : start + self._lengths[row]].split(b"\n")
+        seq = b"".join(line.strip() for line in lines[1:])
+        if self.remove_inserts:
+            seq = seq.translate(None, INSERT_STATES)
+        return Sequence(self.ids[row], seq.decode("utf-8"))
+
+    def _build_index(self):
+        """Locate the start of each record, i.e. each line starting with ``>``"""
+        size = len(self._mmap)
+        starts = [np.zeros(1 if self._mmap[:1] == b">" else 0, dtype=np.int64)]
+        for begin in range(0, size, self._CHUNK_BYTES):
+            # Include the last byte of the previous chunk to find records starting at the chunk boundary
+            lo = max(begin - 1, 0)
+            chunk = np.frombuffer(self._mmap, dtype=np.uint8, count=min(begin + self._CHUNK_BYTES, size) - lo, offset=lo)
+            starts.append(np.flatnonzero((chunk[1:] == ord(">")) & (chunk[:-1] == ord("\n"))) + lo + 1)
+            # Release the buffer of the memory-mapped file, otherwise it cannot be closed
+            del chunk
+        offsets = np.concatenate(starts).astype(np.int64)
+        lengths = np.diff(np.append(offsets, size))
+        ids = []
+        for offset in offsets.tolist():
+            end = self._mmap.find(b"\n", offset)
+            ids.append(self._mmap[offset + 1 : size if end < 0 else end].rstrip().decode("utf-8"))
+        return offsets.tolist(), lengths.tolist(), ids
+
+    def _read_index(self):
+        """Read the index file if it exists and matches the sequence file"""
+        try:
+            with open(self.index_fname, "r", encoding="utf-8") as f_in:
+                signature = f_in.readline().rstrip("\n").split("\t")
+                if signature != [INDEX_SIGNATURE, str(INDEX_VERSION), str(self._stamp[0]), str(self._stamp[1])]:
+                    return None
+                offsets, lengths, ids = [], [], []
+                for line in f_in:
+                    offset, length, id = line.rstrip("\n").split("\t", 2)
+                    offsets.append(int(offset))
+                    lengths.append(int(length))
+                    ids.append(id)
+        except (IOError, ValueError):
+            return None
+        return offsets, lengths, ids
+
+    def _write_index(self, index):
+        """Write the index file, which is skipped if it cannot be written"""
+        content = ["\t".join([INDEX_SIGNATURE, str(INDEX_VERSION), str(self._stamp[0]), str(self._stamp[1])])]
+        content += ["{}\t{}\t{}".format(*record) for record in zip(*index)]
+        try:
+            with open(self.index_fname, "w", encoding="utf-8") as f_out:
+                f_out.write("\n".join(content) + "\n")
+        except IOError:
+            pass
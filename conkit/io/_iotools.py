@@ -33,7 +33,9 @@ __author__ = "Felix Simkovic"
 __date__ = "20 Nov 2016"
 __version__ = "0.1"
 
+import contextlib
 import io
+import os
 import sys
 import tempfile
 
@@ -88,7 +90,7 @@ def is_str_like(content):
     return True
 
 
-def open_f_handle(f_handle, mode):
+def open_f_handle(f_handle, mode, binary=False):
     """Open a filehandle
 
     Parameters
@@ -97,6 +99,8 @@ def open_f_handle(f_handle, mode):
        A file handle or a file name
     mode : str
        read, write or append
+    binary : bool, optional
+       Open the file in binary mode [default: False]
 
     Returns
     -------
@@ -115,13 +119,51 @@ def open_f_handle(f_handle, mode):
         raise ValueError("Mode needs to be one of: append, read, write")
 
     try:
-        if is_str_like(f_handle) and sys.version_info.major >= 3:
+        if is_str_like(f_handle) and binary:
+            return io.open(f_handle, mode[0] + "b")
+        elif is_str_like(f_handle) and sys.version_info.major >= 3:
             return io.open(f_handle, mode[0], encoding="utf-8")
         elif is_str_like(f_handle):
             return open(f_handle, mode[0])
-        elif f_handle.mode == mode[0]:
+        elif f_handle.mode == mode[0] + ("b" if binary else ""):
             return f_handle
         else:
             raise TypeError("f_handle must be str or filehandle")
     except AttributeError:
         raise TypeError("f_handle must be str or filehandle")
+
+
+@contextlib.contextmanager
+def replace_f_handle(f_name):
+    """Open a binary temporary file that replaces a file on success
+
+    The temporary file is created in the directory of ``f_name`` and moved over it once the
+    block exits without error, so memory maps of the previous file keep their contents.
+
+    Parameters
+    ----------
+    f_name : str
+       The file name to replace
+
+    Yields
+    ------
+    f_handle
+       The open temporary file handle [write permissions, binary]
+
+    """
+    directory = os.path.dirname(os.path.abspath(f_name))
+    fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".conkit-")
+    try:
+        with io.open(fd, "wb") as f_handle:
+            yield f_handle
+        if os.path.exists(f_name):
+            os.chmod(tmp_name, os.stat(f_name).st_mode & 0o7777)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_name, 0o666 & ~umask)
+        os.replace(tmp_name, f_name)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        raise
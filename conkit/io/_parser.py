@@ -51,6 +51,9 @@ class Parser(ABC):
 
     """
 
+    # Files are read and written in binary mode
+    binary = False
+
     @abc.abstractmethod
     def read(self):
         pass
@@ -89,4 +92,23 @@ class ContactFileParser(Parser):
 class SequenceFileParser(Parser):
     """General purpose class for all sequence file parsers"""
 
-    pass
+    def iter_read(self, f_handle, **kwargs):
+        """Iterate over the sequences of a sequence file
+
+        This generic implementation reads the entire file first. Parsers of formats
+        that can be read one record at a time in constant memory override it.
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+        **kwargs
+           Keyword arguments passed on to ``read``
+
+        Yields
+        ------
+        :obj:`~conkit.core.sequence.Sequence`
+
+        """
+        for sequence in self.read(f_handle, **kwargs):
+            yield sequence
@@ -65,6 +65,28 @@ class A2mParser(SequenceFileParser):
 
         """
         hierarchy = SequenceFile(f_id)
+        for sequence in self.iter_read(f_handle):
+            hierarchy.add(sequence)
+        return hierarchy
+
+    def iter_read(self, f_handle):
+        """Iterate over the sequences of a sequence file one line at a time
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+
+        Yields
+        ------
+        :obj:`~conkit.core.sequence.Sequence`
+
+        Raises
+        ------
+        :exc:`ValueError`
+           Unknown character in line
+
+        """
         for i, line in enumerate(f_handle):
             line = line.strip()
             if line:
@@ -76,9 +98,7 @@ class A2mParser(SequenceFileParser):
                     msg = "Unknown character in line {0}:{1}{1}{2}{1}{3}"
                     msg = msg.format(i + 1, "\n", line, "".join(indicator))
                     raise ValueError(msg)
-                sequence = Sequence("seq_{}".format(i), line)
-                hierarchy.add(sequence)
-        return hierarchy
+                yield Sequence("seq_{}".format(i), line)
 
     def write(self, f_handle, hierarchy):
         """Write a sequence file instance to to file
@@ -42,24 +42,36 @@ __date__ = "11 Sep 2016"
 __version__ = "0.1"
 
 import numpy as np
-import re
 
 from conkit.io._parser import SequenceFileParser
+from conkit.io.fasta import FastaParser
 from conkit.core.sequence import Sequence
 from conkit.core.sequencefile import SequenceFile
 
+# Lower-case insert states removed from each sequence
+INSERT_STATES = bytes(range(ord("a"), ord("z") + 1))
+# Lookup table of match states indexed by ASCII code
+MATCH_STATES = np.zeros(256, dtype=np.bool_)
+MATCH_STATES[np.frombuffer(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789~-", dtype=np.uint8)] = True
+
 
 class A3mParser(SequenceFileParser):
     """Parser class for A3M sequence files
 
     """
 
+    # Approximate number of residues to pad with insert states at once
+    _CHUNK_BYTES = 1 << 24
+
     def __init__(self):
         super(A3mParser, self).__init__()
 
     def read(self, f_handle, f_id="a3m", remove_inserts=True):
         """Read a sequence file
 
+        If all sequences are aligned, the returned :obj:`~conkit.core.sequencefile.SequenceFile`
+        is matrix-backed, see :meth:`~conkit.core.sequencefile.SequenceFile.from_matrix`.
+
         Parameters
         ----------
         f_handle
@@ -73,78 +85,162 @@ class A3mParser(SequenceFileParser):
         -------
         :obj:`~conkit.core.sequencefile.SequenceFile`
 
+        Raises
+        ------
+        :exc:`KeyError`
+           Unrecognised residue in sequence
+        :exc:`ValueError`
+           Sequences need to have the same number of match states
+
         """
-        sequence_file = SequenceFile(f_id)
-        while True:
-            line = f_handle.readline().rstrip()
-            if not line:
-                continue
-            elif line.startswith("#"):
-                sequence_file.remark = line[1:]
-            elif line.startswith(">"):
-                break
-        while True:
-            if not line.startswith(">"):
-                raise ValueError("Fasta record needs to start with '>'")
-            id = line[1:]
-            chunks = []
-            line = f_handle.readline().rstrip()
-            while True:
-                if not line:
-                    break
-                elif line.startswith(">"):
-                    break
-                chunks.append(line)
-                line = f_handle.readline().rstrip()
-            seq_string = "".join(chunks)
-            if remove_inserts:
-                seq_string = self._remove_inserts(seq_string)
-            sequence_entry = Sequence(id, seq_string)
+        ids, seqs, remarks = [], [], []
+        seen = set()
+        for id, seq_string in FastaParser._iter_records(f_handle, remarks):
+            if id in seen:
+                new_id = id
+                while new_id in seen:
+                    new_id = id + "_{0}".format(np.random.randint(0, 100000))
+                id = new_id
+            seen.add(id)
+            ids.append(id)
+            seqs.append(seq_string.encode("ascii", "replace"))
+
+        if remove_inserts:
+            seqs = [seq.translate(None, INSERT_STATES) for seq in seqs]
+            matrix = None
+            if seqs and all(len(seq) == len(seqs[0]) for seq in seqs):
+                matrix = np.frombuffer(bytearray(b"".join(seqs)), dtype=np.uint8).reshape(len(seqs), len(seqs[0]))
+        else:
+            matrix = self._adjust_insert(seqs) if seqs else None
+
+        sequence_file = None
+        if matrix is not None:
             try:
-                sequence_file.add(sequence_entry)
+                sequence_file = SequenceFile.from_matrix(f_id, ids, matrix)
             except ValueError:
-                while True:
-                    new_id = sequence_entry.id + "_{0}".format(np.random.randint(0, 100000))
-                    if new_id in sequence_file:
-                        continue
-                    else:
-                        break
-                sequence_entry.id = new_id
-                sequence_file.add(sequence_entry)
-            if not line:
-                break
-        if not remove_inserts:
-            self._adjust_insert(sequence_file)
+                # Report the invalid residue as any other sequence file would
+                seqs = [row.tobytes() for row in matrix]
+        if sequence_file is None:
+            sequence_file = SequenceFile(f_id)
+            for id, seq in zip(ids, seqs):
+                sequence_file.add(Sequence(id, seq.decode("ascii")))
+        sequence_file.remark = remarks
         return sequence_file
 
-    def _adjust_insert(self, hierarchy):
+    def iter_read(self, f_handle, remove_inserts=True):
+        """Iterate over the sequences of a sequence file
+
+        Without insert states, sequences are read one record at a time in constant memory. Otherwise,
+        the entire file is read first to align the insert states of all sequences. Unlike
+        :meth:`read`, duplicate sequence identifiers are left unchanged.
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+        remove_inserts : bool, optional
+           Remove insert states [default: True]
+
+        Yields
+        ------
+        :obj:`~conkit.core.sequence.Sequence`
+
+        """
+        if remove_inserts:
+            return self._iter_sequences(f_handle, [], remove_inserts)
+        return super(A3mParser, self).iter_read(f_handle, remove_inserts=remove_inserts)
+
+    def _iter_sequences(self, f_handle, remarks, remove_inserts):
+        """Iterate over the sequences of each record, collecting the remarks before the first record"""
+        for id, seq_string in FastaParser._iter_records(f_handle, remarks):
+            if remove_inserts:
+                seq_string = self._remove_inserts(seq_string)
+            yield Sequence(id, seq_string)
+
+    def _adjust_insert(self, seqs):
         """Adjust insert states
 
+        Each sequence consists of the same number of match states, i.e. upper-case letters, digits,
+        ``~`` and ``-``, and the insert states between them. All inserts at the same position are
+        padded with gaps to the length of the longest insert found there in any sequence.
+
+        Parameters
+        ----------
+        seqs : list
+           The ASCII-encoded sequences
+
+        Returns
+        -------
+        :obj:`~numpy.ndarray`
+           The :math:`N \\times L` matrix of ASCII codes of the padded sequences
+
+        Raises
+        ------
+        :exc:`ValueError`
+           Sequences need to have the same number of match states
+
         Credits
         -------
         This function was adapted from Stefan Seemayer's BioPython-A3MIO
         repository - https://github.com/sseemayer/BioPython-A3MIO
 
         """
-        # Determine the insert states by splitting the sequences into chunks based
-        # on the case of the letter.
-        INSERT_STATE = re.compile(r"([A-Z0-9~-])")
-        inserts = [INSERT_STATE.split(sequence_entry.seq) for sequence_entry in hierarchy]
+        nmatch = np.count_nonzero(MATCH_STATES[np.frombuffer(seqs[0], dtype=np.uint8)])
+        # Process the sequences in chunks to limit the size of all temporary arrays
+        chunks, start, size = [], 0, 0
+        for stop, seq in enumerate(seqs, 1):
+            size += len(seq)
+            if size >= self._CHUNK_BYTES or stop == len(seqs):
+                chunks.append((start, stop))
+                start, size = stop, 0
+
+        # Determine the maximum insert length at each position
+        insert_max_lengths = np.zeros(nmatch + 1, dtype=np.int64)
+        for start, stop in chunks:
+            lengths = self._insert_states(seqs[start:stop], nmatch)[-1]
+            np.maximum(insert_max_lengths, lengths.max(axis=0), out=insert_max_lengths)
 
-        # Determine maximum insert length at each position
-        insert_max_lengths = [max(len(inserts[i][j]) for i in range(len(inserts))) for j in range(len(inserts[0]))]
+        # Insert position j precedes match state j in the padded sequences
+        offsets = np.arange(nmatch + 1) + np.cumsum(insert_max_lengths) - insert_max_lengths
+        matrix = np.full((len(seqs), offsets[-1] + insert_max_lengths[-1]), ord("-"), dtype=np.uint8)
+        for start, stop in chunks:
+            buffer, rows, positions, states, is_match, lengths = self._insert_states(seqs[start:stop], nmatch)
+            columns = offsets[states]
+            columns[is_match] += insert_max_lengths[states[is_match]]
+            is_insert = ~is_match
+            # Inserts precede their match state, so their rank is the number of earlier residues
+            # less the preceding match states and inserts at earlier positions
+            preceding = np.cumsum(lengths, axis=1) - lengths
+            columns[is_insert] += (positions - states)[is_insert] - preceding[rows[is_insert], states[is_insert]]
+            matrix[start + rows, columns] = buffer
+        return matrix
 
-        # Add gaps where gaps are needed
-        def pad(chunk, length, pad_char="-"):
-            return chunk + pad_char * (length - len(chunk))
+    @staticmethod
+    def _insert_states(seqs, nmatch):
+        """Locate the insert states of many sequences at once
 
-        # Manipulate each sequence to match insert states
-        for sequence_entry, seq in zip(hierarchy, inserts):
-            sequence_entry.seq = "".join(pad(insert, insert_len) for insert, insert_len in zip(seq, insert_max_lengths))
+        Returns the concatenated sequences with the row, the position in its row and the number
+        of preceding match states of each residue, a mask of match states, and the
+        :math:`N \\times (M + 1)` insert length at each position of each sequence.
+
+        """
+        lens = np.fromiter(map(len, seqs), dtype=np.int64, count=len(seqs))
+        buffer = np.frombuffer(b"".join(seqs), dtype=np.uint8)
+        rows = np.repeat(np.arange(len(seqs)), lens)
+        positions = np.arange(buffer.shape[0]) - np.repeat(np.cumsum(lens) - lens, lens)
+        is_match = MATCH_STATES[buffer]
+        nmatches = np.bincount(rows[is_match], minlength=len(seqs))
+        if np.any(nmatches != nmatch):
+            raise ValueError("Sequences need to have the same number of match states")
+        states = np.cumsum(is_match) - is_match
+        states -= np.repeat(np.cumsum(nmatches) - nmatches, lens)
+        is_insert = ~is_match
+        lengths = np.bincount(rows[is_insert] * (nmatch + 1) + states[is_insert], minlength=len(seqs) * (nmatch + 1))
+        return buffer, rows, positions, states, is_match, lengths.reshape(len(seqs), nmatch + 1)
 
     def _remove_inserts(self, seq):
         """Remove insert states"""
-        return "".join([char for char in seq if not char.islower()])
+        return seq.encode("ascii", "replace").translate(None, INSERT_STATES).decode("ascii")
 
     def write(self, f_handle, hierarchy):
         """Write a sequence file instance to to file
@@ -41,7 +41,6 @@ import numpy as np
 import sys
 
 from conkit.io._parser import ContactFileParser
-from conkit.core.contact import Contact
 from conkit.core.contactmap import ContactMap
 from conkit.core.contactfile import ContactFile
 
@@ -55,56 +54,105 @@ class CCMpredParser(ContactFileParser):
     def __init__(self):
         super(CCMpredParser, self).__init__()
 
-    def read(self, f_handle, f_id="ccmpred"):
+    def read(self, f_handle, f_id="ccmpred", max_contacts=None, min_score=None, min_separation=None):
         """Read a contact file
 
+        All options are applied to the matrix before the contact map is created,
+        so only the selected contacts are ever stored.
+
         Parameters
         ----------
         f_handle
            Open file handle [read permissions]
         f_id : str, optional
            Unique contact file identifier
+        max_contacts : int, optional
+           Keep only the highest scoring contacts [default: all]
+        min_score : float, optional
+           Keep only contacts with a score of at least this value [default: all]
+        min_separation : int, optional
+           Keep only contacts of residues at least this far apart in sequence [default: 0]
 
         Returns
         -------
         :obj:`~conkit.core.contactfile.ContactFile`
 
+        Raises
+        ------
+        :exc:`ValueError`
+           Could not convert string to float
+        :exc:`ValueError`
+           All rows of the matrix need to have the same number of columns
+
         """
         contact_file = ContactFile(f_id)
         contact_file.method = "Contact map predicted using CCMpred"
-        contact_map = ContactMap("map_1")
-        contact_file.add(contact_map)
 
-        # Bits ripped from Stefan Seemayer's script shipped with CCMpred
-        mat = np.loadtxt(f_handle)
+        mat = self._read_matrix(f_handle)
         if mat.size > 0:
-            raw_contacts = self._get_contact_pairs(mat)
-            for res1_seq, res2_seq, raw_score in zip(raw_contacts[0], raw_contacts[1], mat[raw_contacts]):
-                if res1_seq > res2_seq:
-                    continue
-                # Matrix starts count at 0 so increment numbers by one straight away
-                contact = Contact(int(res1_seq + 1), int(res2_seq + 1), float(raw_score))
-                contact_map.add(contact)
+            res1_seqs, res2_seqs, raw_scores = self._get_contact_pairs(mat, max_contacts, min_score, min_separation)
+            # Matrix starts count at 0 so increment numbers by one straight away
+            contact_map = ContactMap.from_arrays("map_1", res1_seqs + 1, res2_seqs + 1, raw_scores)
+        else:
+            contact_map = ContactMap("map_1")
+        contact_file.add(contact_map)
 
         return contact_file
 
-    def _get_contact_pairs(self, mat):
-        """Get all contact pairs in the matrix
+    def _read_matrix(self, f_handle):
+        """Read the contact matrix
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+
+        Returns
+        -------
+        :obj:`~numpy.ndarray`
+           A :mod:`numpy` matrix
+
+        """
+        from conkit.io.ext.c_ccmpred import c_read_matrix
+
+        content = f_handle.read()
+        if not isinstance(content, bytes):
+            content = content.encode("ascii", "replace")
+        return c_read_matrix(content)
+
+    def _get_contact_pairs(self, mat, max_contacts=None, min_score=None, min_separation=None):
+        """Get the contact pairs in the upper triangle of the matrix by decreasing score
 
         Parameters
         ----------
         mat : :obj:`~numpy.ndarray`
            A :mod:`numpy` matrix
+        max_contacts : int, optional
+           Keep only the highest scoring contact pairs
+        min_score : float, optional
+           Keep only contact pairs with a score of at least this value
+        min_separation : int, optional
+           Keep only contact pairs at least this far off the diagonal
 
         Returns
         -------
-        list
-           A list of contact pairs
+        tuple
+           The row and column of each contact pair, starting at 0, and its score
 
         """
-        contacts = mat.argsort(axis=None)[::-1]
-        contacts = (contacts % mat.shape[0]).astype(np.uint16), np.floor(contacts / mat.shape[0]).astype(np.uint16)
-        return contacts
+        k = 0 if min_separation is None else min_separation
+        res1_seqs, res2_seqs = np.triu_indices(mat.shape[0], k=k, m=mat.shape[1])
+        raw_scores = mat[res1_seqs, res2_seqs]
+        if min_score is not None:
+            keep = raw_scores >= min_score
+            res1_seqs, res2_seqs, raw_scores = res1_seqs[keep], res2_seqs[keep], raw_scores[keep]
+        if max_contacts is not None and max_contacts < raw_scores.shape[0]:
+            # Select the highest scores first, then sort only those, ties in matrix order
+            order = np.sort(np.argpartition(-raw_scores, max(max_contacts - 1, 0))[: max(max_contacts, 0)])
+            order = order[np.argsort(-raw_scores[order], kind="stable")]
+        else:
+            order = np.argsort(-raw_scores, kind="stable")
+        return res1_seqs[order], res2_seqs[order], raw_scores[order]
 
     def write(self, f_handle, hierarchy):
         """Write a contact file instance to to file
@@ -0,0 +1,69 @@
+#cython: boundscheck=False, wraparound=False
+
+cimport cython
+import numpy as np
+cimport numpy as np
+
+from cpython.ref cimport PyObject
+
+cdef extern from "ctype.h":
+    int isspace(int c) nogil
+
+cdef extern from "Python.h":
+    # Locale-independent, unlike strtod
+    double PyOS_string_to_double(const char* s, char** endptr, PyObject* overflow_exception) except? -1.0
+
+np.import_array()
+
+
+def c_read_matrix(bytes content):
+    """Parse a whitespace-separated text matrix of floating point numbers in a single pass
+
+    Comments start with ``#`` and run to the end of the line, lines without values are skipped.
+
+    """
+    cdef const char* begin = content
+    cdef const char* start = begin
+    cdef const char* end = start + len(content)
+    cdef char* stop
+    cdef Py_ssize_t n = 0
+    cdef Py_ssize_t nrows = 0
+    cdef Py_ssize_t ncols = -1
+    cdef Py_ssize_t row_start = 0
+    cdef Py_ssize_t capacity = 1024
+    values = np.empty(capacity, dtype=np.float64)
+    cdef double[::1] view = values
+    while True:
+        while start < end and start[0] != b'\n' and start[0] != b'#' and isspace(start[0]):
+            start += 1
+        if start < end and start[0] == b'#':
+            while start < end and start[0] != b'\n':
+                start += 1
+        if start == end or start[0] == b'\n':
+            if n > row_start:
+                if ncols == -1:
+                    ncols = n - row_start
+                elif n - row_start != ncols:
+                    raise ValueError(
+                        "All rows of the matrix need to have the same number of columns: "
+                        "row {} has {} instead of {}".format(nrows + 1, n - row_start, ncols)
+                    )
+                nrows += 1
+                row_start = n
+            if start == end:
+                break
+            start += 1
+            continue
+        try:
+            view[n] = PyOS_string_to_double(start, &stop, NULL)
+        except ValueError:
+            stop = <char*> start
+        if stop == start or (stop < end and stop[0] != b'#' and not isspace(stop[0])):
+            raise ValueError("Could not convert string to float: {}".format(content[start - begin:][:32]))
+        n += 1
+        start = stop
+        if n == capacity:
+            capacity *= 2
+            values = np.resize(values, capacity)
+            view = values
+    return values[:n].reshape(nrows, max(ncols, 0))
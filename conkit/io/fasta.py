@@ -68,14 +68,45 @@ class FastaParser(SequenceFileParser):
 
         """
         hierarchy = SequenceFile(f_id)
+        remarks = []
+        for id, seq in FastaParser._iter_records(f_handle, remarks):
+            hierarchy.add(Sequence(id, seq))
+        hierarchy.remark = remarks
+        return hierarchy
 
-        while True:
-            line = f_handle.readline().rstrip()
+    def iter_read(self, f_handle):
+        """Iterate over the sequences of a sequence file one record at a time
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+
+        Yields
+        ------
+        :obj:`~conkit.core.sequence.Sequence`
+
+        Raises
+        ------
+        :exc:`ValueError`
+           FASTA record needs to start with >
+
+        """
+        for id, seq in FastaParser._iter_records(f_handle, []):
+            yield Sequence(id, seq)
 
+    @staticmethod
+    def _iter_records(f_handle, remarks):
+        """Iterate over the identifier and sequence of each record, collecting the remarks before the first record"""
+        while True:
+            line = f_handle.readline()
+            if not line:
+                return
+            line = line.rstrip()
             if not line:
                 continue
             elif line.startswith("#"):
-                hierarchy.remark = line[1:]
+                remarks.append(line[1:])
             elif line.startswith(">"):
                 break
 
@@ -87,24 +118,15 @@ class FastaParser(SequenceFileParser):
 
             chunks = []
             line = f_handle.readline().rstrip()
-            while True:
-                if not line:
-                    break
-                elif line.startswith(">"):
-                    break
+            while line and not line.startswith(">"):
                 chunks.append(line)
                 line = f_handle.readline().rstrip()
-            _seq_string = "".join(chunks)  # Sequence from chunks
-
-            sequence_entry = Sequence(id, _seq_string)
 
-            hierarchy.add(sequence_entry)
+            yield id, "".join(chunks)
 
             if not line:
                 break
 
-        return hierarchy
-
     def write(self, f_handle, hierarchy):
         """Write a sequence file instance to to file
 
@@ -0,0 +1,299 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2016-19, University of Liverpool
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+Parser module specific to the native binary ConKit format
+
+Description
+-----------
+A ConKit file holds either a :obj:`~conkit.core.contactfile.ContactFile` or a
+:obj:`~conkit.core.sequencefile.SequenceFile`. The file starts with the magic string
+``\\x89CONKIT\\n``, the format version and the length of a JSON header, each as little-endian
+unsigned 32-bit integer. The header describes the hierarchy and the location, type and shape
+of each array. All arrays follow the header, each aligned to 64 bytes, so that uncompressed
+arrays can be memory-mapped rather than read.
+
+A :obj:`~conkit.core.contactmap.ContactMap` is stored as one array per attribute of its
+:obj:`~conkit.core.contactstore.ContactStore`, and an alignment as the :math:`N \\times L`
+matrix of ASCII codes of its :obj:`~conkit.core.sequencestore.SequenceStore`.
+
+"""
+
+__author__ = "Felix Simkovic"
+__date__ = "16 Oct 2026"
+__version__ = "0.1"
+
+import io
+import json
+import numpy as np
+import struct
+import zlib
+
+from conkit.io._parser import Parser
+from conkit.core.contactfile import ContactFile
+from conkit.core.contactmap import ContactMap
+from conkit.core.contactstore import COLUMN_NAMES, ContactStore
+from conkit.core.sequence import Sequence
+from conkit.core.sequencefile import SequenceFile
+from conkit.core.sequencestore import SequenceStore
+
+MAGIC = b"\x89CONKIT\n"
+VERSION = 1
+# Magic string, format version and header length
+PREFIX = struct.Struct("<8sII")
+# Alignment of the header and each array in bytes
+ALIGNMENT = 64
+
+
+class ConkitParser(Parser):
+    """Parser class for the native binary ConKit format
+
+    """
+
+    binary = True
+
+    def __init__(self):
+        super(ConkitParser, self).__init__()
+
+    def read(self, f_handle, f_id="conkit", mmap=True):
+        """Read a ConKit file
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions, binary]
+        f_id : str, optional
+           Unique contact or sequence file identifier
+        mmap : bool, optional
+           Memory-map uncompressed arrays instead of reading them [default: True]. Mapped arrays are
+           copy-on-write, so modifications of the returned hierarchy never reach the file. Overwrite
+           a mapped file only through :func:`conkit.io.write` with its file name, which replaces the
+           file rather than truncating it
+
+        Returns
+        -------
+        :obj:`~conkit.core.contactfile.ContactFile`, :obj:`~conkit.core.sequencefile.SequenceFile`
+
+        Raises
+        ------
+        :exc:`ValueError`
+           Not a ConKit file
+        :exc:`ValueError`
+           Unsupported ConKit file version
+
+        """
+        prefix = f_handle.read(PREFIX.size)
+        if len(prefix) != PREFIX.size or prefix[: len(MAGIC)] != MAGIC:
+            raise ValueError("Not a ConKit file")
+        _, version, length = PREFIX.unpack(prefix)
+        if version > VERSION:
+            raise ValueError("Unsupported ConKit file version: {}".format(version))
+        header = json.loads(f_handle.read(length).decode("utf-8"))
+
+        start = self._align(PREFIX.size + length)
+        arrays = {
+            entry["name"]: self._read_array(f_handle, start, entry, header["compression"], mmap)
+            for entry in header["arrays"]
+        }
+        if header["type"] == "ContactFile":
+            return self._read_contact_file(f_id, header["hierarchy"], arrays)
+        return self._read_sequence_file(f_id, header["hierarchy"], arrays)
+
+    def write(self, f_handle, hierarchy, compress=False):
+        """Write a contact or sequence file instance to a ConKit file
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [write permissions, binary]
+        hierarchy : :obj:`~conkit.core.contactfile.ContactFile`, :obj:`~conkit.core.contactmap.ContactMap`,
+                    :obj:`~conkit.core.contact.Contact`, :obj:`~conkit.core.sequencefile.SequenceFile`,
+                    :obj:`~conkit.core.sequence.Sequence`
+        compress : bool, int, optional
+           Compress all arrays with :mod:`zlib` [default: False], either at the fastest level or the given
+           level between 1 and 9. Compressed arrays cannot be memory-mapped
+
+        """
+        hierarchy = self._reconstruct(hierarchy)
+        if isinstance(hierarchy, ContactFile):
+            description, arrays = self._describe_contact_file(hierarchy)
+        else:
+            description, arrays = self._describe_sequence_file(hierarchy)
+
+        entries, buffers, offset = [], [], 0
+        for name, array in arrays:
+            array = np.ascontiguousarray(array)
+            buffer = array.reshape(-1).view(np.uint8)
+            if compress:
+                buffer = zlib.compress(buffer, int(compress))
+            entry = {"name": name, "dtype": array.dtype.str, "shape": list(array.shape)}
+            entry.update({"offset": offset, "nbytes": len(buffer)})
+            entries.append(entry)
+            buffers.append(buffer)
+            offset = self._align(offset + len(buffer))
+
+        header = {
+            "type": "ContactFile" if isinstance(hierarchy, ContactFile) else "SequenceFile",
+            "compression": "zlib" if compress else None,
+            "hierarchy": description,
+            "arrays": entries,
+        }
+        header = json.dumps(header).encode("utf-8")
+        f_handle.write(PREFIX.pack(MAGIC, VERSION, len(header)))
+        f_handle.write(header)
+        position = PREFIX.size + len(header)
+        start = self._align(position)
+        for entry, buffer in zip(entries, buffers):
+            f_handle.write(b"\0" * (start + entry["offset"] - position))
+            f_handle.write(buffer)
+            position = start + entry["offset"] + entry["nbytes"]
+
+    @staticmethod
+    def _align(position):
+        """Round a position up to the next multiple of :data:`ALIGNMENT`"""
+        return -(-position // ALIGNMENT) * ALIGNMENT
+
+    @staticmethod
+    def _read_array(f_handle, start, entry, compression, mmap):
+        """Memory-map or read a single array"""
+        dtype = np.dtype(entry["dtype"])
+        shape = tuple(entry["shape"])
+        position = start + entry["offset"]
+        if mmap and compression is None and entry["nbytes"] > 0:
+            try:
+                f_handle.fileno()
+            except (AttributeError, io.UnsupportedOperation):
+                pass
+            else:
+                return np.asarray(np.memmap(f_handle, dtype=dtype, mode="c", offset=position, shape=shape))
+        f_handle.seek(position)
+        buffer = f_handle.read(entry["nbytes"])
+        if compression == "zlib":
+            buffer = zlib.decompress(buffer)
+        elif compression is not None:
+            raise ValueError("Unsupported ConKit file compression: {}".format(compression))
+        return np.frombuffer(bytearray(buffer), dtype=dtype).reshape(shape)
+
+    @staticmethod
+    def _describe_sequence(sequence):
+        """The JSON description of a :obj:`~conkit.core.sequence.Sequence`"""
+        if sequence is None:
+            return None
+        return {"id": sequence.id, "seq": sequence.seq, "remark": sequence.remark}
+
+    @staticmethod
+    def _sequence(description):
+        """Re-create a :obj:`~conkit.core.sequence.Sequence` from its JSON description"""
+        sequence = Sequence(description["id"], description["seq"])
+        sequence.remark = description["remark"]
+        return sequence
+
+    def _describe_contact_file(self, contact_file):
+        """The JSON description and arrays of a :obj:`~conkit.core.contactfile.ContactFile`"""
+        description = {
+            "author": contact_file.author,
+            "target": contact_file.target,
+            "method": contact_file.method,
+            "remark": contact_file.remark,
+            "maps": [],
+        }
+        arrays = []
+        for i, contact_map in enumerate(contact_file):
+            if contact_map.columnar:
+                store = contact_map._store.take(contact_map._rows)
+            else:
+                store = ContactStore.from_contacts(contact_map)
+            sequence = self._describe_sequence(contact_map.sequence)
+            description["maps"].append({"id": contact_map.id, "sequence": sequence})
+            arrays.extend(("{}/{}".format(i, name), getattr(store, name)) for name in COLUMN_NAMES)
+        return description, arrays
+
+    def _read_contact_file(self, f_id, description, arrays):
+        """Re-create a :obj:`~conkit.core.contactfile.ContactFile` from its JSON description and arrays"""
+        contact_file = ContactFile(f_id)
+        contact_file.author = description["author"]
+        contact_file.target = description["target"]
+        contact_file.method = description["method"]
+        contact_file.remark = description["remark"]
+        for i, map_description in enumerate(description["maps"]):
+            state = {name: arrays["{}/{}".format(i, name)] for name in COLUMN_NAMES}
+            state["size"] = state["res1_seq"].shape[0]
+            state["alive"] = np.ones(state["size"], dtype=np.bool_)
+            store = ContactStore.__new__(ContactStore)
+            store.__setstate__(state)
+            contact_map = ContactMap(map_description["id"])
+            contact_map._attach(store)
+            if map_description["sequence"] is not None:
+                contact_map.sequence = self._sequence(map_description["sequence"])
+            contact_file.add(contact_map)
+        return contact_file
+
+    def _describe_sequence_file(self, sequence_file):
+        """The JSON description and arrays of a :obj:`~conkit.core.sequencefile.SequenceFile`"""
+        description = {"remark": sequence_file.remark}
+        if sequence_file.columnar:
+            store = sequence_file._store.take(sequence_file._rows)
+        elif len(sequence_file) > 0 and sequence_file.is_alignment:
+            store = SequenceStore.from_sequences(sequence_file)
+        else:
+            store = None
+        description["status"] = sequence_file.status
+
+        if store is None:
+            description["ids"] = [sequence.id for sequence in sequence_file]
+            description["remarks"] = {i: s.remark for i, s in enumerate(sequence_file) if s.remark}
+            residues = np.frombuffer("".join(s.seq for s in sequence_file).encode("ascii"), dtype=np.uint8)
+            lengths = np.array([len(s) for s in sequence_file], dtype=np.int64)
+            arrays = [("residues", residues), ("lengths", lengths)]
+        else:
+            description["ids"] = store.ids
+            description["remarks"] = store.remarks
+            arrays = [("matrix", store.matrix)]
+        return description, arrays
+
+    def _read_sequence_file(self, f_id, description, arrays):
+        """Re-create a :obj:`~conkit.core.sequencefile.SequenceFile` from its JSON description and arrays"""
+        sequence_file = SequenceFile(f_id)
+        sequence_file.remark = description["remark"]
+        remarks = {int(row): remark for row, remark in description["remarks"].items()}
+        if "matrix" in arrays:
+            # The matrix was validated when written, so attach it as is
+            ids = [tuple(id) if isinstance(id, list) else id for id in description["ids"]]
+            store = SequenceStore(ids, arrays["matrix"])
+            store.remarks = remarks
+            sequence_file._attach(store)
+        else:
+            residues = arrays["residues"].tobytes().decode("ascii")
+            ends = np.cumsum(arrays["lengths"]).tolist()
+            for row, (id, start, end) in enumerate(zip(description["ids"], [0] + ends, ends)):
+                sequence = Sequence(id, residues[start:end])
+                sequence.remark = remarks.get(row, [])
+                sequence_file.add(sequence)
+        sequence_file.status = description["status"]
+        return sequence_file
@@ -0,0 +1,99 @@
+"""Testing facility for conkit.io.__init__"""
+
+__author__ = "Felix Simkovic"
+__date__ = "16 Oct 2026"
+
+import os
+import unittest
+
+from conkit import io
+from conkit.core.contactmap import ContactMap
+from conkit.io.tests.helpers import ParserTestCase
+
+
+class TestReadWrite(ParserTestCase):
+    def test_read_1(self):
+        f_name = self.tempfile()
+        io.write(f_name, "conkit", ContactMap.from_arrays("1", [1, 2], [8, 9], [0.5, 0.2]))
+        contact_file = io.read(f_name, "conkit", f_id="foo")
+        self.assertEqual("foo", contact_file.id)
+        self.assertEqual([(1, 8), (2, 9)], [c.id for c in contact_file.top_map])
+
+    def test_read_2(self):
+        msa = """>seq1
+AC-D
+>seq2
+ACeD-
+"""
+        f_name_in = self.tempfile(content=msa)
+        f_name_out = self.tempfile()
+        io.convert(f_name_in, "a3m-inserts", f_name_out, "conkit")
+        sequence_file = io.read(f_name_out, "conkit")
+        self.assertTrue(sequence_file.columnar)
+        self.assertEqual(["AC--D", "ACeD-"], [s.seq for s in sequence_file])
+
+    def test_write_1(self):
+        f_name = self.tempfile()
+        io.write(f_name, "conkit", ContactMap.from_arrays("1", [1, 2], [8, 9], [0.5, 0.2]))
+        contact_file = io.read(f_name, "conkit")
+        io.write(f_name, "conkit", contact_file)
+        io.write(f_name, "conkit", ContactMap.from_arrays("2", [3], [7], [0.9]))
+        self.assertEqual([(1, 8), (2, 9)], [c.id for c in contact_file.top_map])
+        self.assertEqual([0.5, 0.2], [c.raw_score for c in contact_file.top_map])
+        contact_file = io.read(f_name, "conkit")
+        self.assertEqual([(3, 7)], [c.id for c in contact_file.top_map])
+
+    def test_write_2(self):
+        msa = """>seq1
+AC-D
+>seq2
+ACED
+"""
+        f_name_in = self.tempfile(content=msa)
+        f_name = self.tempfile()
+        io.convert(f_name_in, "fasta", f_name, "conkit")
+        sequence_file = io.read(f_name, "conkit")
+        io.write(f_name, "conkit", sequence_file)
+        self.assertEqual(["AC-D", "ACED"], [s.seq for s in sequence_file])
+        sequence_file = io.read(f_name, "conkit")
+        self.assertEqual(["AC-D", "ACED"], [s.seq for s in sequence_file])
+        self.assertEqual([os.path.basename(f_name)], [f for f in os.listdir(os.path.dirname(f_name)) if f == os.path.basename(f_name) or f.startswith(".conkit-")])
+
+
+class TestIterRead(ParserTestCase):
+    def test_iter_read_1(self):
+        msa = """>seq1
+GSMFTPKPPQDSAVIKAGYCVKQGAVMKNWKRRYFQLDENTIGYF
+>seq2
+EVHKVQECKQSDIMMRDNLFEIVTTSRTFYVQADSPEEMHSWIKA
+"""
+        f_name = self.tempfile(content=msa)
+        sequences = io.iter_read(f_name, "fasta")
+        self.assertEqual(["seq1", "seq2"], [s.id for s in sequences])
+        with open(f_name, "r") as f_in:
+            self.assertEqual(["seq1", "seq2"], [s.id for s in io.iter_read(f_in, "a3m")])
+
+    def test_iter_read_2(self):
+        msa = """>seq1
+AC-D
+>seq2
+ACeD-
+"""
+        f_name = self.tempfile(content=msa)
+        self.assertEqual(["AC-D", "ACD-"], [s.seq for s in io.iter_read(f_name, "a3m")])
+        self.assertEqual(["AC--D", "ACeD-"], [s.seq for s in io.iter_read(f_name, "a3m-inserts")])
+
+    def test_iter_read_3(self):
+        msa = """AC-D
+ACED
+"""
+        f_name = self.tempfile(content=msa)
+        self.assertEqual(["AC-D", "ACED"], [s.seq for s in io.iter_read(f_name, "jones")])
+        with self.assertRaises(ValueError):
+            io.iter_read(f_name, "foo")
+        with self.assertRaises(ValueError):
+            io.iter_read(f_name, "casprr")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -41,6 +41,12 @@ class TestParserCache(unittest.TestCase):
         c = ParserCache()
         self.assertFalse("casprr" in c.sequence_file_parsers)
 
+    def test_9(self):
+        c = ParserCache()
+        self.assertTrue("conkit" in c)
+        self.assertFalse("conkit" in c.contact_file_parsers)
+        self.assertFalse("conkit" in c.sequence_file_parsers)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
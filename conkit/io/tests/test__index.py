@@ -0,0 +1,105 @@
+"""Testing facility for conkit.io._index"""
+
+__author__ = "Felix Simkovic"
+__date__ = "16 Oct 2026"
+
+import numpy as np
+import os
+import unittest
+
+from conkit import io
+from conkit.io._index import SequenceIndex
+from conkit.io.tests.helpers import ParserTestCase
+
+
+class TestSequenceIndex(ParserTestCase):
+    def index(self, fname, **kwargs):
+        self.addCleanup(lambda: os.path.isfile(fname + ".cki") and os.remove(fname + ".cki"))
+        sequence_index = SequenceIndex(fname, **kwargs)
+        self.addCleanup(sequence_index.close)
+        return sequence_index
+
+    def test_1(self):
+        msa = """#foo
+>seq1 > first
+GSMFTPKPPQDSAVI
+KAGYCVKQ
+>seq2
+EVHKVQECKQSDIMMRDNLFEIVTTSR
+>seq3
+EVHKVQECKQSDIMM"""
+        f_name = self.tempfile(content=msa)
+        sequence_index = self.index(f_name)
+        self.assertTrue(os.path.isfile(f_name + ".cki"))
+        self.assertEqual(3, len(sequence_index))
+        self.assertEqual(["seq1 > first", "seq2", "seq3"], sequence_index.ids)
+        self.assertEqual("GSMFTPKPPQDSAVIKAGYCVKQ", sequence_index[0].seq)
+        self.assertEqual("EVHKVQECKQSDIMMRDNLFEIVTTSR", sequence_index["seq2"].seq)
+        self.assertEqual("EVHKVQECKQSDIMM", sequence_index[-1].seq)
+        self.assertTrue("seq3" in sequence_index)
+        self.assertFalse("seq4" in sequence_index)
+        self.assertEqual(["seq1 > first", "seq2", "seq3"], [s.id for s in sequence_index])
+        self.assertEqual(["seq2", "seq3"], [s.id for s in sequence_index[1:]])
+        with self.assertRaises(IndexError):
+            sequence_index[3]
+        with self.assertRaises(KeyError):
+            sequence_index["seq4"]
+
+    def test_2(self):
+        f_name = self.tempfile(content=">seq1\nAC-D\n>seq2\nACD-\n")
+        sequence_index = self.index(f_name)
+        sequence_index.close()
+        with open(f_name + ".cki", "r") as f_in:
+            self.assertEqual("0\t11\tseq1", f_in.read().split("\n")[1])
+        with open(f_name, "w") as f_out:
+            f_out.write(">foo\nAC-D\n>bar\nACD-\n>baz\nA--D\n")
+        sequence_index = self.index(f_name)
+        self.assertEqual(["foo", "bar", "baz"], sequence_index.ids)
+        self.assertEqual("A--D", sequence_index["baz"].seq)
+
+    def test_3(self):
+        f_name = self.tempfile(content=">seq1\nAC-De\n>seq2\naaCCfDE\n")
+        sequence_index = self.index(f_name, remove_inserts=True)
+        self.assertEqual(["AC-D", "CCDE"], [s.seq for s in sequence_index])
+
+    def test_4(self):
+        f_name = self.tempfile(content="")
+        sequence_index = self.index(f_name)
+        self.assertEqual(0, len(sequence_index))
+        self.assertEqual([], list(sequence_index))
+
+    def test_5(self):
+        f_name = self.tempfile(content=">seq1\nACDE\n")
+        with self.assertRaises(ValueError):
+            io.index(f_name, "a3m-inserts")
+        with io.index(f_name, "a3m", index_fname=self.tempfile()) as sequence_index:
+            self.assertEqual("ACDE", sequence_index["seq1"].seq)
+        self.assertFalse(os.path.isfile(f_name + ".cki"))
+
+    def test_6(self):
+        f_name = self.tempfile(content=">seq1\nACDE\n>seq2\nEDCA\n")
+        sequence_index = self.index(f_name)
+        self.assertEqual("EDCA", sequence_index[np.int64(1)].seq)
+        self.assertEqual("ACDE", sequence_index[np.arange(2)[-2]].seq)
+        with self.assertRaises(IndexError):
+            sequence_index[np.int32(2)]
+        with self.assertRaises(KeyError):
+            sequence_index[True]
+
+    def test_7(self):
+        f_name = self.tempfile(mode="wb", content=b">seq\xff1\nACDE\n")
+        self.addCleanup(lambda: os.path.isfile(f_name + ".cki") and os.remove(f_name + ".cki"))
+        try:
+            SequenceIndex(f_name)
+        except UnicodeDecodeError as e:
+            tb = e.__traceback__
+            while tb.tb_frame.f_code.co_name != "__init__":
+                tb = tb.tb_next
+            sequence_index = tb.tb_frame.f_locals["self"]
+        else:
+            self.fail("UnicodeDecodeError not raised")
+        self.assertTrue(sequence_index._f_handle.closed)
+        self.assertTrue(sequence_index._mmap.closed)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -90,6 +90,19 @@ class Test(ParserTestCase):
         with self.assertRaises(ValueError):
             _iotools.open_f_handle(fname, "bar")
 
+    def test_open_f_handle_7(self):
+        fname = self.tempfile()
+        with _iotools.open_f_handle(fname, "write", binary=True) as fhandle:
+            self.assertEqual("wb", fhandle.mode)
+            fhandle.write(b"hello world!")
+        f_in_handle = _iotools.open_f_handle(fname, "read", binary=True)
+        with _iotools.open_f_handle(f_in_handle, "read", binary=True) as fhandle:
+            self.assertEqual("rb", fhandle.mode)
+            self.assertEqual(b"hello world!", fhandle.read())
+        with open(fname, "r") as fhandle:
+            with self.assertRaises(TypeError):
+                _iotools.open_f_handle(fhandle, "read", binary=True)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
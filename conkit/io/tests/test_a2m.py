@@ -49,6 +49,20 @@ EVHKVQECK--DIMMRDNLFEI--TSRTF--RRY--LDENTIGYF
             with self.assertRaises(ValueError):
                 A2mParser().read(f_in)
 
+    def test_iter_read_1(self):
+        msa = """GSMFTPKPPQDSAVI--GYCVKQGAVMKNWKRRY--LDENTIGYF
+
+EVHK--ECKQSDIMMRD--FEIVTTSRTFYVQADSPEEMHSWIKA
+EVHK--ECKQSDIMMRD--FEIVTTSRTFYVQADSPEEMHSWIK>
+"""
+        f_name = self.tempfile(content=msa)
+        with open(f_name, "r") as f_in:
+            sequences = A2mParser().iter_read(f_in)
+            self.assertEqual("seq_0", next(sequences).id)
+            self.assertEqual("seq_2", next(sequences).id)
+            with self.assertRaises(ValueError):
+                next(sequences)
+
     def test_write_1(self):
         msa = [
             "GSMFTPKPPQDSAVI--GYCVKQGAVMKNWKRRY--LDENTIGYF",
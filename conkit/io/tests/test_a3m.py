@@ -244,6 +244,58 @@ HPNRLWIWEKHVYLDEFRRSWLPVVIKSNEKFQVILRQEDVTLGEAMSPSQLVPYEL
                 self.assertGreater(79, len(sequence_entry.id))
                 self.assertEqual("HPNRLWIWEKHVYLDEFRRSWLPVVIKSNEKFQVILRQEDVTLGEAMSPSQLVPYEL", sequence_entry.seq)
 
+    def test_read_4(self):
+        msa = """>seq1
+AC-De
+>seq2
+aaCCfDE
+>seq3
+A-gD-
+"""
+        f_name = self.tempfile(content=msa)
+        with open(f_name, "r") as f_in:
+            sequence_file = A3mParser().read(f_in, remove_inserts=False)
+        self.assertTrue(sequence_file.columnar)
+        self.assertEqual(["--AC--De", "aaCCfDE-", "--A-gD--"], [s.seq for s in sequence_file])
+        with open(f_name, "r") as f_in:
+            sequence_file = A3mParser().read(f_in, remove_inserts=True)
+        self.assertTrue(sequence_file.columnar)
+        self.assertEqual(["AC-D", "CCDE", "A-D-"], [s.seq for s in sequence_file])
+
+    def test_read_5(self):
+        msa = """>seq1
+AC-D
+>seq2
+ACDEF
+"""
+        f_name = self.tempfile(content=msa)
+        with open(f_name, "r") as f_in:
+            with self.assertRaises(ValueError):
+                A3mParser().read(f_in, remove_inserts=False)
+        with open(f_name, "r") as f_in:
+            sequence_file = A3mParser().read(f_in, remove_inserts=True)
+        self.assertFalse(sequence_file.columnar)
+        self.assertEqual(["AC-D", "ACDEF"], [s.seq for s in sequence_file])
+
+    def test_iter_read_1(self):
+        msa = """#foo
+>d1a1x__ b.1.1.1 (A:1-110)
+PEELVSQFSKVLEVS
+>gi|568841
+PEELVaaSQFSKVLEVS
+>gi|568841
+PEEL-SQFkSKVLEV-
+"""
+        f_name = self.tempfile(content=msa)
+        for remove_inserts in (False, True):
+            with open(f_name, "r") as f_in:
+                expected = [s.seq for s in A3mParser().read(f_in, remove_inserts=remove_inserts)]
+            with open(f_name, "r") as f_in:
+                sequences = list(A3mParser().iter_read(f_in, remove_inserts=remove_inserts))
+            self.assertEqual(expected, [s.seq for s in sequences])
+            self.assertEqual(["d1a1x__ b.1.1.1 (A:1-110)", "gi|568841"], [s.id for s in sequences][:2])
+        self.assertEqual(["gi|568841", "gi|568841"], [s.id for s in sequences][1:])
+
     def test_write_1(self):
         msa = [
             ">d1a1x__ b.63.1.1 (-) p13-MTCP1 {Human (Homo sapiens)}",
@@ -3,6 +3,7 @@
 __author__ = "Felix Simkovic"
 __date__ = "14 Sep 2016"
 
+import locale
 import os
 import sys
 import unittest
@@ -99,6 +100,63 @@ class TestCCMpredParser(ParserTestCase):
             [c.raw_score for c in contact_map1],
         )
 
+    def test_read_2(self):
+        content = """0.0\t0.9\t0.4\t0.8
+0.9\t0.0\t0.7\t0.2
+0.4\t0.7\t0.0\t0.4
+0.8\t0.2\t0.4\t0.0
+"""
+        f_name = self.tempfile(content=content)
+        with open(f_name, "r") as f_in:
+            contact_map = CCMpredParser().read(f_in, max_contacts=3, min_separation=1).top_map
+        self.assertEqual([(1, 2), (1, 4), (2, 3)], [c.id for c in contact_map])
+        self.assertEqual([0.9, 0.8, 0.7], [c.raw_score for c in contact_map])
+        with open(f_name, "r") as f_in:
+            contact_map = CCMpredParser().read(f_in, min_score=0.4, min_separation=2).top_map
+        self.assertEqual([(1, 4), (1, 3)], [c.id for c in contact_map])
+        with open(f_name, "r") as f_in:
+            contact_map = CCMpredParser().read(f_in, min_score=0.3, min_separation=1).top_map
+        self.assertEqual([(1, 2), (1, 4), (2, 3), (1, 3), (3, 4)], [c.id for c in contact_map])
+        with open(f_name, "r") as f_in:
+            contact_map = CCMpredParser().read(f_in, max_contacts=0).top_map
+        self.assertEqual(0, len(contact_map))
+
+    def test_read_3(self):
+        for content in (
+            "0.0\t0.9\n0.9\t0.0\t0.1\n",
+            "0.0\t0.9\n0.9\tfoo\n",
+            "0.0\t0.9\n0.9\t0.0.1\n",
+            "0.0 0.9 0.5\n0.9\n",
+        ):
+            f_name = self.tempfile(content=content)
+            with open(f_name, "r") as f_in:
+                with self.assertRaises(ValueError):
+                    CCMpredParser().read(f_in)
+
+    def test_read_4(self):
+        content = "# comment\n0.0 0.9 # trailing\n\n0.9 0.0\n#\n"
+        f_name = self.tempfile(content=content)
+        with open(f_name, "r") as f_in:
+            contact_map = CCMpredParser().read(f_in, min_separation=1).top_map
+        self.assertEqual([(1, 2)], [c.id for c in contact_map])
+        self.assertEqual([0.9], [c.raw_score for c in contact_map])
+
+    def test_read_5(self):
+        current = locale.setlocale(locale.LC_NUMERIC)
+        for name in ("de_DE.UTF-8", "de_DE.utf8", "fr_FR.UTF-8", "fr_FR.utf8"):
+            try:
+                locale.setlocale(locale.LC_NUMERIC, name)
+                break
+            except locale.Error:
+                continue
+        else:
+            self.skipTest("No comma-decimal locale available")
+        self.addCleanup(locale.setlocale, locale.LC_NUMERIC, current)
+        f_name = self.tempfile(content="0.0 0.9\n0.9 0.0\n")
+        with open(f_name, "r") as f_in:
+            contact_map = CCMpredParser().read(f_in, min_separation=1).top_map
+        self.assertEqual([0.9], [c.raw_score for c in contact_map])
+
     def test_write_1(self):
         contact_file = ContactFile("test")
         contact_map = ContactMap("1")
@@ -3,6 +3,7 @@
 __author__ = "Felix Simkovic"
 __date__ = "09 Sep 2016"
 
+import io
 import os
 import unittest
 
@@ -70,6 +71,36 @@ EVHKVQECKQSDIMMRDNLFEIVTTSRTFWKRRYFQLDENTIGYF
                 self.assertEqual("seq3", sequence_entry.id)
                 self.assertEqual("EVHKVQECKQSDIMMRDNLFEIVTTSRTFWKRRYFQLDENTIGYF", sequence_entry.seq)
 
+    def test_read_4(self):
+        f_name = self.tempfile(content="")
+        with open(f_name, "r") as f_in:
+            sequence_file = FastaParser().read(f_in)
+        self.assertEqual(0, len(sequence_file))
+
+    def test_iter_read_1(self):
+        msa = """#foo
+>seq1
+GSMFTPKPPQDSAVIKAGYCVKQGAVMKNWKRRYFQLDENTIGYF
+>seq2
+EVHKVQECKQSDIMMRDNLFEIVTTSR
+TFYVQADSPEEMHSWIKA
+>seq3
+EVHKVQECKQSDIMMRDNLFEIVTTSRTFWKRRYFQLDENTIGYF
+"""
+        f_handle = io.StringIO(msa)
+        sequences = FastaParser().iter_read(f_handle)
+        sequence_entry = next(sequences)
+        self.assertEqual("seq1", sequence_entry.id)
+        self.assertEqual("GSMFTPKPPQDSAVIKAGYCVKQGAVMKNWKRRYFQLDENTIGYF", sequence_entry.seq)
+        self.assertLess(f_handle.tell(), len(msa))
+        self.assertEqual(
+            [
+                ("seq2", "EVHKVQECKQSDIMMRDNLFEIVTTSRTFYVQADSPEEMHSWIKA"),
+                ("seq3", "EVHKVQECKQSDIMMRDNLFEIVTTSRTFWKRRYFQLDENTIGYF"),
+            ],
+            [(s.id, s.seq) for s in sequences],
+        )
+
     def test_write_1(self):
         seq = [
             ">00FAF_A|<unknown description>",
@@ -0,0 +1,120 @@
+"""Testing facility for conkit.io.ConkitParser"""
+
+__author__ = "Felix Simkovic"
+__date__ = "16 Oct 2026"
+
+import io
+import numpy as np
+import unittest
+
+from conkit.core.contact import Contact
+from conkit.core.contactfile import ContactFile
+from conkit.core.contactmap import ContactMap
+from conkit.core.sequence import Sequence
+from conkit.core.sequencefile import SequenceFile
+from conkit.io.native import ConkitParser
+from conkit.io.tests.helpers import ParserTestCase
+
+
+class TestConkitParser(ParserTestCase):
+    def _contact_file(self):
+        contact_file = ContactFile("RR")
+        contact_file.author = "John Doe"
+        contact_file.method = ["Foo", "Bar"]
+        contact_file.remark = "Hello World"
+        contact_map = ContactMap.from_arrays("1", [1, 1, 5], [9, 10, 20], [0.7, 0.2, 0.4], res1_chain=["A", "A", "B"])
+        contact_map.sequence = Sequence("seq", "ACDEFGHIKLMNPQRSTVWY")
+        contact_file.add(contact_map)
+        contact_map = ContactMap("2")
+        contact = Contact(2, 8, 0.5, distance_bound=(0, 6))
+        contact.true_positive = True
+        contact_map.add(contact)
+        contact_file.add(contact_map)
+        return contact_file
+
+    def test_read_1(self):
+        f_name = self.tempfile(mode="wb")
+        with open(f_name, "wb") as f_out:
+            ConkitParser().write(f_out, self._contact_file())
+        for mmap in (True, False):
+            with open(f_name, "rb") as f_in:
+                contact_file = ConkitParser().read(f_in, f_id="conkit", mmap=mmap)
+            self.assertEqual("conkit", contact_file.id)
+            self.assertEqual("John Doe", contact_file.author)
+            self.assertEqual(["Foo", "Bar"], contact_file.method)
+            self.assertEqual(["Hello World"], contact_file.remark)
+            self.assertEqual(["1", "2"], [m.id for m in contact_file])
+            contact_map = contact_file["1"]
+            self.assertTrue(contact_map.columnar)
+            self.assertEqual("ACDEFGHIKLMNPQRSTVWY", contact_map.sequence.seq)
+            self.assertEqual([(1, 9), (1, 10), (5, 20)], [c.id for c in contact_map])
+            self.assertEqual([0.7, 0.2, 0.4], [c.raw_score for c in contact_map])
+            self.assertEqual(["A", "A", "B"], [c.res1_chain for c in contact_map])
+            contact_map = contact_file["2"]
+            self.assertIsNone(contact_map.sequence)
+            self.assertEqual([(2, 8)], [c.id for c in contact_map])
+            self.assertTrue(contact_map.top_contact.true_positive)
+            self.assertEqual((0, 6), contact_map.top_contact.distance_bound)
+
+    def test_read_2(self):
+        f_name = self.tempfile(mode="wb")
+        with open(f_name, "wb") as f_out:
+            ConkitParser().write(f_out, self._contact_file())
+        with open(f_name, "rb") as f_in:
+            contact_file = ConkitParser().read(f_in)
+        contact_file.top_map.top_contact.raw_score = 1.0
+        contact_file.top_map.remove((1, 10))
+        with open(f_name, "rb") as f_in:
+            contact_file = ConkitParser().read(f_in)
+        self.assertEqual(0.7, contact_file.top_map.top_contact.raw_score)
+        self.assertEqual(3, len(contact_file.top_map))
+
+    def test_read_3(self):
+        sequence_file = SequenceFile.from_matrix("aln", ["foo", ("bar", "baz")], np.frombuffer(b"AC-DACED", dtype=np.uint8).reshape(2, 4))
+        sequence_file.remark = "Hello World"
+        sequence_file.top.remark = "first"
+        f_handle = io.BytesIO()
+        ConkitParser().write(f_handle, sequence_file, compress=True)
+        f_handle.seek(0)
+        sequence_file = ConkitParser().read(f_handle)
+        self.assertTrue(sequence_file.columnar)
+        self.assertEqual(["Hello World"], sequence_file.remark)
+        self.assertEqual(["foo", ("bar", "baz")], [s.id for s in sequence_file])
+        self.assertEqual(["AC-D", "ACED"], [s.seq for s in sequence_file])
+        self.assertEqual(["first"], sequence_file["foo"].remark)
+        self.assertEqual("ACED", sequence_file[("bar", "baz")].seq)
+
+    def test_read_4(self):
+        sequence_file = SequenceFile("seq")
+        sequence_file.add(Sequence("foo", "ACDE"))
+        sequence_file.add(Sequence("bar", "AC"))
+        sequence_file.add(Sequence("baz", ""))
+        sequence_file.top.remark = "first"
+        f_name = self.tempfile(mode="wb")
+        with open(f_name, "wb") as f_out:
+            ConkitParser().write(f_out, sequence_file)
+        with open(f_name, "rb") as f_in:
+            sequence_file = ConkitParser().read(f_in)
+        self.assertFalse(sequence_file.columnar)
+        self.assertEqual(1, sequence_file.status)
+        self.assertEqual([("foo", "ACDE"), ("bar", "AC"), ("baz", "")], [(s.id, s.seq) for s in sequence_file])
+        self.assertEqual(["first"], sequence_file.top.remark)
+
+    def test_read_5(self):
+        f_name = self.tempfile(content="foo bar baz")
+        with open(f_name, "rb") as f_in:
+            with self.assertRaises(ValueError):
+                ConkitParser().read(f_in)
+
+    def test_write_1(self):
+        sequence_file = SequenceFile.from_matrix("aln", ["foo", "bar"], np.frombuffer(b"AC-DACED", dtype=np.uint8).reshape(2, 4))
+        f_handle = io.BytesIO()
+        ConkitParser().write(f_handle, sequence_file[1])
+        content = f_handle.getvalue()
+        self.assertTrue(content.startswith(b"\x89CONKIT\n\x01\x00\x00\x00"))
+        self.assertEqual(0, (len(content) - 4) % 64)
+        self.assertTrue(content.endswith(b"ACED"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
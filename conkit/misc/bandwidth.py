@@ -43,7 +43,13 @@ ABC = abc.ABCMeta("ABC", (object,), {})
 
 
 class BandwidthBase(ABC):
-    """Abstract class for bandwidth calculations"""
+    """Abstract class for bandwidth calculations
+
+    Every estimator accepts optional integer ``weights``, one per row of the data, to
+    count each row as that many observations. This allows binned data to be passed
+    instead of repeating every value.
+
+    """
 
     @abc.abstractproperty
     def bandwidth(self):
@@ -53,6 +59,43 @@ class BandwidthBase(ABC):
     def bw(self):
         return self.bandwidth
 
+    @property
+    def _nobs(self):
+        """The number of observations"""
+        if self._weights is None:
+            return self._data.shape[0]
+        return self._weights.sum()
+
+    def _sum(self, values):
+        """The sum of per-row values over all observations"""
+        if self._weights is None:
+            return values.sum()
+        return (self._weights[:, np.newaxis] * values).sum()
+
+    def _sigma(self):
+        """The smaller of the standard deviation and the normalized interquartile range"""
+        data = self._data
+        if self._weights is None:
+            std = np.std(data, axis=0, ddof=1)
+            iqr = np.percentile(data, 75) - np.percentile(data, 25)
+        else:
+            weights = self._weights[:, np.newaxis]
+            mean = (weights * data).sum(axis=0) / self._nobs
+            std = np.sqrt((weights * (data - mean) ** 2).sum(axis=0) / (self._nobs - 1))
+            iqr = self._percentile(75) - self._percentile(25)
+        return np.minimum(std, iqr / 1.349)[0]
+
+    def _percentile(self, q):
+        """The ``q``-th percentile of all weighted values with linear interpolation"""
+        values = self._data.ravel()
+        weights = np.repeat(self._weights, self._data.shape[1])
+        order = np.argsort(values, kind="stable")
+        values, cumulative = values[order], np.cumsum(weights[order])
+        rank = q / 100.0 * (cumulative[-1] - 1)
+        lower = values[np.searchsorted(cumulative, np.floor(rank), side="right")]
+        upper = values[np.searchsorted(cumulative, np.ceil(rank), side="right")]
+        return lower + (rank - np.floor(rank)) * (upper - lower)
+
 
 class AmiseBW(BandwidthBase):
     """Asymptotic Mean Integrated Squared Error (AMISE)
@@ -64,9 +107,10 @@ class AmiseBW(BandwidthBase):
 
     """
 
-    def __init__(self, data, niterations=25, eps=1e-3):
+    def __init__(self, data, niterations=25, eps=1e-3, weights=None):
         """Instantiate a new bandwith calculator"""
         self._data = np.asarray(data)
+        self._weights = None if weights is None else np.asarray(weights, dtype=np.float64)
         self._niterations = niterations
         self._eps = eps
 
@@ -74,14 +118,14 @@ class AmiseBW(BandwidthBase):
     def bandwidth(self):
         from conkit.misc.ext.c_bandwidth import c_optimize_bandwidth
 
-        data = self._data
-        x0 = BowmanBW(data).bandwidth
-        y0 = c_optimize_bandwidth(data, x0)
+        data, weights = self._data, self._weights
+        x0 = BowmanBW(data, weights=weights).bandwidth
+        y0 = c_optimize_bandwidth(data, x0, weights)
         x = 0.8 * x0
-        y = c_optimize_bandwidth(data, x)
+        y = c_optimize_bandwidth(data, x, weights)
         for _ in range(self._niterations):
             x -= y * (x0 - x) / (y0 - y)
-            y = c_optimize_bandwidth(data, x)
+            y = c_optimize_bandwidth(data, x, weights)
             if abs(y) < (self._eps * y0):
                 break
         return x
@@ -98,15 +142,17 @@ class BowmanBW(BandwidthBase):
 
     """
 
-    def __init__(self, data):
+    def __init__(self, data, weights=None):
         """Instantiate a new bandwith calculator"""
         self._data = np.asarray(data)
+        self._weights = None if weights is None else np.asarray(weights, dtype=np.float64)
 
     @property
     def bandwidth(self):
         data = self._data
-        M, N = data.shape
-        return np.sqrt((data ** 2).sum() / M - (data.sum() / M) ** 2) * ((((N + 2) * M) / 4.0) ** (-1.0 / (N + 4)))
+        M, N = self._nobs, data.shape[1]
+        variance = self._sum(data ** 2) / M - (self._sum(data) / M) ** 2
+        return np.sqrt(variance) * ((((N + 2) * M) / 4.0) ** (-1.0 / (N + 4)))
 
 
 class LinearBW(BandwidthBase):
@@ -120,8 +166,9 @@ class LinearBW(BandwidthBase):
 
     """
 
-    def __init__(self, data, threshold=15):
+    def __init__(self, data, threshold=15, weights=None):
         self._data = np.asarray(data)
+        self._weights = None if weights is None else np.asarray(weights, dtype=np.float64)
         self._threshold = threshold
 
     @property
@@ -140,16 +187,15 @@ class ScottBW(BandwidthBase):
 
     """
 
-    def __init__(self, data):
+    def __init__(self, data, weights=None):
         """Instantiate a new bandwith calculator"""
         self._data = np.asarray(data)
+        self._weights = None if weights is None else np.asarray(weights, dtype=np.float64)
 
     @property
     def bandwidth(self):
-        data = self._data
-        M, N = data.shape
-        sigma = np.minimum(np.std(data, axis=0, ddof=1), (np.percentile(data, 75) - np.percentile(data, 25)) / 1.349)[0]
-        return 1.059 * sigma * M ** (-1.0 / (N + 4))
+        M, N = self._nobs, self._data.shape[1]
+        return 1.059 * self._sigma() * M ** (-1.0 / (N + 4))
 
 
 class SilvermanBW(BandwidthBase):
@@ -163,16 +209,15 @@ class SilvermanBW(BandwidthBase):
 
     """
 
-    def __init__(self, data):
+    def __init__(self, data, weights=None):
         """Instantiate a new bandwith calculator"""
         self._data = np.asarray(data)
+        self._weights = None if weights is None else np.asarray(weights, dtype=np.float64)
 
     @property
     def bandwidth(self):
-        data = self._data
-        M, N = data.shape
-        sigma = np.minimum(np.std(data, axis=0, ddof=1), (np.percentile(data, 75) - np.percentile(data, 25)) / 1.349)[0]
-        return 0.9 * sigma * (M * (N + 2) / 4.0) ** (-1.0 / (N + 4))
+        M, N = self._nobs, self._data.shape[1]
+        return 0.9 * self._sigma() * (M * (N + 2) / 4.0) ** (-1.0 / (N + 4))
 
 
 def bandwidth_factory(method):
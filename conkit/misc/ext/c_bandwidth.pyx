@@ -12,25 +12,33 @@ cdef double SQRT_PI = sqrt(M_PI)
 cdef double SQRT_2PI = sqrt(2.0 * M_PI)
 
 
-def c_optimize_bandwidth(np.ndarray[np.int64_t, ndim=2] A, double v):
+def _as_weights(A, weights):
+    if weights is None:
+        return np.ones(A.shape[0], dtype=np.float64)
+    return np.ascontiguousarray(weights, dtype=np.float64)
+
+
+def c_optimize_bandwidth(np.ndarray[np.int64_t, ndim=2] A, double v, weights=None):
     cdef double alpha, sigma, integral
+    weights = _as_weights(A, weights)
     alpha = 1.0 / (2.0 * SQRT_PI)
     sigma = 1.0
-    integral = c_get_stiffness_integral(A, v, 0.0001)
-    return v - ((A.shape[0] * integral * sigma**4) / alpha)**(-1.0 / (A.shape[1] + 4))
+    integral = c_get_stiffness_integral(A, v, 0.0001, weights)
+    return v - ((weights.sum() * integral * sigma**4) / alpha)**(-1.0 / (A.shape[1] + 4))
 
 
-def c_get_stiffness_integral(np.ndarray[np.int64_t, ndim=2] A, double v, double eps):
+def c_get_stiffness_integral(np.ndarray[np.int64_t, ndim=2] A, double v, double eps, weights=None):
     cdef Py_ssize_t i, j, n
     cdef double min_, max_, dx, maxn, yy, y1, y2, y3, y
+    weights = _as_weights(A, weights)
     min_ = A.min() - v * 3
     max_ = A.max() + v * 3
     dx = 1.0 * (max_ - min_)
     maxn = dx / sqrt(eps)
     if maxn > 2048:
         maxn = 2048
-    y1 = c_get_gauss_curvature(A, min_, v)
-    y2 = c_get_gauss_curvature(A, max_, v)
+    y1 = c_get_gauss_curvature(A, min_, v, weights)
+    y2 = c_get_gauss_curvature(A, max_, v, weights)
     yy = 0.5 * dx * (y1 * y1 + y2 * y2)
     n = 2
     
@@ -38,7 +46,7 @@ def c_get_stiffness_integral(np.ndarray[np.int64_t, ndim=2] A, double v, double
         dx /= 2.0
         y = 0.0
         for i in xrange(1, n, 2):
-            y3 = c_get_gauss_curvature(A, min_ + i * dx, v)
+            y3 = c_get_gauss_curvature(A, min_ + i * dx, v, weights)
             y += (y3 * y3)
         yy = 0.5 * yy + y * dx
         if n > 8 and fabs(y * dx - 0.5 * yy) < eps * yy:
@@ -48,9 +56,10 @@ def c_get_stiffness_integral(np.ndarray[np.int64_t, ndim=2] A, double v, double
     return yy
 
 
-def c_get_gauss_curvature(np.ndarray[np.int64_t, ndim=2] A, double x, double w):
+def c_get_gauss_curvature(np.ndarray[np.int64_t, ndim=2] A, double x, double w, weights=None):
     cdef Py_ssize_t i, j
     cdef double w_sq, w_sqrt_2pi, curvature, z
+    cdef np.ndarray[double, ndim=1] W = _as_weights(A, weights)
     w_sq = w*w
     w_sqrt_2pi = w * SQRT_2PI
     curvature = 0.0
@@ -58,5 +67,5 @@ def c_get_gauss_curvature(np.ndarray[np.int64_t, ndim=2] A, double x, double w):
         for j in xrange(A.shape[1]):
             z = (x - A[i, j]) / w
             z *= z
-            curvature += (A.shape[1] * (z - 1.0) * (exp(-0.5 * z) / w_sqrt_2pi) / w_sq)
-    return curvature / A.shape[0]
+            curvature += W[i] * (A.shape[1] * (z - 1.0) * (exp(-0.5 * z) / w_sqrt_2pi) / w_sq)
+    return curvature / W.sum()
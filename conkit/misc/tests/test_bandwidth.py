@@ -132,6 +132,15 @@ class Test(unittest.TestCase):
         with self.assertRaises(ValueError):
             bandwidth.bandwidth_factory("garbage")
 
+    def test_weights_1(self):
+        x = np.array([1, 2, 2, 3, 3, 3, 4, 5, 5, 9], dtype=np.int64)[:, np.newaxis]
+        values, counts = np.unique(x, return_counts=True)
+        for method in ["amise", "bowman", "linear", "scott", "silverman"]:
+            estimator = bandwidth.bandwidth_factory(method)
+            expected = estimator(x).bandwidth
+            weighted = estimator(values[:, np.newaxis], weights=counts).bandwidth
+            self.assertAlmostEqual(expected, weighted)
+
 
 class TestExt(unittest.TestCase):
     def test_gauss_curvature_1(self):
@@ -174,6 +183,12 @@ class TestExt(unittest.TestCase):
         optimized = c_bandwidth.c_optimize_bandwidth(A, 1000.0)
         self.assertAlmostEqual(317.11331138268406, optimized)
 
+    def test_gauss_curvature_4(self):
+        A = np.array([[1], [2], [3], [4], [5], [3], [2], [3], [4]], dtype=np.int64)
+        weights = np.array([1, 2, 3, 2, 1], dtype=np.float64)
+        curvature = c_bandwidth.c_get_gauss_curvature(A[:5], -1.5, 0.5, weights)
+        self.assertAlmostEqual(c_bandwidth.c_get_gauss_curvature(A, -1.5, 0.5), curvature)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -111,7 +111,8 @@ class SequenceCoverageFigure(Figure):
 
     def draw(self):
         residues = np.arange(1, self._hierarchy.top_sequence.seq_len + 1)
-        aa_counts = (np.asarray(self._hierarchy.get_frequency("X")) - self._hierarchy.nseq) * (-1)
+        # All but the last profile column count amino acids, the last one gaps and unknown residues
+        aa_counts = self._hierarchy.get_profile()[:, :-1].sum(axis=1)
 
         self.ax.plot(
             residues,
@@ -64,7 +64,7 @@ def all_modules_importable(modules):
     return True
 
 
-assert all_modules_importable(['sphinx_bootstrap_theme', 'conkit', 'matplotlib', 'sklearn.neighbors'])
+assert all_modules_importable(['sphinx_bootstrap_theme', 'conkit', 'matplotlib'])
 import sphinx_bootstrap_theme
 import conkit
 
@@ -69,7 +69,12 @@ def dependencies():
 
 
 def extensions():
-    exts = ["conkit/core/ext/c_contactmap.pyx", "conkit/core/ext/c_sequencefile.pyx", "conkit/misc/ext/c_bandwidth.pyx"]
+    exts = [
+        'conkit/core/ext/c_contactmap.pyx',
+        'conkit/core/ext/c_sequencefile.pyx',
+        'conkit/io/ext/c_ccmpred.pyx',
+        'conkit/misc/ext/c_bandwidth.pyx',
+    ]
     extensions = []
     for ext in exts:
         extensions.append(
@@ -164,6 +169,7 @@ PACKAGES = [
     'conkit/core',
     'conkit/core/ext',
     'conkit/io',
+    'conkit/io/ext',
     'conkit/misc',
     'conkit/misc/ext',
     'conkit/plot',